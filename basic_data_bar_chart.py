@@ -3,7 +3,9 @@ import json
 import pandas as pd
 from dotenv import load_dotenv
 from answer_rocket import AnswerRocketClient
-from skill_framework import skill, SkillParameter, SkillInput, SkillOutput, SkillVisualization, ExportData, ExitFromSkillException
+from skill_framework import skill, SkillParameter, SkillInput, SkillOutput, SkillVisualization, ExitFromSkillException
+from builder_utils.phase_timing import phase
+from builder_utils.shared_frame import SharedFrame, dumps_layout
 
 @skill(
     name="basic_data_bar_chart",
@@ -48,7 +50,8 @@ def basic_data_bar_chart(skill_input: SkillInput) -> SkillOutput:
         limit = int(skill_input.arguments.limit)
         
         # Get data
-        data = get_chart_data(dimension, metrics, limit)
+        with phase("fetch"):
+            data = get_chart_data(dimension, metrics, limit)
         
         if data is None or data.empty:
             raise ExitFromSkillException(
@@ -56,15 +59,15 @@ def basic_data_bar_chart(skill_input: SkillInput) -> SkillOutput:
                 "No data available for your selection. Please try different parameters."
             )
         
-        # Create visualization
-        visualization = create_bar_chart(data, dimension, metrics)
-        
-        # Create export data
+        # Share one frame between the chart and the export
+        shared = SharedFrame(data)
         metrics_str = "_".join(metrics)
-        export_data = ExportData(
-            data=data,
-            name=f"{dimension}_by_{metrics_str}"
-        )
+        with phase("export"):
+            export_data = shared.export(name=f"{dimension}_by_{metrics_str}")
+        
+        # Create visualization
+        with phase("layout"):
+            visualization = create_bar_chart(shared, dimension, metrics)
         
         # Create final prompt
         if len(metrics) == 1:
@@ -141,16 +144,18 @@ def get_chart_data(dimension: str, metrics: list, limit: int) -> pd.DataFrame:
     except Exception as e:
         raise Exception(f"Database access failed: {str(e)}")
 
-def create_bar_chart(data: pd.DataFrame, dimension: str, metrics: list) -> SkillVisualization:
+def create_bar_chart(shared: SharedFrame, dimension: str, metrics: list) -> SkillVisualization:
     """Creates a bar chart visualization using dynamic-layout framework"""
     
-    # Prepare data for Highcharts
-    categories = data.iloc[:, 0].tolist()  # First column (dimension values)
+    data = shared.frame
+    
+    # Prepare data for Highcharts, serialized straight from the column buffers
+    categories = shared.column_json(0)  # First column (dimension values)
     
     # Create series data for each metric
     series_data = []
     for i, metric in enumerate(metrics):
-        metric_values = data.iloc[:, i + 1].tolist()  # Column i+1 for metric i
+        metric_values = shared.column_json(i + 1)  # Column i+1 for metric i
         series_data.append({
             "name": format_metric_name(metric),
             "data": metric_values,
@@ -229,7 +234,7 @@ def create_bar_chart(data: pd.DataFrame, dimension: str, metrics: list) -> Skill
     
     return SkillVisualization(
         title="Bar Chart",
-        layout=json.dumps(layout)
+        layout=dumps_layout(layout)
     )
 
 def format_dimension_name(dimension: str) -> str:
@@ -0,0 +1,87 @@
+"""
+Background Export
+ExportData that can encode itself on a worker thread once a consumer asks for the encoded form
+"""
+
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+from pydantic import PrivateAttr
+from skill_framework import ExportData
+
+from builder_utils.export_encoders import EncodedExport, choose_format, encode_export
+
+EXPORT_WORKERS = 2
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class _Encoding:
+    """The encode job of one export; copies and unpickled exports start without one"""
+
+    def __init__(self):
+        self.future: Optional[Future] = None
+        self.lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        return _Encoding()
+
+    def __reduce__(self):
+        return (_Encoding, ())
+
+
+class BackgroundExport(ExportData):
+    """
+    An ExportData that can produce its encoded form on a worker thread.
+
+    Nothing is encoded until start() or wait() is called, so an export nobody asks to encode
+    costs nothing. A consumer that will need the encoded bytes (e.g. a file writer) can call
+    start() as soon as the DataFrame is ready and before the layout is built; the encoder then
+    runs while the skill wires its visualizations. `data` is left untouched, so the object is a
+    drop-in ExportData. The encoder only reads the frame, so it must not be mutated afterwards.
+    """
+
+    _format: Any = PrivateAttr(default=None)
+    _encoding: Any = PrivateAttr(default_factory=_Encoding)
+
+    def __init__(self, name: str, data: Any, format: Optional[str] = None):
+        super().__init__(name=name, data=data)
+        self._format = format or choose_format(data)
+
+    @property
+    def format(self) -> str:
+        return self._format
+
+    @property
+    def started(self) -> bool:
+        """Whether encoding has been requested"""
+        return self._encoding.future is not None
+
+    @property
+    def done(self) -> bool:
+        """Whether encoding has finished (successfully or not)"""
+        return self.started and self._encoding.future.done()
+
+    def start(self) -> Future:
+        """Submit the encode to the worker pool, once; returns its future"""
+        encoding = self._encoding
+        with encoding.lock:
+            if encoding.future is None:
+                encoding.future = _get_executor().submit(encode_export, self, self._format)
+        return encoding.future
+
+    def wait(self, timeout: Optional[float] = None) -> EncodedExport:
+        """Start encoding if needed, block until it finishes and return the result; encoder errors are re-raised here"""
+        return self.start().result(timeout=timeout)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=EXPORT_WORKERS, thread_name_prefix="export-encoder")
+            atexit.register(_executor.shutdown, wait=False)
+    return _executor
@@ -0,0 +1,177 @@
+"""
+Batch Runner
+Run many (skill, parameters) jobs from a JSONL file on a process pool, streaming results as JSONL
+"""
+
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Iterable, List, Optional
+
+WARM_MODULES = ("pandas", "numpy", "skill_framework", "answer_rocket")
+
+# Skill functions already loaded in this process, by skill name
+_skill_functions = {}
+
+
+@dataclass
+class BatchJob:
+    """One line of a jobs file"""
+    id: str
+    skill: str
+    parameters: dict = field(default_factory=dict)
+
+
+@dataclass
+class BatchSummary:
+    """Totals for a finished batch"""
+    total: int
+    succeeded: int
+    failed: int
+    wall_seconds: float
+    job_seconds: float
+    results_path: str
+
+    @property
+    def speedup(self) -> float:
+        """Sum of job latencies over wall time (how much the pool overlapped work)"""
+        return self.job_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+
+def load_jobs(path: str) -> List[BatchJob]:
+    """
+    Read a jobs file: one JSON object per line with "skill" (or "skill_name"), optional
+    "parameters" and optional "id". Blank lines and lines starting with # are skipped.
+    """
+    jobs = []
+    with open(path, encoding="utf-8") as jobs_file:
+        for line_number, line in enumerate(jobs_file, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e})")
+            skill = record.get("skill") or record.get("skill_name")
+            if not skill:
+                raise ValueError(f"{path}:{line_number}: job has no 'skill'")
+            jobs.append(BatchJob(
+                id=str(record.get("id", f"{line_number}:{skill}")),
+                skill=skill,
+                parameters=record.get("parameters") or {},
+            ))
+    return jobs
+
+
+def run_job(job: BatchJob) -> dict:
+    """Run one job and describe the outcome (runs inside a worker process)"""
+    from builder_utils.output_sizes import output_totals
+    from builder_utils.phase_timing import PhaseTimer
+    from builder_utils.run_skill import run_skill
+
+    record = {"id": job.id, "skill": job.skill, "parameters": job.parameters, "pid": os.getpid()}
+    start = time.perf_counter()
+    try:
+        # The skill module is executed once per worker, outside the job's latency
+        skill_function = _load_skill_function(job.skill)
+        start = time.perf_counter()
+        # With a timer, lazy layouts and started background exports finish inside the latency
+        result = run_skill(job.skill, job.parameters, skill_function=skill_function, timer=PhaseTimer())
+        record["seconds"] = time.perf_counter() - start
+        record["status"] = "ok"
+        record.update(output_totals(result))
+    except Exception as e:
+        record["seconds"] = time.perf_counter() - start
+        record["status"] = "error"
+        record["error"] = str(e)
+        record["traceback"] = traceback.format_exc(limit=5)
+    return record
+
+
+def _load_skill_function(skill_name: str):
+    """The registered skill function, loaded once per process (None leaves the lookup to run_skill)"""
+    from builder_utils.skill_registry import SkillRegistry
+
+    if skill_name not in _skill_functions:
+        _skill_functions[skill_name] = SkillRegistry().load_function(skill_name)
+    return _skill_functions[skill_name]
+
+
+def run_batch(jobs: Iterable[BatchJob], results_path: str, workers: Optional[int] = None, verbose: bool = True) -> BatchSummary:
+    """
+    Run jobs on a process pool and append one JSON line per job to results_path as it finishes
+
+    Args:
+        jobs: Jobs to run
+        results_path: JSONL file to write (overwritten)
+        workers: Worker processes (default: CPU count); 1 runs the jobs in this process
+        verbose: Print a line per finished job
+
+    Returns:
+        BatchSummary with counts and timings
+    """
+    jobs = list(jobs)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    succeeded = failed = 0
+    job_seconds = 0.0
+    start = time.perf_counter()
+
+    with open(results_path, "w", encoding="utf-8") as results_file:
+        for done, record in enumerate(_iter_results(jobs, workers), 1):
+            results_file.write(json.dumps(record, default=str) + "\n")
+            results_file.flush()
+
+            job_seconds += record["seconds"]
+            if record["status"] == "ok":
+                succeeded += 1
+            else:
+                failed += 1
+            if verbose:
+                marker = "✅" if record["status"] == "ok" else "❌"
+                detail = f"{record.get('layout_bytes', 0):,} layout bytes" if record["status"] == "ok" else record["error"]
+                print(f"{marker} [{done}/{len(jobs)}] {record['id']} ({record['seconds']:.2f}s) - {detail}")
+
+    return BatchSummary(
+        total=len(jobs),
+        succeeded=succeeded,
+        failed=failed,
+        wall_seconds=time.perf_counter() - start,
+        job_seconds=job_seconds,
+        results_path=results_path,
+    )
+
+
+def print_batch_summary(summary: BatchSummary):
+    print(f"\n📋 Batch: {summary.succeeded}/{summary.total} succeeded, {summary.failed} failed")
+    print(f"   Wall time: {summary.wall_seconds:.2f}s, job time: {summary.job_seconds:.2f}s ({summary.speedup:.1f}x overlap)")
+    print(f"   Results: {summary.results_path}")
+
+
+def _iter_results(jobs: List[BatchJob], workers: int):
+    if workers == 1:
+        for job in jobs:
+            yield run_job(job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as pool:
+        futures = {pool.submit(run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed or out of memory)
+                job = futures[future]
+                yield {**asdict(job), "status": "error", "seconds": 0.0, "error": f"worker failed: {e}"}
+
+
+def _warm_worker():
+    import importlib
+    for module_name in WARM_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
@@ -0,0 +1,7 @@
+"""
+Benchmark Suite
+
+Performance benchmarks for skills and the helpers they use, with stored baselines and
+regression checks. Cases live in cases.py, timing and comparison in harness.py, and the
+run-benchmarks command in cli.py.
+"""
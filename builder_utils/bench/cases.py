@@ -0,0 +1,187 @@
+"""
+Benchmark Cases
+Skill end-to-end runs, wire_layout, layout serialization, DataTable formatting, export encoding and preview rendering
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from builder_utils.bench.harness import benchmark
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+EXPORT_ROWS = 100_000
+CHART_POINTS = 50_000
+TABLE_ROWS = 2_000
+WIRED_ROWS = 1_000
+
+BAR_CHART_SQL = """
+    SELECT brand, SUM(sales) as total_sales
+    FROM w_b6b5_pasta_v8_a65f
+    WHERE sales IS NOT NULL
+    GROUP BY brand
+    ORDER BY total_sales DESC
+    LIMIT 20
+"""
+
+
+def _skill_runner(skill_name: str, parameters: dict):
+    """A callable that runs the skill to completion (deferred layouts and exports included)"""
+    from builder_utils.phase_timing import PhaseTimer
+    from builder_utils.run_skill import run_skill
+    from builder_utils.skill_registry import SkillRegistry
+
+    skill_function = SkillRegistry(PROJECT_ROOT).load_function(skill_name)
+    return lambda: run_skill(skill_name, dict(parameters), skill_function=skill_function, timer=PhaseTimer())
+
+
+def _skill_module(file_stem: str):
+    spec = importlib.util.spec_from_file_location(file_stem, PROJECT_ROOT / f"{file_stem}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _metric_frame(rows: int, dimensions=("segment",), metrics=("sales",)) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    columns = {dimension: [f"{dimension}_{i}" for i in range(rows)] for dimension in dimensions}
+    columns.update({f"total_{metric}": rng.uniform(0, 1e6, rows) for metric in metrics})
+    return pd.DataFrame(columns)
+
+
+@benchmark("skill.special_tab_names", "skill")
+def special_tab_names_case():
+    """special_tab_names end to end: 100 rows, three exports with unsafe sheet names"""
+    yield _skill_runner("special_tab_names", {"compact_dtypes": "false"})
+
+
+@benchmark("skill.export_large_df", "skill")
+def export_large_df_case():
+    """export_large_df end to end at 100k rows, in-memory export"""
+    yield _skill_runner("export_large_df", {"size_of_df": str(EXPORT_ROWS), "display_rows": "100", "export_mode": "in_memory", "compact_dtypes": "false"})
+
+
+@benchmark("skill.basic_data_bar_chart", "skill")
+def basic_data_bar_chart_case():
+    """basic_data_bar_chart end to end on a replayed 20-row query (no warehouse time)"""
+    from builder_utils.sql_replay import save_recording, sql_replay
+
+    frame = _metric_frame(20, dimensions=("brand",))
+    with tempfile.TemporaryDirectory() as recordings:
+        save_recording(recordings, BAR_CHART_SQL, frame)
+        with sql_replay(recordings):
+            yield _skill_runner("basic_data_bar_chart", {"dimension": "brand", "metric": ["sales"], "limit": "20", "new_metric": "sales"})
+
+
+@benchmark("layout.wire_layout", "layout")
+def wire_layout_case():
+    """skill_framework wire_layout filling a DataTable template with 1,000 rows"""
+    from skill_framework.layouts import wire_layout
+
+    template = {
+        "inputVariables": [
+            {"name": "title", "targets": [{"elementName": "Header0", "fieldName": "text"}]},
+            {"name": "table_data", "targets": [{"elementName": "DataTable0", "fieldName": "data"}]},
+            {"name": "table_columns", "targets": [{"elementName": "DataTable0", "fieldName": "columns"}]},
+        ],
+        "layoutJson": {
+            "type": "Document",
+            "children": [
+                {"name": "Header0", "type": "Header", "text": ""},
+                {"name": "DataTable0", "type": "DataTable", "columns": [], "data": []},
+            ],
+        },
+    }
+    frame = _metric_frame(WIRED_ROWS, dimensions=("segment", "brand"), metrics=("sales", "volume"))
+    values = {
+        "title": "Benchmark table",
+        "table_columns": [{"name": column} for column in frame.columns],
+        "table_data": frame.to_numpy().tolist(),
+    }
+    yield lambda: wire_layout(template, values)
+
+
+def _chart_layout(series) -> dict:
+    return {"type": "Document", "children": [{"type": "HighchartsChart", "name": "Chart", "options": {"series": series}}]}
+
+
+@benchmark("layout.serialize_fragments", "layout")
+def serialize_fragments_case():
+    """Chart layout with 3 x 50k points serialized through SharedFrame fragments and dumps_layout"""
+    from builder_utils.shared_frame import SharedFrame, dumps_layout
+
+    shared = SharedFrame(_metric_frame(CHART_POINTS, metrics=("sales", "volume", "units")))
+    yield lambda: dumps_layout(_chart_layout([{"name": name, "data": shared.column_json(name)} for name in shared.frame.columns[1:]]))
+
+
+@benchmark("layout.serialize_tolist", "layout")
+def serialize_tolist_case():
+    """The same chart layout serialized the plain way: tolist() per column and json.dumps"""
+    frame = _metric_frame(CHART_POINTS, metrics=("sales", "volume", "units"))
+    yield lambda: json.dumps(_chart_layout([{"name": name, "data": frame[name].tolist()} for name in frame.columns[1:]]))
+
+
+@benchmark("datatable.format", "datatable")
+def datatable_format_case():
+    """data_table_display.create_data_table: 2,000 rows, two dimensions and two formatted metrics"""
+    from builder_utils.shared_frame import SharedFrame
+
+    module = _skill_module("data_table_display")
+    frame = _metric_frame(TABLE_ROWS, dimensions=("segment", "brand"), metrics=("sales", "volume"))
+    frame.columns = ["Segment", "Brand", "Sales", "Volume"]
+    yield lambda: module.create_data_table(SharedFrame(frame), ["segment", "brand"], ["sales", "volume"], "sales", "desc")
+
+
+def _export_case(format: str):
+    from skill_framework import ExportData
+    from builder_utils.export_encoders import encode_export
+    from builder_utils.synthetic_data import generate_synthetic_rows
+
+    export = ExportData(name="bench", data=generate_synthetic_rows(1, EXPORT_ROWS))
+    yield lambda: encode_export(export, format)
+
+
+@benchmark("export.csv", "export")
+def export_csv_case():
+    """Encode a 100k-row synthetic export as CSV"""
+    yield from _export_case("csv")
+
+
+@benchmark("export.parquet_zstd", "export")
+def export_parquet_case():
+    """Encode a 100k-row synthetic export as zstd parquet"""
+    yield from _export_case("parquet-zstd")
+
+
+@benchmark("export.arrow", "export")
+def export_arrow_case():
+    """Encode a 100k-row synthetic export as an Arrow IPC file"""
+    yield from _export_case("arrow")
+
+
+@benchmark("preview.render", "preview")
+def preview_render_case():
+    """skill_framework preview_skill writing special_tab_names' visualizations for the preview app"""
+    from skill_framework import preview_skill
+    from builder_utils.run_skill import run_skill
+    from builder_utils.skill_registry import SkillRegistry
+
+    skill_function = SkillRegistry(PROJECT_ROOT).load_function("special_tab_names")
+    output = run_skill("special_tab_names", {"compact_dtypes": "false"}, skill_function=skill_function)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as preview_dir:
+        os.chdir(preview_dir)
+        try:
+            def render():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    preview_skill(skill_function, output)
+            yield render
+        finally:
+            os.chdir(cwd)
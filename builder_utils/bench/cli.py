@@ -0,0 +1,136 @@
+"""
+Benchmark CLI
+Run the benchmark suite, store results as a baseline, and fail on regressions against it
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from builder_utils.bench.harness import (
+    DEFAULT_MIN_DELTA_SECONDS,
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    DEFAULT_WARMUP,
+    BenchStats,
+    compare_results,
+    comparison_failed,
+    environment_mismatch,
+    load_results,
+    print_comparison,
+    print_results,
+    registered_cases,
+    results_document,
+    run_case,
+    save_results,
+)
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def run_suite(patterns: Optional[List[str]] = None, warmup: int = DEFAULT_WARMUP, repeat: int = DEFAULT_REPEAT,
+              verbose: bool = True) -> Tuple[List[BenchStats], Dict[str, str]]:
+    """
+    Run the registered cases matching patterns (all by default)
+
+    Output printed by the code under test is discarded.
+
+    Returns:
+        (results of the cases that ran, {case name: error} for the cases that raised)
+    """
+    results = []
+    failed = {}
+    for case in registered_cases(patterns):
+        start = time.perf_counter()
+        try:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                result = run_case(case, warmup=warmup, repeat=repeat)
+        except Exception as e:
+            failed[case.name] = f"{type(e).__name__}: {e}"
+            if verbose:
+                print(f"💥 {case.name}: {failed[case.name]}")
+            continue
+        results.append(result)
+        if verbose:
+            print(f"⏱️ {case.name:<34} {result.median * 1000:10.2f} ms median ({time.perf_counter() - start:.1f}s)")
+    return results, failed
+
+
+def main():
+    """Run benchmarks or compare them against a stored baseline"""
+    parser = argparse.ArgumentParser(description='Benchmark skills and helpers, store baselines and detect regressions')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_run_options(subparser):
+        subparser.add_argument('--filter', nargs='+', help='Only benchmarks whose name or group matches these globs (e.g. "skill.*" export)')
+        subparser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP, help=f'Untimed runs per benchmark (default: {DEFAULT_WARMUP})')
+        subparser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help=f'Timed runs per benchmark (default: {DEFAULT_REPEAT})')
+
+    list_parser = subparsers.add_parser('list', help='List the benchmarks')
+    list_parser.add_argument('--filter', nargs='+', help='Only benchmarks whose name or group matches these globs')
+
+    run_parser = subparsers.add_parser('run', help='Run benchmarks and print statistics')
+    add_run_options(run_parser)
+    run_parser.add_argument('--output', help='Write the results to this JSON file')
+    run_parser.add_argument('--save-baseline', action='store_true', help='Also store the results as the baseline')
+    run_parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline file (default: builder_utils/bench/baseline.json)')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare results with the baseline; exits 1 on regressed, failed or missing benchmarks')
+    add_run_options(compare_parser)
+    compare_parser.add_argument('--results', help='Results file to compare (default: run the benchmarks now)')
+    compare_parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline file (default: builder_utils/bench/baseline.json)')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help=f'Allowed median slowdown, as a fraction (default: {DEFAULT_THRESHOLD})')
+    compare_parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_SECONDS * 1000, help='Ignore changes smaller than this (default: 0.5)')
+
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for case in registered_cases(args.filter):
+            print(f"  {case.name:<34} {case.description}")
+        return
+
+    if args.command == 'run':
+        results, failed = run_suite(args.filter, warmup=args.warmup, repeat=args.repeat)
+        print_results(results)
+        if args.output:
+            save_results(results, args.output, failed)
+            print(f"\n💾 Results: {args.output}")
+        if failed:
+            print(f"\n💥 {len(failed)} benchmark(s) failed: {', '.join(failed)}")
+            if args.save_baseline:
+                print("   Baseline not saved")
+            sys.exit(1)
+        if args.save_baseline:
+            save_results(results, args.baseline)
+            print(f"\n📌 Baseline: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"❌ No baseline at {args.baseline}; create one with 'run-benchmarks run --save-baseline'")
+        sys.exit(2)
+    baseline = load_results(args.baseline)
+
+    if args.results:
+        current = load_results(args.results)
+    else:
+        current = results_document(*run_suite(args.filter, warmup=args.warmup, repeat=args.repeat))
+    if args.filter:
+        # Baseline cases outside the filter were not meant to run
+        selected = {case.name for case in registered_cases(args.filter)}
+        baseline["benchmarks"] = {name: result for name, result in baseline["benchmarks"].items() if name in selected}
+
+    mismatch = environment_mismatch(baseline, current)
+    if mismatch:
+        print(f"⚠️ Baseline was recorded on a different environment ({', '.join(mismatch)}); timings may not be comparable")
+
+    comparisons = compare_results(baseline, current, threshold=args.threshold, min_delta=args.min_delta_ms / 1000)
+    print_comparison(comparisons, args.threshold)
+    sys.exit(1 if comparison_failed(comparisons) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Benchmark Harness
+Case registry, warm-up/repeat timing statistics, result files and baseline comparison
+"""
+
+import contextlib
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, ContextManager, Dict, List, Optional
+
+DEFAULT_WARMUP = 2
+DEFAULT_REPEAT = 10
+DEFAULT_THRESHOLD = 0.20
+# Changes smaller than this are timer noise whatever their ratio
+DEFAULT_MIN_DELTA_SECONDS = 0.0005
+RESULTS_VERSION = 1
+# Comparison statuses that make "compare" exit non-zero
+FAILING_STATUSES = ("regressed", "failed", "missing")
+
+
+@dataclass
+class BenchmarkCase:
+    """A named benchmark: a context manager that sets up, yields the callable to time, and tears down"""
+    name: str
+    group: str
+    description: str
+    factory: Callable[[], ContextManager[Callable[[], object]]]
+
+
+@dataclass
+class BenchStats:
+    """Timing statistics of one benchmark"""
+    name: str
+    group: str
+    warmup: int
+    samples: List[float] = field(default_factory=list)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.mean(self.samples)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    @property
+    def minimum(self) -> float:
+        return min(self.samples)
+
+    @property
+    def maximum(self) -> float:
+        return max(self.samples)
+
+    def to_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "median": self.median,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "min": self.minimum,
+            "max": self.maximum,
+        }
+
+
+@dataclass
+class Comparison:
+    """One benchmark's median against the baseline"""
+    name: str
+    status: str  # ok, regressed, improved, new, missing, failed
+    baseline_median: Optional[float] = None
+    current_median: Optional[float] = None
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the median (0.25 = 25% slower)"""
+        if not self.baseline_median or self.current_median is None:
+            return None
+        return self.current_median / self.baseline_median - 1
+
+
+_CASES: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark(name: str, group: str, description: str = ""):
+    """
+    Register a benchmark case
+
+    The decorated function is a generator: it does its setup, yields the zero-argument
+    callable to time, and tears down after the yield. Only the callable is timed.
+    """
+    def register(function):
+        _CASES[name] = BenchmarkCase(name, group, description or (function.__doc__ or "").strip(), contextlib.contextmanager(function))
+        return function
+    return register
+
+
+def registered_cases(patterns: Optional[List[str]] = None) -> List[BenchmarkCase]:
+    """Registered cases, optionally only those whose name or group matches one of the glob patterns"""
+    from builder_utils.bench import cases  # noqa: F401 - registers the suite
+
+    selected = []
+    for case in _CASES.values():
+        if not patterns or any(fnmatch.fnmatch(case.name, p) or fnmatch.fnmatch(case.group, p) for p in patterns):
+            selected.append(case)
+    return selected
+
+
+def measure(function: Callable[[], object], warmup: int = DEFAULT_WARMUP, repeat: int = DEFAULT_REPEAT) -> List[float]:
+    """Call function warmup times untimed, then repeat times timed; returns the timings in seconds"""
+    for _ in range(warmup):
+        function()
+    samples = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run_case(case: BenchmarkCase, warmup: int = DEFAULT_WARMUP, repeat: int = DEFAULT_REPEAT) -> BenchStats:
+    with case.factory() as function:
+        samples = measure(function, warmup=warmup, repeat=repeat)
+    return BenchStats(case.name, case.group, warmup, samples)
+
+
+def environment() -> dict:
+    """Machine details stored with results; timings are only comparable on matching machines"""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def results_document(results: List[BenchStats], failed: Optional[Dict[str, str]] = None) -> dict:
+    """Results (and the error of each case that failed) as a document save_results writes"""
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(),
+        "benchmarks": {result.name: result.to_dict() for result in results},
+        "failed": dict(failed or {}),
+    }
+
+
+def save_results(results: List[BenchStats], path: str, failed: Optional[Dict[str, str]] = None):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(results_document(results, failed), results_file, indent=2)
+
+
+def load_results(path: str) -> dict:
+    """A results file as written by save_results"""
+    with open(path, encoding="utf-8") as results_file:
+        document = json.load(results_file)
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path}: unsupported results version {document.get('version')}")
+    return document
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD,
+                    min_delta: float = DEFAULT_MIN_DELTA_SECONDS) -> List[Comparison]:
+    """
+    Compare medians of two results documents
+
+    A benchmark regresses when its median grows by more than threshold (relative) and by
+    more than min_delta seconds; it improves on the mirror condition. Cases listed under
+    "failed" in current are reported as failed, baseline cases absent from current as missing.
+    """
+    baseline_benchmarks = baseline["benchmarks"]
+    current_benchmarks = current["benchmarks"]
+    current_failed = current.get("failed", {})
+    comparisons = []
+    for name, result in current_benchmarks.items():
+        if name not in baseline_benchmarks:
+            comparisons.append(Comparison(name, "new", current_median=result["median"]))
+            continue
+        old, new = baseline_benchmarks[name]["median"], result["median"]
+        status = "ok"
+        if new - old > min_delta and new > old * (1 + threshold):
+            status = "regressed"
+        elif old - new > min_delta and new < old / (1 + threshold):
+            status = "improved"
+        comparisons.append(Comparison(name, status, old, new))
+    for name in current_failed:
+        comparisons.append(Comparison(name, "failed", baseline_median=baseline_benchmarks.get(name, {}).get("median")))
+    for name, result in baseline_benchmarks.items():
+        if name not in current_benchmarks and name not in current_failed:
+            comparisons.append(Comparison(name, "missing", baseline_median=result["median"]))
+    return comparisons
+
+
+def comparison_failed(comparisons: List[Comparison]) -> bool:
+    """Whether a comparison should fail the run: anything regressed, failed or missing"""
+    return any(comparison.status in FAILING_STATUSES for comparison in comparisons)
+
+
+def print_results(results: List[BenchStats]):
+    print(f"\n{'benchmark':<34} {'median ms':>10} {'min ms':>9} {'max ms':>9} {'stdev':>8} {'runs':>5}")
+    for result in results:
+        print(f"{result.name:<34} {result.median * 1000:10.2f} {result.minimum * 1000:9.2f} "
+              f"{result.maximum * 1000:9.2f} {result.stdev * 1000:8.2f} {len(result.samples):5}")
+
+
+def print_comparison(comparisons: List[Comparison], threshold: float):
+    markers = {"ok": "  ", "regressed": "❌", "improved": "🚀", "new": "🆕", "missing": "❔", "failed": "💥"}
+    print(f"\n{'':2} {'benchmark':<34} {'baseline ms':>12} {'current ms':>11} {'change':>8}")
+    for comparison in comparisons:
+        baseline = f"{comparison.baseline_median * 1000:.2f}" if comparison.baseline_median is not None else "-"
+        current = f"{comparison.current_median * 1000:.2f}" if comparison.current_median is not None else "-"
+        change = f"{comparison.change:+.0%}" if comparison.change is not None else ""
+        print(f"{markers[comparison.status]} {comparison.name:<34} {baseline:>12} {current:>11} {change:>8}")
+
+    regressed = [c for c in comparisons if c.status == "regressed"]
+    failed = [c for c in comparisons if c.status == "failed"]
+    missing = [c for c in comparisons if c.status == "missing"]
+    if regressed:
+        print(f"\n❌ {len(regressed)} benchmark(s) regressed by more than {threshold:.0%}")
+    if failed:
+        print(f"\n💥 {len(failed)} benchmark(s) failed: {', '.join(c.name for c in failed)}")
+    if missing:
+        print(f"\n❔ {len(missing)} baseline benchmark(s) were not run: {', '.join(c.name for c in missing)}")
+    if not (regressed or failed or missing):
+        print(f"\n✅ No regressions beyond {threshold:.0%}")
+
+
+def environment_mismatch(baseline: dict, current: dict) -> List[str]:
+    """Environment fields that differ between two results documents"""
+    old, new = baseline.get("environment", {}), current.get("environment", {})
+    return [key for key in sorted(set(old) | set(new)) if old.get(key) != new.get(key)]
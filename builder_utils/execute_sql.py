@@ -1,11 +1,14 @@
-from answer_rocket.data import ExecuteSqlQueryResult
-from answer_rocket import AnswerRocketClient
 from dotenv import load_dotenv
+from typing import TYPE_CHECKING
 import argparse
 import os
-import pandas
 
-def execute_sql(sql_query: str) -> pandas.DataFrame:
+from builder_utils.phase_timing import phase
+
+if TYPE_CHECKING:
+    import pandas
+
+def execute_sql(sql_query: str) -> "pandas.DataFrame":
     """Execute a SQL query against a database in AnswerRocket
 
     Args:
@@ -14,6 +17,9 @@ def execute_sql(sql_query: str) -> pandas.DataFrame:
     Returns:
         pandas.DataFrame: The result set from the SQL query execution
     """
+    from answer_rocket import AnswerRocketClient
+    from answer_rocket.data import ExecuteSqlQueryResult
+
     load_dotenv()
 
     database_id = os.getenv('DATABASE_ID')
@@ -22,7 +28,8 @@ def execute_sql(sql_query: str) -> pandas.DataFrame:
         raise Exception("Failed to run SQL query: No database ID provided. Get Database id from dataset metadata")
 
     arc = AnswerRocketClient()
-    response: ExecuteSqlQueryResult = arc.data.execute_sql_query(database_id=database_id, sql_query=sql_query)
+    with phase("fetch"):
+        response: ExecuteSqlQueryResult = arc.data.execute_sql_query(database_id=database_id, sql_query=sql_query)
     
     if response is None:
         raise Exception("Failed to run SQL query: No response received")
@@ -1,10 +1,12 @@
-from answer_rocket.data import MaxDataset
-from answer_rocket import AnswerRocketClient
 from dotenv import load_dotenv
+from typing import TYPE_CHECKING
 import argparse
 import os
 
-def get_dataset_metadata(dataset_id: str) -> MaxDataset:
+if TYPE_CHECKING:
+    from answer_rocket.data import MaxDataset
+
+def get_dataset_metadata(dataset_id: str) -> "MaxDataset":
     """Retrieve dataset metadata and schema information from AnswerRocket
 
     Args:
@@ -13,6 +15,8 @@ def get_dataset_metadata(dataset_id: str) -> MaxDataset:
     Returns:
         MaxDataset: Dataset metadata including schema, columns, and database information
     """
+    from answer_rocket import AnswerRocketClient
+
     load_dotenv()
 
     arc = AnswerRocketClient()
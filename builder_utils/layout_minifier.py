@@ -0,0 +1,142 @@
+"""
+Layout Minifier
+Shrinks dynamic-layout payloads before they are wrapped in a SkillVisualization
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+from pydantic import PrivateAttr
+from skill_framework import SkillVisualization
+
+# Element properties whose value matches what the renderer assumes when the key is absent
+DEFAULT_ELEMENT_VALUES = {
+    "hidden": False,
+}
+
+# Style values the browser discards anyway ("null" is not a valid CSS value)
+DEFAULT_STYLE_VALUES = ("null", "")
+
+STYLE_KEYS = ("style", "styles")
+
+
+@dataclass
+class MinifyResult:
+    """Result of minifying a single layout"""
+    layout: str
+    original_bytes: int
+    minified_bytes: int
+    dropped_defaults: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_bytes - self.minified_bytes
+
+    @property
+    def reduction_pct(self) -> float:
+        if self.original_bytes == 0:
+            return 0.0
+        return 100.0 * self.saved_bytes / self.original_bytes
+
+
+class MinifiedVisualization(SkillVisualization):
+    """A SkillVisualization that remembers how much minifying its layout saved"""
+
+    _minify_result: Optional[MinifyResult] = PrivateAttr(default=None)
+
+    @property
+    def minify_result(self) -> Optional[MinifyResult]:
+        return self._minify_result
+
+
+def minify_layout(layout: Union[str, Dict, list]) -> MinifyResult:
+    """
+    Minify a layout by dropping default-valued keys and style values and serializing
+    without whitespace
+
+    Args:
+        layout: Layout as a JSON string (e.g. the output of wire_layout) or an already parsed dict/list
+
+    Returns:
+        MinifyResult with the compact layout string and size statistics
+    """
+    if isinstance(layout, str):
+        original_bytes = len(layout.encode("utf-8"))
+        tree = json.loads(layout)
+    else:
+        original_bytes = len(json.dumps(layout).encode("utf-8"))
+        tree = layout
+
+    stats = {"dropped_defaults": 0}
+    minified_tree = _minify_node(tree, stats)
+
+    minified = json.dumps(minified_tree, separators=(",", ":"), ensure_ascii=False)
+
+    return MinifyResult(
+        layout=minified,
+        original_bytes=original_bytes,
+        minified_bytes=len(minified.encode("utf-8")),
+        dropped_defaults=stats["dropped_defaults"],
+    )
+
+
+def minified_visualization(title: str, layout: Union[str, Dict, list]) -> MinifiedVisualization:
+    """
+    Build a SkillVisualization from a minified copy of the layout
+
+    Nothing is printed; the MinifyResult is kept on the visualization and run-skill's output
+    size report (--sizes) shows the bytes it saved.
+
+    Args:
+        title: Visualization title
+        layout: Layout as a JSON string or parsed dict/list
+
+    Returns:
+        MinifiedVisualization carrying the minified layout and its MinifyResult
+    """
+    result = minify_layout(layout)
+    visualization = MinifiedVisualization(title=title, layout=result.layout)
+    visualization._minify_result = result
+    return visualization
+
+
+def _minify_node(node: Any, stats: Dict) -> Any:
+    """Recursively rebuild a layout node without default values"""
+    if isinstance(node, list):
+        return [_minify_node(item, stats) for item in node]
+
+    if not isinstance(node, dict):
+        return node
+
+    minified = {}
+    for key, value in node.items():
+        if key in DEFAULT_ELEMENT_VALUES and _is_same_value(value, DEFAULT_ELEMENT_VALUES[key]):
+            stats["dropped_defaults"] += 1
+            continue
+
+        if key in STYLE_KEYS and isinstance(value, dict):
+            minified[key] = _clean_style(value, stats)
+        else:
+            minified[key] = _minify_node(value, stats)
+
+    return minified
+
+
+def _clean_style(style: Dict, stats: Dict) -> Dict:
+    """Strip style values the browser discards"""
+    cleaned = {}
+    for key, value in style.items():
+        if isinstance(value, dict):
+            # nested style groups such as DataTable "styles": {"th": {...}, "td": {...}}
+            cleaned[key] = _clean_style(value, stats)
+        elif isinstance(value, str) and value in DEFAULT_STYLE_VALUES:
+            stats["dropped_defaults"] += 1
+        else:
+            cleaned[key] = value
+    return cleaned
+
+
+def _is_same_value(value: Any, default: Any) -> bool:
+    """Compare values without treating 0/1 as False/True"""
+    return type(value) is type(default) and value == default
@@ -0,0 +1,143 @@
+"""
+Layout Templates
+Build many visualizations from one layout while serializing only the per-tab differences
+"""
+
+import copy
+import json
+from typing import Any, Dict, List, Optional, Union
+
+from skill_framework import SkillVisualization
+
+from builder_utils.lazy_visualization import LazySkillVisualization
+from builder_utils.layout_minifier import MinifyResult, minify_layout
+
+# Overrides map an element name to {"dotted.field.path": value}, the same addressing wire_layout uses
+Overrides = Dict[str, Dict[str, Any]]
+
+_CHILDREN_MARKER = "\x00children\x00"
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+class LayoutTemplate:
+    """
+    A Document layout whose elements are serialized once and reused on every render.
+
+    Rendering with overrides copies only the overridden element along the override path
+    (copy-on-write) and serializes only that element; every other element is emitted from
+    its cached JSON fragment. Fragments can be pooled across templates so identical
+    elements in different tabs are stored once.
+    """
+
+    def __init__(self,
+                 layout: Union[str, Dict],
+                 minify: bool = False,
+                 fragment_pool: Optional[Dict[str, str]] = None):
+        self.minify_result: Optional[MinifyResult] = None
+        if minify:
+            self.minify_result = minify_layout(layout)
+            layout = json.loads(self.minify_result.layout)
+        elif isinstance(layout, str):
+            layout = json.loads(layout)
+
+        if not isinstance(layout, dict) or not isinstance(layout.get("children"), list):
+            raise ValueError("LayoutTemplate requires a layout object with a 'children' list")
+
+        pool = fragment_pool if fragment_pool is not None else {}
+
+        self._root = layout
+        self._elements: List[Dict] = layout["children"]
+        self._index = {
+            element.get("name"): position
+            for position, element in enumerate(self._elements)
+            if isinstance(element, dict) and element.get("name")
+        }
+
+        # Serialize the document shell once, splitting it around the children array
+        shell = {key: (_CHILDREN_MARKER if key == "children" else value) for key, value in layout.items()}
+        shell_json = _dumps(shell)
+        head, tail = shell_json.split(_dumps(_CHILDREN_MARKER), 1)
+        self._head = head + "["
+        self._tail = "]" + tail
+
+        self._fragments = [self._intern(pool, _dumps(element)) for element in self._elements]
+        self._rendered: Optional[str] = None
+
+    @classmethod
+    def from_variants(cls, layouts: List[Union[str, Dict]], minify: bool = False) -> List["LayoutTemplate"]:
+        """Build one template per layout, sharing a fragment pool so identical elements are stored once"""
+        pool: Dict[str, str] = {}
+        return [cls(layout, minify=minify, fragment_pool=pool) for layout in layouts]
+
+    @property
+    def element_names(self) -> List[str]:
+        return list(self._index)
+
+    def render(self, overrides: Optional[Overrides] = None) -> str:
+        """
+        Render the layout as a JSON string
+
+        Args:
+            overrides: Optional {element_name: {"field.path": value}} applied to this render only
+
+        Returns:
+            The layout JSON; without overrides the same cached string is returned every time
+        """
+        if not overrides:
+            if self._rendered is None:
+                self._rendered = self._head + ",".join(self._fragments) + self._tail
+            return self._rendered
+
+        fragments = list(self._fragments)
+        for element_name, fields in overrides.items():
+            if element_name not in self._index:
+                raise KeyError(f"Element '{element_name}' not found in layout template")
+            position = self._index[element_name]
+            element = self._elements[position]
+            for field_name, value in fields.items():
+                element = _set_path(element, field_name.split("."), value)
+            fragments[position] = _dumps(element)
+
+        return self._head + ",".join(fragments) + self._tail
+
+    def to_dict(self, overrides: Optional[Overrides] = None) -> Dict:
+        """Return an independent dict copy of the (optionally overridden) layout"""
+        if not overrides:
+            return copy.deepcopy(self._root)
+        return json.loads(self.render(overrides))
+
+    def visualization(self,
+                      title: str,
+                      overrides: Optional[Overrides] = None,
+                      lazy: bool = False) -> SkillVisualization:
+        """
+        Build a SkillVisualization from this template
+
+        Args:
+            title: Visualization title
+            overrides: Optional per-visualization overrides
+            lazy: Return a LazySkillVisualization that renders on first access
+        """
+        if lazy:
+            return LazySkillVisualization(title=title, factory=lambda: self.render(overrides))
+        return SkillVisualization(title=title, layout=self.render(overrides))
+
+    @staticmethod
+    def _intern(pool: Dict[str, str], fragment: str) -> str:
+        return pool.setdefault(fragment, fragment)
+
+
+def _set_path(node: Dict, parts: List[str], value: Any) -> Dict:
+    """Return a copy of node with value set at the dotted path, copying only the dicts along that path"""
+    updated = dict(node)
+    if len(parts) == 1:
+        updated[parts[0]] = value
+    else:
+        child = node.get(parts[0])
+        if not isinstance(child, dict):
+            child = {}
+        updated[parts[0]] = _set_path(child, parts[1:], value)
+    return updated
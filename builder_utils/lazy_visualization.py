@@ -0,0 +1,94 @@
+"""
+Lazy Visualizations
+Visualizations whose layout is produced by a factory the first time it is needed
+"""
+
+import json
+import threading
+from typing import Any, Callable, Union
+
+from pydantic import PrivateAttr
+from skill_framework import SkillVisualization
+
+LayoutFactory = Callable[[], Union[str, dict, list]]
+
+# Marks a visualization whose factory is running, so reads made by the render itself pass through
+_RENDERING = object()
+
+
+class _RenderLock:
+    """One visualization's render lock; copies and unpickled visualizations get a fresh one"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+
+    def __enter__(self):
+        return self.lock.__enter__()
+
+    def __exit__(self, *exc_info):
+        return self.lock.__exit__(*exc_info)
+
+    def __deepcopy__(self, memo):
+        return _RenderLock()
+
+    def __reduce__(self):
+        return (_RenderLock, ())
+
+
+class LazySkillVisualization(SkillVisualization):
+    """
+    A SkillVisualization whose layout is produced by a factory on first access.
+
+    `layout` stays an ordinary field (an empty string until rendered). The factory runs the first
+    time `layout` or the model's fields are read, which covers attribute access, dumping the
+    visualization or any SkillOutput that contains it, copying and pickling, so a lazy
+    visualization can go anywhere a SkillVisualization can.
+    """
+
+    _factory: Any = PrivateAttr(default=None)
+    # Per visualization, so renders of different visualizations run concurrently
+    _render_lock: Any = PrivateAttr(default_factory=_RenderLock)
+
+    def __init__(self, title: str, factory: LayoutFactory):
+        super().__init__(title=title, layout="")
+        self._factory = factory
+
+    def __getattribute__(self, name: str):
+        # pydantic serializes, copies and compares models by reading __dict__
+        if name == "layout" or name == "__dict__":
+            private = object.__getattribute__(self, "__pydantic_private__")
+            if private and private.get("_factory") is not None:
+                object.__getattribute__(self, "_render_pending")()
+        return super().__getattribute__(name)
+
+    @property
+    def is_rendered(self) -> bool:
+        return self._factory is None
+
+    def render(self) -> str:
+        """Run the factory if it has not run yet, and return the layout string"""
+        self._render_pending()
+        return self.layout
+
+    def _render_pending(self):
+        if self._factory is None:
+            return
+        with self._render_lock:
+            factory = self._factory
+            if factory is None or factory is _RENDERING:
+                return
+            self._factory = _RENDERING
+            try:
+                layout = factory()
+                if not isinstance(layout, str):
+                    layout = json.dumps(layout, separators=(",", ":"), ensure_ascii=False)
+                self.layout = layout
+            except BaseException:
+                self._factory = factory
+                raise
+            self._factory = None
+
+    def __getstate__(self):
+        self._render_pending()
+        return super().__getstate__()
+
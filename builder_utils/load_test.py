@@ -0,0 +1,311 @@
+"""
+Load Test
+Call a skill concurrently from threads or processes and report throughput and latency percentiles
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence
+
+from builder_utils.skill_registry import SkillRegistry
+
+LOAD_MODES = ("thread", "process")
+PERCENTILES = (50, 95, 99)
+DEFAULT_REQUESTS = 50
+
+
+@dataclass
+class Sample:
+    """One request: when it started (seconds after the load began), how long it took, and whether it failed"""
+    worker: int
+    start: float
+    seconds: float
+    error: Optional[str] = None
+
+
+@dataclass
+class LoadResult:
+    """All requests made at one concurrency level"""
+    concurrency: int
+    mode: str
+    ramp_up: float
+    samples: List[Sample] = field(default_factory=list)
+
+    @property
+    def wall_seconds(self) -> float:
+        """From the first worker starting to the last request finishing"""
+        return max((sample.start + sample.seconds for sample in self.samples), default=0.0)
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for sample in self.samples if sample.error)
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second over the whole run"""
+        completed = len(self.samples) - self.errors
+        return completed / self.wall_seconds if self.wall_seconds else 0.0
+
+    def latencies(self, steady_only: bool = False) -> List[float]:
+        """Successful request latencies; steady_only drops requests started during ramp-up"""
+        return [
+            sample.seconds for sample in self.samples
+            if not sample.error and (not steady_only or sample.start >= self.ramp_up)
+        ]
+
+    def summary(self, steady_only: bool = False) -> dict:
+        latencies = self.latencies(steady_only)
+        summary = {f"p{q}": percentile(latencies, q) for q in PERCENTILES}
+        summary["max"] = max(latencies, default=0.0)
+        summary["mean"] = sum(latencies) / len(latencies) if latencies else 0.0
+        summary["requests"] = len(latencies)
+        return summary
+
+    def to_dict(self) -> dict:
+        return {
+            "concurrency": self.concurrency,
+            "mode": self.mode,
+            "ramp_up": self.ramp_up,
+            "requests": len(self.samples),
+            "errors": self.errors,
+            "wall_seconds": self.wall_seconds,
+            "throughput": self.throughput,
+            "latency": self.summary(),
+            "steady_latency": self.summary(steady_only=True) if self.ramp_up else None,
+        }
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """q-th percentile with linear interpolation between the closest ranks (numpy's default)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def run_load(skill_name: str, parameters: dict, concurrency: int = 4, mode: str = "thread",
+             requests: Optional[int] = None, duration: Optional[float] = None, ramp_up: float = 0.0,
+             replay_dir: Optional[str] = None) -> LoadResult:
+    """
+    Call a skill from concurrency workers at once through the in-process run_skill path
+
+    Each worker runs one untimed warm-up call, then all workers start together; with ramp_up,
+    worker i waits ramp_up * i / concurrency seconds before its first request. Requests are
+    timed to completion, lazy layouts and background exports included. Threads share this
+    process (and its GIL and caches); processes each warm their own copy of the skill.
+
+    Args:
+        skill_name: Skill registered in skills.txt
+        parameters: Parameters for every request
+        concurrency: Number of workers
+        mode: "thread" or "process"
+        requests: Total requests to make, shared between workers (default: 50 without duration)
+        duration: Keep making requests for this many seconds (ramp-up included)
+        ramp_up: Seconds over which workers are started
+        replay_dir: Answer SQL queries from this recordings directory (see sql_replay)
+
+    Returns:
+        LoadResult with one Sample per request
+    """
+    if mode not in LOAD_MODES:
+        raise ValueError(f"Unknown load mode '{mode}', expected one of {', '.join(LOAD_MODES)}")
+    if requests is None and duration is None:
+        requests = DEFAULT_REQUESTS
+    if SkillRegistry().get(skill_name) is None:
+        raise ValueError(f"Skill '{skill_name}' is not registered in skills.txt")
+
+    result = LoadResult(concurrency=concurrency, mode=mode, ramp_up=ramp_up)
+    settings = (skill_name, parameters, concurrency, duration, ramp_up)
+
+    if mode == "thread":
+        lock = threading.Lock()
+        issued = [0]
+
+        def claim() -> bool:
+            with lock:
+                if requests is not None and issued[0] >= requests:
+                    return False
+                issued[0] += 1
+                return True
+
+        barrier = threading.Barrier(concurrency)
+        backend = _replay(replay_dir)
+        with backend:
+            skill_function = _warm_up(skill_name, parameters)
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load") as pool:
+                futures = [pool.submit(_worker_loop, index, settings, skill_function, claim, barrier) for index in range(concurrency)]
+                for future in futures:
+                    result.samples.extend(future.result())
+    else:
+        context = multiprocessing.get_context()
+        counter = context.Value("i", 0)
+        barrier = context.Barrier(concurrency)
+        initargs = (counter, barrier, requests, replay_dir)
+        with ProcessPoolExecutor(max_workers=concurrency, mp_context=context, initializer=_init_process, initargs=initargs) as pool:
+            futures = [pool.submit(_process_worker, index, settings) for index in range(concurrency)]
+            for future in futures:
+                result.samples.extend(future.result())
+
+    result.samples.sort(key=lambda sample: sample.start)
+    return result
+
+
+def print_load_results(results: List[LoadResult]):
+    print(f"\n🚦 Load test results (latency in ms):")
+    print(f"  {'workers':>7} {'requests':>8} {'errors':>6} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for result in results:
+        summary = result.summary()
+        print(f"  {result.concurrency:7} {len(result.samples):8} {result.errors:6} {result.throughput:8.2f} "
+              f"{summary['p50'] * 1000:9.1f} {summary['p95'] * 1000:9.1f} {summary['p99'] * 1000:9.1f} {summary['max'] * 1000:9.1f}")
+
+    ramped = [result for result in results if result.ramp_up]
+    if ramped:
+        print(f"\n  After ramp-up ({ramped[0].ramp_up:g}s):")
+        for result in ramped:
+            summary = result.summary(steady_only=True)
+            print(f"  {result.concurrency:7} {summary['requests']:8} {'':6} {'':8} "
+                  f"{summary['p50'] * 1000:9.1f} {summary['p95'] * 1000:9.1f} {summary['p99'] * 1000:9.1f} {summary['max'] * 1000:9.1f}")
+
+    errors = [sample.error for result in results for sample in result.samples if sample.error]
+    if errors:
+        print(f"\n❌ {len(errors)} request(s) failed; first error: {errors[0]}")
+
+    if len(results) > 1:
+        best = max(results, key=lambda result: result.throughput)
+        print(f"\n📈 Highest throughput: {best.throughput:.2f} req/s with {best.concurrency} {results[0].mode} worker(s)")
+
+
+def _worker_loop(index: int, settings: tuple, skill_function, claim: Callable[[], bool], barrier) -> List[Sample]:
+    from builder_utils.phase_timing import PhaseTimer
+    from builder_utils.run_skill import run_skill
+
+    skill_name, parameters, concurrency, duration, ramp_up = settings
+    barrier.wait()
+    started = time.perf_counter()
+    deadline = started + duration if duration is not None else None
+    time.sleep(ramp_up * index / concurrency)
+
+    samples = []
+    while (deadline is None or time.perf_counter() < deadline) and claim():
+        start = time.perf_counter()
+        error = None
+        try:
+            # A timer makes run_skill finish lazy layouts and background exports
+            run_skill(skill_name, dict(parameters), skill_function=skill_function, timer=PhaseTimer())
+        except Exception as e:
+            error = str(e)
+        samples.append(Sample(index, start - started, time.perf_counter() - start, error))
+    return samples
+
+
+def _warm_up(skill_name: str, parameters: dict):
+    """Load the skill and run it once, untimed, so imports and caches are not measured"""
+    from builder_utils.phase_timing import PhaseTimer
+    from builder_utils.run_skill import run_skill
+
+    skill_function = SkillRegistry().load_function(skill_name)
+    with contextlib.redirect_stdout(None):
+        try:
+            run_skill(skill_name, dict(parameters), skill_function=skill_function, timer=PhaseTimer())
+        except Exception:
+            pass
+    return skill_function
+
+
+def _replay(replay_dir: Optional[str]):
+    from builder_utils.sql_replay import sql_replay
+    return sql_replay(replay_dir) if replay_dir else contextlib.nullcontext()
+
+
+_process_state = {}
+
+
+def _init_process(counter, barrier, requests: Optional[int], replay_dir: Optional[str]):
+    _process_state.update(counter=counter, barrier=barrier, requests=requests, replay_dir=replay_dir)
+
+
+def _process_worker(index: int, settings: tuple) -> List[Sample]:
+    counter, requests = _process_state["counter"], _process_state["requests"]
+
+    def claim() -> bool:
+        with counter.get_lock():
+            if requests is not None and counter.value >= requests:
+                return False
+            counter.value += 1
+            return True
+
+    with _replay(_process_state["replay_dir"]):
+        skill_function = _warm_up(settings[0], settings[1])
+        with contextlib.redirect_stdout(None):
+            return _worker_loop(index, settings, skill_function, claim, _process_state["barrier"])
+
+
+def main():
+    """Load test a skill at one or more concurrency levels"""
+    parser = argparse.ArgumentParser(description='Call a skill concurrently and report throughput and p50/p95/p99/max latency')
+    parser.add_argument('skill_name', help='Skill registered in skills.txt')
+    parser.add_argument('--parameters', '-p', default='{}', help='Parameters as JSON; the rest come from the skill defaults')
+    parser.add_argument('--concurrency', '-c', type=int, nargs='+', default=[4], help='Workers; several values run one level after another (default: 4)')
+    parser.add_argument('--mode', choices=LOAD_MODES, default='thread', help='Threads in this process or worker processes (default: thread)')
+    parser.add_argument('--requests', '-n', type=int, help=f'Requests per level (default: {DEFAULT_REQUESTS} unless --duration is given)')
+    parser.add_argument('--duration', '-d', type=float, help='Seconds per level; with --requests, whichever ends first')
+    parser.add_argument('--ramp-up', type=float, default=0.0, help='Seconds over which workers are started (default: 0)')
+    parser.add_argument('--replay', metavar='DIR', help='Answer SQL queries from recordings in DIR instead of the database')
+    parser.add_argument('--record', action='store_true', help='With --replay, record the warm-up run\'s queries into DIR first')
+    parser.add_argument('--json', help='Write the results to this JSON file')
+
+    args = parser.parse_args()
+    if args.record and not args.replay:
+        parser.error("--record needs --replay DIR")
+    if min(args.concurrency) < 1:
+        parser.error("--concurrency must be at least 1")
+
+    from builder_utils.param_sweep import default_parameters
+
+    entry = SkillRegistry().get(args.skill_name)
+    if entry is None:
+        print(f"❌ Skill '{args.skill_name}' is not registered in skills.txt")
+        sys.exit(1)
+    parameters = {**default_parameters(entry), **json.loads(args.parameters)}
+
+    if args.record:
+        from builder_utils.phase_timing import PhaseTimer
+        from builder_utils.run_skill import run_skill
+        from builder_utils.sql_replay import sql_replay
+        print(f"🎙️ Recording queries into {args.replay}")
+        with sql_replay(args.replay, record=True), contextlib.redirect_stdout(None):
+            run_skill(entry.function, dict(parameters), skill_function=SkillRegistry().load_function(entry.function), timer=PhaseTimer())
+
+    limit = f"{args.duration:g}s" if args.duration is not None else ""
+    if args.requests is not None or args.duration is None:
+        limit = " / ".join(filter(None, [f"{args.requests or DEFAULT_REQUESTS} requests", limit]))
+    print(f"🚦 Load testing {entry.function} with {args.mode} workers: {', '.join(map(str, args.concurrency))} ({limit} per level)")
+
+    results = []
+    for concurrency in args.concurrency:
+        result = run_load(entry.function, parameters, concurrency=concurrency, mode=args.mode, requests=args.requests,
+                          duration=args.duration, ramp_up=args.ramp_up, replay_dir=args.replay)
+        print(f"  ✓ {concurrency} worker(s): {len(result.samples)} requests in {result.wall_seconds:.2f}s")
+        results.append(result)
+
+    print_load_results(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump({"skill": entry.function, "parameters": parameters, "levels": [result.to_dict() for result in results]},
+                      json_file, indent=2, default=str)
+        print(f"\n💾 Results: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
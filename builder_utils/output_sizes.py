@@ -0,0 +1,275 @@
+"""
+Output Sizes
+Byte, cell and point counts of a SkillOutput's layouts and exports, checked against size budgets
+"""
+
+import gzip
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+BUDGETS_FILE = "output_budgets.json"
+GZIP_LEVEL = 6
+
+# Metric -> {"warn": limit, "fail": limit}; None disables a level. Only budgets configured
+# in a budgets file can fail a run; the defaults just warn.
+DEFAULT_BUDGETS: Dict[str, Dict[str, Optional[int]]] = {
+    "layout_bytes": {"warn": 1_000_000, "fail": None},
+    "compressed_bytes": {"warn": 250_000, "fail": None},
+    "datatable_cells": {"warn": 50_000, "fail": None},
+    "highcharts_points": {"warn": 10_000, "fail": None},
+    "export_memory_bytes": {"warn": 100_000_000, "fail": None},
+    "export_encoded_bytes": {"warn": 50_000_000, "fail": None},
+}
+
+
+class OutputBudgetExceeded(Exception):
+    """Raised when a skill's output is over a fail-level size budget"""
+
+
+@dataclass
+class VisualizationSize:
+    """Payload size of one visualization layout"""
+    title: str
+    layout_bytes: int
+    compressed_bytes: int
+    datatable_cells: int = 0
+    highcharts_points: int = 0
+    datatables: int = 0
+    charts: int = 0
+    # Set for visualizations built with layout_minifier.minified_visualization
+    minified_saved_bytes: Optional[int] = None
+    minified_reduction_pct: Optional[float] = None
+
+
+@dataclass
+class ExportSize:
+    """Size of one export in memory and once encoded (on disk for file-backed exports)"""
+    name: str
+    rows: Optional[int]
+    columns: Optional[int]
+    memory_bytes: int
+    encoded_bytes: Optional[int] = None
+    format: Optional[str] = None
+    on_disk: bool = False
+
+
+@dataclass
+class OutputSizes:
+    """Sizes of everything a SkillOutput sends to the UI"""
+    visualizations: List[VisualizationSize] = field(default_factory=list)
+    exports: List[ExportSize] = field(default_factory=list)
+
+    @property
+    def layout_bytes(self) -> int:
+        return sum(viz.layout_bytes for viz in self.visualizations)
+
+    @property
+    def compressed_bytes(self) -> int:
+        return sum(viz.compressed_bytes for viz in self.visualizations)
+
+
+@dataclass
+class BudgetViolation:
+    """A size over its warn or fail limit"""
+    level: str
+    metric: str
+    subject: str
+    value: int
+    limit: int
+
+
+def measure_output(result, encode: bool = True) -> OutputSizes:
+    """
+    Measure a SkillOutput
+
+    Args:
+        result: SkillOutput (lazy visualizations are rendered)
+        encode: Also report encoded export sizes. File-backed exports (ExportFile, WorkbookFile)
+            report their file size, a started background export its encoding; other exports
+            are encoded in the format choose_format picks into a sink that only counts bytes
+
+    Returns:
+        OutputSizes
+    """
+    from builder_utils.export_encoders import choose_format, data_size_bytes, encoded_size_bytes
+
+    sizes = OutputSizes()
+    for viz in result.visualizations or []:
+        layout = viz.layout.encode("utf-8")
+        size = VisualizationSize(viz.title or "", len(layout), len(gzip.compress(layout, compresslevel=GZIP_LEVEL)))
+        minify_result = getattr(viz, "minify_result", None)
+        if minify_result is not None:
+            size.minified_saved_bytes, size.minified_reduction_pct = minify_result.saved_bytes, minify_result.reduction_pct
+        try:
+            document = json.loads(layout)
+        except ValueError:
+            document = None
+        for component in _components(document):
+            if component.get("type") == "DataTable":
+                size.datatables += 1
+                size.datatable_cells += _table_cells(component)
+            elif component.get("type") == "HighchartsChart":
+                size.charts += 1
+                size.highcharts_points += _chart_points(component.get("options"))
+        sizes.visualizations.append(size)
+
+    for export in result.export_data or []:
+        data = export.data
+        shape = getattr(data, "shape", None)
+        size = ExportSize(
+            name=export.name,
+            rows=shape[0] if shape else None,
+            columns=shape[1] if shape and len(shape) > 1 else None,
+            memory_bytes=0,
+        )
+        if hasattr(data, "path"):
+            size.on_disk = True
+            size.encoded_bytes = data.size_bytes
+            size.format = getattr(data, "format", None) or os.path.splitext(data.path)[1].lstrip(".")
+        else:
+            size.memory_bytes = data_size_bytes(data)
+            if encode:
+                if getattr(export, "started", False):
+                    encoded = export.wait()
+                    size.encoded_bytes, size.format = encoded.size_bytes, encoded.format
+                else:
+                    size.format = getattr(export, "format", None) or choose_format(data)
+                    size.encoded_bytes = encoded_size_bytes(export, size.format)
+        sizes.exports.append(size)
+    return sizes
+
+
+def output_totals(result) -> dict:
+    """
+    Flat totals of a SkillOutput for one-line-per-run reports (batch results, sweep matrices)
+
+    Export bytes are in-memory bytes, or file size for file-backed exports; nothing is encoded.
+    """
+    sizes = measure_output(result, encode=False)
+    return {
+        "visualizations": len(sizes.visualizations),
+        "layout_bytes": sizes.layout_bytes,
+        "exports": len(sizes.exports),
+        "export_rows": sum(export.rows or 0 for export in sizes.exports),
+        "export_bytes": sum(export.encoded_bytes if export.on_disk else export.memory_bytes for export in sizes.exports),
+        "final_prompt_chars": len(result.final_prompt or ""),
+    }
+
+
+def load_budgets(path: Optional[str] = None, skill_name: Optional[str] = None) -> Dict[str, Dict[str, Optional[int]]]:
+    """
+    Budgets from DEFAULT_BUDGETS overlaid with a JSON budgets file
+
+    The file (default: output_budgets.json in the current directory, if present) maps metric
+    names to {"warn": n, "fail": n}; a "skills" object holds per-skill overrides in the same
+    shape. Unknown metric names raise ValueError.
+    """
+    budgets = {metric: dict(levels) for metric, levels in DEFAULT_BUDGETS.items()}
+    if path is None:
+        path = BUDGETS_FILE if os.path.exists(BUDGETS_FILE) else None
+    if path is None:
+        return budgets
+
+    with open(path, encoding="utf-8") as budgets_file:
+        document = json.load(budgets_file)
+    overrides = [{key: value for key, value in document.items() if key != "skills"}]
+    if skill_name:
+        overrides.append(document.get("skills", {}).get(skill_name, {}))
+    for override in overrides:
+        for metric, levels in override.items():
+            if metric not in budgets:
+                raise ValueError(f"{path}: unknown budget '{metric}' (expected one of {', '.join(budgets)})")
+            budgets[metric].update(levels)
+    return budgets
+
+
+def check_budgets(sizes: OutputSizes, budgets: Dict[str, Dict[str, Optional[int]]]) -> List[BudgetViolation]:
+    """Every size over a limit; a size over its fail limit is reported once, as a failure"""
+    measurements = []
+    for viz in sizes.visualizations:
+        subject = f"visualization '{viz.title}'"
+        measurements += [
+            ("layout_bytes", subject, viz.layout_bytes),
+            ("compressed_bytes", subject, viz.compressed_bytes),
+            ("datatable_cells", subject, viz.datatable_cells),
+            ("highcharts_points", subject, viz.highcharts_points),
+        ]
+    for export in sizes.exports:
+        subject = f"export '{export.name}'"
+        if not export.on_disk:
+            measurements.append(("export_memory_bytes", subject, export.memory_bytes))
+        if export.encoded_bytes is not None:
+            measurements.append(("export_encoded_bytes", subject, export.encoded_bytes))
+
+    violations = []
+    for metric, subject, value in measurements:
+        levels = budgets.get(metric, {})
+        for level in ("fail", "warn"):
+            limit = levels.get(level)
+            if limit is not None and value > limit:
+                violations.append(BudgetViolation(level, metric, subject, value, limit))
+                break
+    return violations
+
+
+def print_output_sizes(sizes: OutputSizes, violations: List[BudgetViolation]):
+    print(f"\n📏 Output sizes:")
+    for viz in sizes.visualizations:
+        details = [f"{viz.layout_bytes:,} bytes", f"{viz.compressed_bytes:,} gzipped"]
+        if viz.datatables:
+            details.append(f"{viz.datatable_cells:,} table cells")
+        if viz.charts:
+            details.append(f"{viz.highcharts_points:,} chart points")
+        if viz.minified_saved_bytes is not None:
+            details.append(f"minified -{viz.minified_saved_bytes:,} bytes ({viz.minified_reduction_pct:.1f}%)")
+        print(f"  📊 {viz.title}: {', '.join(details)}")
+    for export in sizes.exports:
+        details = [] if export.on_disk else [f"{export.memory_bytes:,} bytes in memory"]
+        if export.rows is not None:
+            details.append(f"{export.rows:,} x {export.columns} cells")
+        if export.encoded_bytes is not None:
+            where = " on disk" if export.on_disk else ""
+            details.append(f"{export.encoded_bytes:,} bytes{where} as {export.format}")
+        print(f"  📁 {export.name}: {', '.join(details)}")
+    if sizes.visualizations:
+        print(f"  Total layout: {sizes.layout_bytes:,} bytes ({sizes.compressed_bytes:,} gzipped)")
+
+    for violation in violations:
+        marker = "❌" if violation.level == "fail" else "⚠️"
+        print(f"{marker} {violation.subject}: {violation.metric} {violation.value:,} is over the {violation.level} budget of {violation.limit:,}")
+
+
+def _components(node: Any) -> Iterator[dict]:
+    """Every dict with a "type" in a layout document, depth first"""
+    if isinstance(node, dict):
+        if "type" in node:
+            yield node
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _components(value)
+    elif isinstance(node, list):
+        for item in node:
+            if isinstance(item, (dict, list)):
+                yield from _components(item)
+
+
+def _table_cells(table: dict) -> int:
+    rows = table.get("data") or []
+    if not isinstance(rows, list):
+        return 0
+    columns = len(table.get("columns") or [])
+    cells = 0
+    for row in rows:
+        cells += len(row) if isinstance(row, (list, dict)) else columns
+    return cells
+
+
+def _chart_points(options: Any) -> int:
+    if not isinstance(options, dict):
+        return 0
+    series = options.get("series") or []
+    if isinstance(series, dict):
+        series = [series]
+    return sum(len(item.get("data") or []) for item in series if isinstance(item, dict))
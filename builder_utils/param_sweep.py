@@ -0,0 +1,272 @@
+"""
+Parameter Sweep
+Run a skill over the Cartesian product (or a sample) of its constrained parameter values and report a latency/size matrix
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from builder_utils.skill_registry import SkillEntry, SkillRegistry
+
+SLOW_FACTOR = 3.0
+
+Axis = Tuple[str, List[Any]]
+
+
+@dataclass
+class SweepPoint:
+    """One parameter combination and how the skill did with it"""
+    parameters: Dict[str, Any]
+    status: str
+    runs: List[float] = field(default_factory=list)
+    sizes: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def seconds(self) -> float:
+        """Median latency over the timed runs"""
+        return statistics.median(self.runs) if self.runs else 0.0
+
+
+def sweep_axes(entry: SkillEntry, fixed: Optional[dict] = None, only: Optional[Sequence[str]] = None) -> List[Axis]:
+    """
+    Parameters to sweep and the values each one takes
+
+    Every parameter with constrained_values becomes an axis, except those pinned in fixed or
+    left out of only. Multi-value parameters are swept one value at a time ([value]).
+    """
+    fixed = fixed or {}
+    axes = []
+    for parameter in entry.parameters:
+        if not parameter.constrained_values or parameter.name in fixed:
+            continue
+        if only and parameter.name not in only:
+            continue
+        values = [[value] for value in parameter.constrained_values] if parameter.is_multi else list(parameter.constrained_values)
+        axes.append((parameter.name, values))
+    return axes
+
+
+def default_parameters(entry: SkillEntry) -> dict:
+    """The skill's declared default values, as the platform would fill them in"""
+    return {parameter.name: parameter.default_value for parameter in entry.parameters if parameter.default_value is not None}
+
+
+def count_combinations(axes: List[Axis]) -> int:
+    total = 1
+    for _, values in axes:
+        total *= len(values)
+    return total
+
+
+def combinations(axes: List[Axis], fixed: Optional[dict] = None, sample: Optional[int] = None, seed: int = 0) -> List[dict]:
+    """
+    Parameter dicts for the full product of the axes, or for `sample` of them picked at random
+
+    Each dict starts from fixed (typically the defaults plus pinned values) with the swept
+    values on top.
+    Sampled combinations are drawn by index, so a huge product is never materialized, and a
+    given seed always picks the same subset.
+    """
+    total = count_combinations(axes)
+    if sample is not None and sample < total:
+        indexes = sorted(random.Random(seed).sample(range(total), sample))
+    else:
+        indexes = range(total)
+
+    result = []
+    for index in indexes:
+        # Decode the index as a mixed-radix number, last axis varying fastest
+        positions = []
+        for _, values in reversed(axes):
+            index, position = divmod(index, len(values))
+            positions.append(position)
+        swept = {name: values[position] for (name, values), position in zip(axes, reversed(positions))}
+        result.append({**(fixed or {}), **swept})
+    return result
+
+
+def run_sweep(skill_name: str, parameter_sets: List[dict], repeat: int = 1, replay_dir: Optional[str] = None,
+              record: bool = False, verbose: bool = True) -> List[SweepPoint]:
+    """
+    Run the skill once per parameter set (plus one untimed warm-up run) in this process
+
+    Combinations run one after another so their latencies are not distorted by each other.
+
+    Args:
+        skill_name: Skill registered in skills.txt
+        parameter_sets: Output of combinations()
+        repeat: Timed runs per combination; the matrix reports the median
+        replay_dir: Answer SQL queries from this recordings directory (see sql_replay)
+        record: With replay_dir, run queries for real and record them instead
+        verbose: Print a line per combination
+
+    Returns:
+        One SweepPoint per parameter set, in order
+    """
+    from builder_utils.output_sizes import output_totals
+    from builder_utils.phase_timing import PhaseTimer
+    from builder_utils.run_skill import run_skill
+    from builder_utils.sql_replay import sql_replay
+
+    skill_function = SkillRegistry().load_function(skill_name)
+    if skill_function is None:
+        raise ValueError(f"Skill '{skill_name}' is not registered in skills.txt")
+
+    backend = sql_replay(replay_dir, record=record) if replay_dir else contextlib.nullcontext()
+    points = []
+    with backend:
+        if parameter_sets:
+            # Pay first-call costs (lazy imports, caches) outside the measurements
+            try:
+                run_skill(skill_name, dict(parameter_sets[0]), skill_function=skill_function)
+            except Exception:
+                pass
+
+        for number, parameters in enumerate(parameter_sets, 1):
+            point = SweepPoint(parameters=parameters, status="ok")
+            for _ in range(max(1, repeat)):
+                start = time.perf_counter()
+                try:
+                    result = run_skill(skill_name, dict(parameters), skill_function=skill_function, timer=PhaseTimer())
+                except Exception as e:
+                    point.runs.append(time.perf_counter() - start)
+                    point.status = "error"
+                    point.error = str(e)
+                    break
+                point.runs.append(time.perf_counter() - start)
+                point.sizes = output_totals(result)
+            points.append(point)
+
+            if verbose:
+                marker = "✅" if point.status == "ok" else "❌"
+                print(f"{marker} [{number}/{len(parameter_sets)}] {point.seconds * 1000:8.1f} ms  {_describe(parameters)}")
+    return points
+
+
+def slow_points(points: List[SweepPoint], factor: float = SLOW_FACTOR) -> List[SweepPoint]:
+    """Successful combinations slower than factor x the median combination"""
+    ok = [point for point in points if point.status == "ok"]
+    if not ok:
+        return []
+    median = statistics.median(point.seconds for point in ok)
+    return sorted((point for point in ok if point.seconds > factor * median), key=lambda p: p.seconds, reverse=True)
+
+
+def latency_by_value(points: List[SweepPoint], axes: List[Axis]) -> Dict[str, Dict[str, float]]:
+    """Mean latency of the successful runs for each value of each swept parameter"""
+    table = {}
+    for name, values in axes:
+        table[name] = {}
+        for value in values:
+            seconds = [p.seconds for p in points if p.status == "ok" and p.parameters.get(name) == value]
+            if seconds:
+                table[name][_format_value(value)] = statistics.mean(seconds)
+    return table
+
+
+def write_matrix_csv(points: List[SweepPoint], path: str):
+    """One row per combination: parameters, status, latency (ms) and output sizes"""
+    parameter_names = list(dict.fromkeys(name for point in points for name in point.parameters))
+    size_names = list(dict.fromkeys(name for point in points for name in point.sizes))
+    with open(path, "w", newline="", encoding="utf-8") as matrix_file:
+        writer = csv.writer(matrix_file)
+        writer.writerow([*parameter_names, "status", "median_ms", "min_ms", "max_ms", *size_names, "error"])
+        for point in points:
+            writer.writerow([
+                *(_format_value(point.parameters.get(name)) for name in parameter_names),
+                point.status,
+                f"{point.seconds * 1000:.2f}",
+                f"{min(point.runs) * 1000:.2f}" if point.runs else "",
+                f"{max(point.runs) * 1000:.2f}" if point.runs else "",
+                *(point.sizes.get(name, "") for name in size_names),
+                point.error or "",
+            ])
+
+
+def print_sweep_report(points: List[SweepPoint], axes: List[Axis], top: int = 5):
+    ok = [point for point in points if point.status == "ok"]
+    failed = [point for point in points if point.status != "ok"]
+    print(f"\n📋 Sweep: {len(ok)}/{len(points)} combinations succeeded")
+    if ok:
+        latencies = [point.seconds for point in ok]
+        print(f"   Latency: median {statistics.median(latencies) * 1000:.1f} ms, max {max(latencies) * 1000:.1f} ms")
+
+    print(f"\n🐢 Slowest combinations:")
+    print(f"  {'ms':>9}  {'layout bytes':>12}  {'export bytes':>12}  parameters")
+    for point in sorted(ok, key=lambda p: p.seconds, reverse=True)[:top]:
+        print(f"  {point.seconds * 1000:9.1f}  {point.sizes.get('layout_bytes', 0):12,}  {point.sizes.get('export_bytes', 0):12,}  {_describe(point.parameters)}")
+
+    slow = slow_points(points)
+    if slow:
+        print(f"\n⚠️ {len(slow)} combination(s) take more than {SLOW_FACTOR:.0f}x the median latency")
+
+    print(f"\n📊 Mean latency by parameter value (ms):")
+    for name, values in latency_by_value(points, axes).items():
+        print(f"  {name}: " + ", ".join(f"{value}={seconds * 1000:.1f}" for value, seconds in values.items()))
+
+    if failed:
+        print(f"\n❌ Failed combinations ({len(failed)}):")
+        for point in failed[:top]:
+            print(f"  {_describe(point.parameters)}: {point.error}")
+
+
+def _format_value(value) -> str:
+    if isinstance(value, list):
+        return "+".join(map(str, value))
+    return "" if value is None else str(value)
+
+
+def _describe(parameters: dict) -> str:
+    return " ".join(f"{name}={_format_value(value)}" for name, value in parameters.items())
+
+
+def main():
+    """Sweep a skill's constrained parameters and report latency and output size per combination"""
+    parser = argparse.ArgumentParser(description="Run a skill over every combination of its constrained_values and report a latency/size matrix")
+    parser.add_argument('skill_name', help='Skill registered in skills.txt')
+    parser.add_argument('--parameters', '-p', default='{}', help='JSON of parameters to hold fixed (not swept)')
+    parser.add_argument('--only', nargs='+', help='Sweep only these parameters')
+    parser.add_argument('--sample', type=int, help='Run this many randomly chosen combinations instead of all of them')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for --sample (default: 0)')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed runs per combination; the median is reported (default: 1)')
+    parser.add_argument('--replay', metavar='DIR', help='Answer SQL queries from recordings in DIR instead of the database')
+    parser.add_argument('--record', action='store_true', help='With --replay, query the database and record the results into DIR')
+    parser.add_argument('--csv', help='Write the full matrix to this CSV file')
+    parser.add_argument('--top', type=int, default=5, help='Slowest combinations to list (default: 5)')
+
+    args = parser.parse_args()
+    if args.record and not args.replay:
+        parser.error("--record needs --replay DIR")
+
+    entry = SkillRegistry().get(args.skill_name)
+    if entry is None:
+        print(f"❌ Skill '{args.skill_name}' is not registered in skills.txt")
+        sys.exit(1)
+
+    fixed = json.loads(args.parameters)
+    axes = sweep_axes(entry, fixed=fixed, only=args.only)
+    total = count_combinations(axes)
+    parameter_sets = combinations(axes, fixed={**default_parameters(entry), **fixed}, sample=args.sample, seed=args.seed)
+
+    print(f"🔬 Sweeping {entry.function}: " + ", ".join(f"{name} ({len(values)})" for name, values in axes))
+    print(f"   {len(parameter_sets)} of {total} combinations, {args.repeat} timed run(s) each" + (f", SQL from {args.replay}" if args.replay else ""))
+
+    points = run_sweep(entry.function, parameter_sets, repeat=args.repeat, replay_dir=args.replay, record=args.record)
+    print_sweep_report(points, axes, top=args.top)
+
+    if args.csv:
+        write_matrix_csv(points, args.csv)
+        print(f"\n💾 Matrix written to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
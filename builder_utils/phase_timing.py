@@ -0,0 +1,143 @@
+"""
+Phase Timing
+Per-phase wall-clock breakdown of a skill run (fetch, transform, layout, serialize, export)
+"""
+
+import contextlib
+import contextvars
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+PHASES = ("fetch", "transform", "layout", "serialize", "export")
+OTHER_PHASE = "other"
+
+_active_timer: contextvars.ContextVar = contextvars.ContextVar("phase_timer", default=None)
+
+
+@dataclass
+class PhaseStats:
+    """Exclusive time spent in one phase"""
+    name: str
+    seconds: float = 0.0
+    calls: int = 0
+
+
+class PhaseTimer:
+    """
+    Collects phase timings while it is active.
+
+    Times are exclusive: when phases nest (a layout phase that serializes), the inner phase's
+    time is charged to the inner phase only, so the phases plus "other" add up to the total.
+    Phases entered on other threads (e.g. background export encoders) are not recorded; the
+    time the skill spends waiting for them is.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, PhaseStats] = {}
+        self.total_seconds = 0.0
+        self._stack: List[list] = []
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Record phases entered in this context, and the total time spent inside it"""
+        token = _active_timer.set(self)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.total_seconds += time.perf_counter() - start
+            _active_timer.reset(token)
+
+    def enter(self, name: str):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def exit(self):
+        name, start, child_seconds = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        stats = self.phases.setdefault(name, PhaseStats(name))
+        stats.seconds += elapsed - child_seconds
+        stats.calls += 1
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    @property
+    def other_seconds(self) -> float:
+        """Time inside the timer that no phase accounts for (the skill's own code)"""
+        return max(0.0, self.total_seconds - sum(stats.seconds for stats in self.phases.values()))
+
+    def breakdown(self) -> List[PhaseStats]:
+        """Standard phases first, then custom phases in first-seen order, then "other" """
+        ordered = [self.phases[name] for name in PHASES if name in self.phases]
+        ordered += [stats for name, stats in self.phases.items() if name not in PHASES]
+        return ordered + [PhaseStats(OTHER_PHASE, self.other_seconds, 0)]
+
+    def to_dict(self) -> dict:
+        return {
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "phases": [
+                {
+                    "name": stats.name,
+                    "ms": round(stats.seconds * 1000, 3),
+                    "calls": stats.calls,
+                    "percent": round(100 * stats.seconds / self.total_seconds, 1) if self.total_seconds else 0.0,
+                }
+                for stats in self.breakdown()
+            ],
+        }
+
+
+@contextlib.contextmanager
+def phase(name: str):
+    """
+    Time a block as one phase of the current skill run
+
+    Does nothing (beyond a context-variable lookup) when no PhaseTimer is active, so skills
+    can leave their phase blocks in place in production.
+
+        with phase("fetch"):
+            df = get_chart_data(dimension, metrics, limit)
+    """
+    timer = _active_timer.get()
+    if timer is None:
+        yield
+        return
+    timer.enter(name)
+    try:
+        yield
+    finally:
+        timer.exit()
+
+
+def current_timer() -> Optional[PhaseTimer]:
+    return _active_timer.get()
+
+
+def print_phase_table(timer: PhaseTimer):
+    print(f"\n⏱️ Phase timing (total {timer.total_seconds * 1000:.1f} ms):")
+    print(f"  {'phase':<12} {'ms':>10} {'%':>7} {'calls':>6}")
+    for stats in timer.breakdown():
+        percent = 100 * stats.seconds / timer.total_seconds if timer.total_seconds else 0.0
+        calls = str(stats.calls) if stats.calls else ""
+        print(f"  {stats.name:<12} {stats.seconds * 1000:10.1f} {percent:6.1f}% {calls:>6}")
+
+
+def print_phase_delta(timer: PhaseTimer, previous: PhaseTimer):
+    """Print the breakdown next to an earlier run's, with the change per phase"""
+    before = {stats.name: stats.seconds for stats in previous.breakdown()}
+    change = (timer.total_seconds - previous.total_seconds) * 1000
+    print(f"\n⏱️ Phase timing (total {timer.total_seconds * 1000:.1f} ms, {change:+.1f} ms vs previous run):")
+    print(f"  {'phase':<12} {'ms':>10} {'previous':>10} {'delta':>10}")
+    names = [stats.name for stats in timer.breakdown()]
+    names[-1:-1] = [name for name in before if name not in names]
+    seconds = {stats.name: stats.seconds for stats in timer.breakdown()}
+    for name in names:
+        now, then = seconds.get(name, 0.0), before.get(name, 0.0)
+        print(f"  {name:<12} {now * 1000:10.1f} {then * 1000:10.1f} {(now - then) * 1000:+10.1f}")
+
+
+def write_phase_report(timer: PhaseTimer, path: str, **details):
+    """Save the breakdown as JSON, with extra details (skill, parameters) at the top level"""
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump({**details, **timer.to_dict()}, report_file, indent=2, default=str)
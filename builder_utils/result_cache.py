@@ -0,0 +1,326 @@
+"""
+Result Cache
+SkillOutputs stored on disk, keyed by skill and helper source, parameters and the data epoch
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CACHE_DIR = ".skill_output_cache"
+EPOCH_FILE = "EPOCH"
+EPOCH_ENV = "SKILL_DATA_EPOCH"
+ENTRY_SUFFIX = ".pkl"
+CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Settings that pick the data a skill reads (database, dataset, instance, tenant)
+DATA_ENVIRONMENT_KEYS = ("DATABASE_ID", "DATASET_ID", "AR_URL", "AR_TENANT_ID")
+
+
+@dataclass
+class CacheStats:
+    """What is in the cache directory"""
+    entries: int
+    total_bytes: int
+    epoch: str
+    directory: str
+
+
+class ResultCache:
+    """
+    Complete SkillOutputs (visualizations, exports, final_prompt) pickled one file per key.
+
+    A key covers the skill file, every repo file it imports (followed statically with ast,
+    so helpers in builder_utils/ or <skill>_skill/ count), the parameters as canonical JSON,
+    the settings that pick the data (DATA_ENVIRONMENT_KEYS, from the environment or .env), and
+    the data epoch: bump_epoch() or SKILL_DATA_EPOCH invalidates everything computed from
+    older data. Entries are written to a temporary file and renamed into place, so readers in
+    other threads or processes see a whole entry or none. A hit refreshes the entry's mtime,
+    which is what least-recently-used eviction sorts by.
+    """
+
+    def __init__(self, root: Optional[Path] = None, directory: Optional[Path] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root) if root is not None else Path.cwd()
+        self.directory = Path(directory) if directory is not None else self.root / CACHE_DIR
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def key(self, skill_name: str, parameters: Optional[dict] = None) -> str:
+        """Cache key for a run; raises ValueError when the skill's file cannot be found"""
+        skill_file = self._skill_file(skill_name)
+        digest = hashlib.sha256(f"v{CACHE_VERSION}\n{skill_name}\n".encode("utf-8"))
+        for path in source_files(skill_file, self.root):
+            digest.update(f"{path.relative_to(self.root.resolve())}\n".encode("utf-8"))
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        digest.update(normalize_parameters(parameters).encode("utf-8"))
+        digest.update(f"\nenvironment={json.dumps(self.data_environment(), sort_keys=True)}".encode("utf-8"))
+        digest.update(f"\nepoch={self.epoch()}".encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    def get(self, key: str):
+        """The cached SkillOutput, or None on a miss (including an entry evicted while reading)"""
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as entry_file:
+                result = pickle.load(entry_file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result) -> Optional[int]:
+        """
+        Store a SkillOutput (its deferred work must be finished)
+
+        Returns:
+            Bytes written, or None when the output cannot be pickled, has exports that live in
+            files (a pickled path would outlive the file), or is larger than max_bytes
+        """
+        if file_backed_exports(result):
+            return None
+        try:
+            payload = pickle.dumps(plain_output(result), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        if len(payload) > self.max_bytes:
+            return None
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{time.monotonic_ns()}.tmp")
+        try:
+            temp_path.write_bytes(payload)
+            os.replace(temp_path, path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return None
+        self.evict()
+        return len(payload)
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits max_entries and max_bytes; returns how many"""
+        entries = self._entries()
+        entries.sort(key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            path, _, size = entries.pop(0)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """Delete every entry; returns how many"""
+        entries = self._entries()
+        for path, _, _ in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
+
+    def data_environment(self) -> Dict[str, Optional[str]]:
+        """DATA_ENVIRONMENT_KEYS as a skill run sees them: the environment, falling back to the root's .env"""
+        from dotenv import dotenv_values
+
+        dotenv = dotenv_values(self.root / ".env")
+        return {name: os.getenv(name, dotenv.get(name)) for name in DATA_ENVIRONMENT_KEYS}
+
+    def epoch(self) -> str:
+        """The data epoch: SKILL_DATA_EPOCH if set, otherwise the counter in the cache directory"""
+        if os.getenv(EPOCH_ENV):
+            return os.environ[EPOCH_ENV]
+        try:
+            return (self.directory / EPOCH_FILE).read_text(encoding="utf-8").strip() or "0"
+        except OSError:
+            return "0"
+
+    def bump_epoch(self) -> str:
+        """Start a new data epoch (after the underlying data changed); returns it"""
+        try:
+            epoch = str(int(self.epoch()) + 1)
+        except ValueError:
+            epoch = "1"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_path = self.directory / f"{EPOCH_FILE}.{os.getpid()}.tmp"
+        temp_path.write_text(epoch, encoding="utf-8")
+        os.replace(temp_path, self.directory / EPOCH_FILE)
+        return epoch
+
+    def stats(self) -> CacheStats:
+        entries = self._entries()
+        return CacheStats(len(entries), sum(size for _, _, size in entries), self.epoch(), str(self.directory))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def _entries(self) -> List[Tuple[Path, float, int]]:
+        entries = []
+        try:
+            paths = list(self.directory.glob(f"*{ENTRY_SUFFIX}"))
+        except OSError:
+            return entries
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _skill_file(self, skill_name: str) -> Path:
+        from builder_utils.skill_registry import SkillRegistry
+
+        entry = SkillRegistry(self.root).get(skill_name)
+        path = self.root / entry.file if entry is not None else self.root / f"{skill_name}.py"
+        if not path.exists():
+            raise ValueError(f"Cannot cache '{skill_name}': no skill file found")
+        return path
+
+
+def cached_run_skill(cache: ResultCache, skill_name: str, parameters: Optional[dict] = None, skill_function=None,
+                     timer=None) -> Tuple[object, bool]:
+    """
+    run_skill through a ResultCache
+
+    A hit returns the stored output without calling the skill. A miss runs the skill to
+    completion (lazy layouts rendered, background exports encoded) and stores the result.
+
+    Returns:
+        (SkillOutput, whether it came from the cache)
+    """
+    from builder_utils.phase_timing import PhaseTimer
+    from builder_utils.run_skill import run_skill
+
+    key = cache.key(skill_name, parameters)
+    result = cache.get(key)
+    if result is not None:
+        return result, True
+
+    result = run_skill(skill_name, parameters, skill_function=skill_function, timer=timer or PhaseTimer())
+    cache.put(key, result)
+    return result, False
+
+
+def file_backed_exports(result) -> List[str]:
+    """Names of exports whose data is a file on disk (ExportFile, WorkbookFile) rather than in memory"""
+    return [export.name for export in result.export_data or [] if hasattr(export.data, "path")]
+
+
+def plain_output(result):
+    """A copy of a SkillOutput with lazy visualizations and background exports as plain models"""
+    from skill_framework import ExportData, SkillOutput, SkillVisualization
+
+    def plain_visualizations(visualizations):
+        return [SkillVisualization(title=viz.title, layout=viz.layout) for viz in visualizations or []]
+
+    fields = {name: getattr(result, name) for name in SkillOutput.model_fields}
+    fields.update(
+        visualizations=plain_visualizations(result.visualizations),
+        alt_visualizations=plain_visualizations(result.alt_visualizations),
+        export_data=[ExportData(name=export.name, data=export.data) for export in result.export_data or []],
+    )
+    return SkillOutput(**fields)
+
+
+def normalize_parameters(parameters: Optional[dict]) -> str:
+    """Parameters as canonical JSON: key order does not matter"""
+    return json.dumps(parameters or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def source_files(path: Path, root: Path) -> List[Path]:
+    """
+    The file and every repo file it imports, directly or through other repo files
+
+    Imports are read with ast, so conditional and function-level imports count too. Modules
+    outside root (the standard library, site-packages, virtualenvs) are ignored.
+    """
+    from builder_utils.skill_profiler import is_repo_file
+
+    root = Path(root).resolve()
+    seen: Dict[Path, None] = {}
+    pending = [Path(path).resolve()]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen[current] = None
+        try:
+            tree = ast.parse(current.read_bytes(), filename=str(current))
+        except (OSError, SyntaxError):
+            continue
+        for module_name in _imported_modules(tree, current, root):
+            for candidate in _module_paths(module_name, root):
+                if candidate not in seen and is_repo_file(str(candidate), str(root)):
+                    pending.append(candidate)
+    return sorted(seen, key=lambda file: str(file))
+
+
+def _imported_modules(tree: ast.AST, path: Path, root: Path) -> List[str]:
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                package = path.parent
+                for _ in range(node.level - 1):
+                    package = package.parent
+                if package != root and root not in package.parents:
+                    continue
+                base = ".".join(package.relative_to(root).parts)
+                module = ".".join(filter(None, [base, node.module]))
+            else:
+                module = node.module or ""
+            if module:
+                modules.append(module)
+            # "from package import module" imports a submodule
+            modules.extend(f"{module}.{alias.name}" if module else alias.name for alias in node.names if alias.name != "*")
+    return modules
+
+
+def _module_paths(module_name: str, root: Path) -> List[Path]:
+    """Repo files a module name refers to: the module and the packages it is inside"""
+    parts = module_name.split(".")
+    paths = []
+    for depth in range(1, len(parts) + 1):
+        base = root.joinpath(*parts[:depth])
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if candidate.is_file():
+                paths.append(candidate.resolve())
+    return paths
+
+
+def main():
+    """Inspect or reset the result cache"""
+    parser = argparse.ArgumentParser(description='Inspect the run-skill result cache, clear it, or start a new data epoch')
+    parser.add_argument('command', choices=['stats', 'clear', 'bump-epoch'], help='stats, clear, or bump-epoch (invalidate results computed from older data)')
+    parser.add_argument('--dir', help=f'Cache directory (default: {CACHE_DIR})')
+
+    args = parser.parse_args()
+    cache = ResultCache(directory=args.dir)
+
+    if args.command == 'clear':
+        print(f"🧹 Removed {cache.clear()} cached result(s) from {cache.directory}")
+    elif args.command == 'bump-epoch':
+        print(f"🔄 Data epoch is now {cache.bump_epoch()}; earlier results will not be reused")
+    else:
+        stats = cache.stats()
+        print(f"🗄️ {stats.directory}: {stats.entries} result(s), {stats.total_bytes:,} bytes, data epoch {stats.epoch}")
+
+
+if __name__ == "__main__":
+    main()
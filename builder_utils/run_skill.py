@@ -1,24 +1,30 @@
-from dotenv import load_dotenv
-from skill_framework import SkillInput, SkillOutput
 import argparse
+import contextlib
 import os
-import pandas
 import json
 import types
 import importlib.util
 import sys
 from pathlib import Path
+from builder_utils.skill_registry import SkillRegistry
 
-def run_skill(skill_name: str, parameters: dict = None) -> SkillOutput:
+def run_skill(skill_name: str, parameters: dict = None, skill_function=None, timer=None) -> "SkillOutput":
     """Run a skill locally with optional parameters
 
     Args:
         skill_name (str): Name of the skill to execute (function name or file name)
         parameters (dict, optional): Dictionary of parameters to pass to the skill. Defaults to None.
+        skill_function (optional): Already-loaded skill function to call instead of looking it up
+        timer (PhaseTimer, optional): Collect per-phase timings; lazy layouts are rendered and
+            started background exports awaited inside the timer so their cost is included
 
     Returns:
         SkillOutput: The result from the skill execution
     """
+    # Imported here so that the run-skill client stays light when a warm daemon does the work
+    from dotenv import load_dotenv
+    from skill_framework import SkillInput, SkillOutput
+
     load_dotenv()
 
     # Prepare the parameters for the skill call
@@ -34,24 +40,51 @@ def run_skill(skill_name: str, parameters: dict = None) -> SkillOutput:
     skill_input = SkillInput(assistant_id='local-test', arguments=args)
 
     # Try to find and import the skill function
-    skill_function = _find_skill_function(skill_name)
+    if skill_function is None:
+        skill_function = _find_skill_function(skill_name)
 
     if skill_function is None:
         raise Exception(f"Skill function '{skill_name}' not found")
 
     # Execute the skill
     try:
-        result = skill_function(skill_input)
-        if not isinstance(result, SkillOutput):
-            raise Exception(f"Skill function must return SkillOutput, got {type(result)}")
+        with timer.activate() if timer is not None else contextlib.nullcontext():
+            result = skill_function(skill_input)
+            if not isinstance(result, SkillOutput):
+                raise Exception(f"Skill function must return SkillOutput, got {type(result)}")
+            if timer is not None:
+                _finish_deferred_work(result)
         return result
     except Exception as e:
         raise Exception(f"Error executing skill '{skill_name}': {str(e)}")
 
+def _finish_deferred_work(result):
+    """Render lazy visualizations and wait for started background exports, timing each as its phase"""
+    from builder_utils.background_export import BackgroundExport
+    from builder_utils.lazy_visualization import LazySkillVisualization
+    from builder_utils.phase_timing import phase
+
+    pending_layouts = [viz for viz in result.visualizations or [] if isinstance(viz, LazySkillVisualization) and not viz.is_rendered]
+    if pending_layouts:
+        with phase("layout"):
+            for viz in pending_layouts:
+                viz.render()
+
+    pending_exports = [export for export in result.export_data or [] if isinstance(export, BackgroundExport) and export.started]
+    if pending_exports:
+        with phase("export"):
+            for export in pending_exports:
+                export.wait()
+
 def _find_skill_function(skill_name: str):
     """Find and import a skill function by name or file"""
 
-    # First, try to find a Python file with the skill name
+    # Skills registered in skills.txt resolve through the cached registry index
+    skill_function = SkillRegistry().load_function(skill_name)
+    if skill_function is not None:
+        return skill_function
+
+    # Otherwise, try to find a Python file with the skill name
     current_dir = Path.cwd()
     skill_file = current_dir / f"{skill_name}.py"
 
@@ -101,36 +134,177 @@ def _find_skill_function(skill_name: str):
 
     return None
 
+def execute_and_report(skill_name: str, parameters: dict, export_dir: str = None,
+                       export_format: str = None, export_workbook: str = None, skill_function=None,
+                       timing: bool = False, timing_json: str = None, sizes: bool = False, budgets: str = None,
+                       cache: bool = False):
+    """
+    Run a skill and print its result summary (shared by the CLI and the warm runner daemon)
+
+    With sizes (or budgets), the output sizes are reported and checked against the budgets (the budgets
+    file, or output_budgets.json when present; the built-in defaults only warn);
+    OutputBudgetExceeded is raised after the report when a fail-level budget is exceeded. With cache, the output is served from (or
+    stored in) the ResultCache and a hit does not run the skill.
+    """
+    from builder_utils.phase_timing import PhaseTimer, print_phase_table, write_phase_report
+
+    print(f"Running skill '{skill_name}' with parameters: {parameters}")
+    timer = PhaseTimer() if timing or timing_json else None
+    if cache:
+        from builder_utils.result_cache import ResultCache, cached_run_skill, file_backed_exports
+        result, hit = cached_run_skill(ResultCache(), skill_name, parameters, skill_function=skill_function, timer=timer)
+        if hit:
+            print("♻️ Served from the result cache")
+            timer = None
+        elif file_backed_exports(result):
+            print(f"⚠️ Not cached: exports written to files ({', '.join(file_backed_exports(result))})")
+        else:
+            print("💾 Stored in the result cache")
+    else:
+        result = run_skill(skill_name, parameters, skill_function=skill_function, timer=timer)
+    print_skill_result(result, export_dir=export_dir, export_format=export_format, export_workbook=export_workbook)
+
+    if timer is not None:
+        print_phase_table(timer)
+        if timing_json:
+            write_phase_report(timer, timing_json, skill=skill_name, parameters=parameters)
+            print(f"   Report: {timing_json}")
+
+    if sizes or budgets:
+        from builder_utils.output_sizes import (
+            OutputBudgetExceeded, check_budgets, load_budgets, measure_output, print_output_sizes,
+        )
+        output_sizes = measure_output(result)
+        violations = check_budgets(output_sizes, load_budgets(budgets, skill_name))
+        print_output_sizes(output_sizes, violations)
+        failures = [violation for violation in violations if violation.level == "fail"]
+        if failures:
+            raise OutputBudgetExceeded(f"{len(failures)} output budget(s) exceeded")
+    return result
+
+def print_skill_result(result, export_dir: str = None, export_format: str = None, export_workbook: str = None):
+    """Print a SkillOutput summary and optionally write its exports"""
+    from builder_utils.lazy_visualization import LazySkillVisualization
+
+    print(f"\n✅ Skill executed successfully!")
+    print(f"\n📝 Final Prompt:")
+    print(result.final_prompt)
+
+    if result.visualizations:
+        print(f"\n📊 Visualizations ({len(result.visualizations)}):")
+        for i, viz in enumerate(result.visualizations, 1):
+            print(f"  {i}. {viz.title}")
+            if isinstance(viz, LazySkillVisualization) and not viz.is_rendered:
+                print(f"     Lazy: rendered on first access")
+
+    if result.export_data:
+        print(f"\n📁 Export Data ({len(result.export_data)}):")
+        for i, export in enumerate(result.export_data, 1):
+            print(f"  {i}. {export.name}")
+            if hasattr(export.data, 'shape'):
+                print(f"     Shape: {export.data.shape}")
+            if export_dir:
+                from builder_utils.export_encoders import write_export_file
+                os.makedirs(export_dir, exist_ok=True)
+                path = write_export_file(export, export_dir, format=export_format)
+                print(f"     Encoded: {path} ({os.path.getsize(path):,} bytes)")
+
+        if export_workbook:
+            from builder_utils.workbook_export import write_workbook
+            workbook = write_workbook(result.export_data, export_workbook)
+            print(f"\n📗 Workbook: {workbook.path} ({workbook.size_bytes:,} bytes)")
+            for sheet in workbook.sheets:
+                print(f"  - {sheet.sheet_name}: {sheet.row_count:,} rows (from '{sheet.export_name}')")
+
 def main():
     """Main function to run a skill locally"""
     parser = argparse.ArgumentParser(description='Run a skill locally using skill-framework')
-    parser.add_argument('skill_name', help='Name of the skill to run (function name or file name without .py)')
+    parser.add_argument('skill_name', nargs='?', help='Name of the skill to run (function name or file name without .py)')
     parser.add_argument('--parameters', '-p', help='Parameters as JSON string (optional)', default='{}')
+    parser.add_argument('--export-dir', help='Encode export data into this directory (optional)')
+    parser.add_argument('--export-format', help='Export format: csv, csv.gz, parquet-snappy, parquet-zstd or arrow (default: picked by data size)')
+    parser.add_argument('--export-workbook', help='Stream all exports into this multi-sheet .xlsx file (optional)')
+    parser.add_argument('--timing', action='store_true', help='Print a per-phase timing breakdown (fetch, transform, layout, serialize, export)')
+    parser.add_argument('--timing-json', help='Also save the phase breakdown as JSON to this file')
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=['cprofile', 'sampling'],
+                        help='Profile the run (default: cprofile) and list the hotspots in repo code')
+    parser.add_argument('--profile-out', help='Path prefix for the .prof/.collapsed files (default: <skill_name>)')
+    parser.add_argument('--top', type=int, default=15, help='Hotspots (--profile) or allocation sites (--memory) to list (default: 15)')
+    parser.add_argument('--memory', action='store_true', help='Measure peak/net memory, top allocation sites and output sizes')
+    parser.add_argument('--sizes', action='store_true', help='Report output sizes and check them against the size budgets')
+    parser.add_argument('--budgets', help='Output size budgets JSON file, implies --sizes (default: output_budgets.json if present)')
+    parser.add_argument('--cache', action='store_true', help='Reuse the stored output of an identical earlier run (same skill/helper source, parameters and data epoch)')
+    parser.add_argument('--watch', action='store_true', help='Stay running and re-run the skill whenever it or a repo module it imports is saved')
+    parser.add_argument('--daemon', action='store_true', help='Run in the warm skill-daemon (started with skill-daemon start) instead of this process')
+    parser.add_argument('--batch', help='Run every job in a JSONL file ({"skill": ..., "parameters": {...}} per line) instead of one skill')
+    parser.add_argument('--workers', type=int, help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--results', help='JSONL file for --batch results (default: <jobs file>.results.jsonl)')
 
     args = parser.parse_args()
 
+    if args.batch:
+        from builder_utils.batch_runner import load_jobs, print_batch_summary, run_batch
+        results_path = args.results or f"{os.path.splitext(args.batch)[0]}.results.jsonl"
+        summary = run_batch(load_jobs(args.batch), results_path, workers=args.workers)
+        print_batch_summary(summary)
+        sys.exit(1 if summary.failed else 0)
+
+    if not args.skill_name:
+        parser.error("skill_name is required unless --batch is given")
+
     try:
         # Parse the parameters JSON string
         parameters = json.loads(args.parameters)
 
-        print(f"Running skill '{args.skill_name}' with parameters: {parameters}")
-        result = run_skill(args.skill_name, parameters)
+        options = {
+            "export_dir": os.path.abspath(args.export_dir) if args.export_dir else None,
+            "export_format": args.export_format,
+            "export_workbook": os.path.abspath(args.export_workbook) if args.export_workbook else None,
+            "timing": args.timing,
+            "timing_json": os.path.abspath(args.timing_json) if args.timing_json else None,
+            "sizes": args.sizes,
+            "budgets": os.path.abspath(args.budgets) if args.budgets else None,
+            "cache": args.cache,
+        }
+
+        if args.profile:
+            # Profiles always run in this process, never in the daemon
+            from builder_utils.skill_profiler import print_hotspots, profile_skill, repo_hotspots
+            print(f"Profiling skill '{args.skill_name}' ({args.profile}) with parameters: {parameters}")
+            profile = profile_skill(args.skill_name, parameters, mode=args.profile, output_prefix=args.profile_out)
+            print_hotspots(profile, repo_hotspots(profile.stats, top=args.top))
+            return
+
+        if args.memory:
+            # Measured in this process: the daemon's memory belongs to many runs
+            from builder_utils.skill_memory import measure_skill_memory, print_memory_report
+            print(f"Measuring memory of skill '{args.skill_name}' with parameters: {parameters}")
+            print_memory_report(measure_skill_memory(args.skill_name, parameters, top=args.top))
+            return
 
-        print(f"\n✅ Skill executed successfully!")
-        print(f"\n📝 Final Prompt:")
-        print(result.final_prompt)
+        if args.watch:
+            # One warm process for every run; only changed modules are reloaded
+            from builder_utils.skill_watch import watch_skill
+            watch_skill(args.skill_name, parameters)
+            return
 
-        if result.visualizations:
-            print(f"\n📊 Visualizations ({len(result.visualizations)}):")
-            for i, viz in enumerate(result.visualizations, 1):
-                print(f"  {i}. {viz.title}")
+        if args.daemon:
+            from builder_utils.skill_daemon import request_run
+            response = request_run(args.skill_name, parameters, **options)
+            if response is not None:
+                print(response["output"], end="")
+                print(f"\n⚡ Ran in warm skill-daemon (pid {response['pid']}) in {response['seconds']:.2f}s")
+                if response.get("budget_exceeded"):
+                    sys.exit(1)
+                return
+            print("💤 No skill daemon running, running in this process")
 
-        if result.export_data:
-            print(f"\n📁 Export Data ({len(result.export_data)}):")
-            for i, export in enumerate(result.export_data, 1):
-                print(f"  {i}. {export.name}")
-                if hasattr(export.data, 'shape'):
-                    print(f"     Shape: {export.data.shape}")
+        from builder_utils.output_sizes import OutputBudgetExceeded
+        try:
+            execute_and_report(args.skill_name, parameters, **options)
+        except OutputBudgetExceeded as e:
+            print(f"\n❌ {e}")
+            sys.exit(1)
 
     except json.JSONDecodeError as e:
         print(f"❌ Error parsing parameters JSON: {e}")
@@ -0,0 +1,97 @@
+"""
+Shared Frame
+One DataFrame handle read by both the layout serializer and the export encoder, without list copies
+"""
+
+import json
+import uuid
+from typing import Any, Union
+
+import pandas as pd
+
+from builder_utils.phase_timing import phase
+
+JSON_DOUBLE_PRECISION = 15
+
+
+class JsonFragment:
+    """Pre-serialized JSON text to be spliced into a layout as-is by dumps_layout()"""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+
+class SharedFrame:
+    """
+    A read-only handle on a DataFrame shared between a visualization and its export.
+
+    Columns are serialized straight from their buffers by pandas' C JSON encoder into
+    JsonFragments, instead of going through `tolist()` (one Python object per cell) and
+    json.dumps. The export is built from the same frame, which pyarrow reads without
+    copying numeric columns. pandas copy-on-write keeps the shared buffers safe from
+    accidental writes by either side.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+
+    @property
+    def nbytes(self) -> int:
+        """Deep memory footprint of the shared frame"""
+        return int(self.frame.memory_usage(index=True, deep=True).sum())
+
+    def column(self, column: Union[int, str]) -> pd.Series:
+        """A column by position or name"""
+        return self.frame.iloc[:, column] if isinstance(column, int) else self.frame[column]
+
+    def column_json(self, column: Union[int, str]) -> JsonFragment:
+        """A column as a JSON array; NaN/NA become null"""
+        return JsonFragment(_to_json(self.column(column)))
+
+    def rows_json(self) -> JsonFragment:
+        """All rows as a JSON array of arrays (DataTable "data")"""
+        return JsonFragment(_to_json(self.frame))
+
+    def export(self, name: str):
+        """An ExportData of the shared frame itself, not a copy"""
+        from skill_framework import ExportData
+        return ExportData(name=name, data=self.frame)
+
+
+def dumps_layout(layout: Any, **kwargs) -> str:
+    """
+    json.dumps a layout that may contain JsonFragment values
+
+    Each fragment is written as a placeholder string and then replaced by its text in a
+    single join, so fragment text is copied once into the final layout string.
+    """
+    fragments = []
+    token = f"__fragment_{uuid.uuid4().hex}_"
+
+    def default(value):
+        if isinstance(value, JsonFragment):
+            fragments.append(value.text)
+            return f"{token}{len(fragments) - 1}"
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    with phase("serialize"):
+        text = json.dumps(layout, default=default, **kwargs)
+        if not fragments:
+            return text
+
+        pieces = text.split(f'"{token}')
+        parts = [pieces[0]]
+        for piece in pieces[1:]:
+            index, rest = piece.split('"', 1)
+            parts.append(fragments[int(index)])
+            parts.append(rest)
+        return "".join(parts)
+
+
+def _to_json(data) -> str:
+    return data.to_json(orient="values", double_precision=JSON_DOUBLE_PRECISION, date_format="iso")
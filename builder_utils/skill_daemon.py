@@ -0,0 +1,276 @@
+"""
+Skill Daemon
+Long-lived skill runner that keeps heavy imports and skill modules warm behind a Unix socket
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Optional
+
+SOCKET_FILE = ".skill_daemon.sock"
+WARM_MODULES = ("pandas", "numpy", "answer_rocket", "skill_framework", "skill_framework.layouts", "dotenv")
+CONNECT_TIMEOUT_SECONDS = 0.5
+STATUS_TIMEOUT_SECONDS = 2.0
+
+
+def default_socket_path(root: Optional[Path] = None) -> Path:
+    """Socket path for a project root (one daemon per checkout)"""
+    return (Path(root) if root is not None else Path.cwd()) / SOCKET_FILE
+
+
+def request_run(skill_name: str, parameters: dict, socket_path: Optional[Path] = None, **options) -> Optional[dict]:
+    """
+    Ask a running daemon to execute a skill
+
+    Args:
+        skill_name: Skill to run
+        parameters: Skill parameters
+        socket_path: Daemon socket (defaults to the one in the current directory)
+        **options: export_dir / export_format / export_workbook / timing / timing_json / sizes / budgets / cache,
+            paths absolute
+
+    Returns:
+        The daemon's response ({"output", "ok", "budget_exceeded", "pid", "seconds"}), or None when no daemon is
+        listening so the caller can run the skill in-process instead
+    """
+    return _send({"command": "run", "skill": skill_name, "parameters": parameters, **options}, socket_path)
+
+
+def request_status(socket_path: Optional[Path] = None) -> Optional[dict]:
+    """Ping the daemon; returns its status, {"ok": False, "busy": True} while it runs a skill, or None when it is not running"""
+    try:
+        return _send({"command": "status"}, socket_path, timeout=STATUS_TIMEOUT_SECONDS)
+    except TimeoutError:
+        return {"ok": False, "busy": True}
+
+
+def request_shutdown(socket_path: Optional[Path] = None) -> Optional[dict]:
+    """Ask the daemon to exit; returns None when it is not running"""
+    return _send({"command": "shutdown"}, socket_path)
+
+
+class SkillDaemon(socketserver.UnixStreamServer):
+    """
+    Runs skills on request, one at a time, in a process that has already imported pandas,
+    numpy, answer_rocket and skill_framework.
+
+    Each request is one JSON line and gets one JSON line back. Skill modules are cached per
+    file and re-imported only when the mtime or size of the file or of a repo file it imports
+    changes. Requests are handled sequentially because skills share process-wide state
+    (stdout capture, environment).
+    """
+
+    def __init__(self, root: Path, socket_path: Path):
+        self.root = Path(root)
+        self.socket_path = Path(socket_path)
+        self.started = time.time()
+        self.runs = 0
+        self._modules = {}
+
+        _remove_stale_socket(self.socket_path)
+        super().__init__(str(self.socket_path), _RequestHandler)
+
+        for module_name in WARM_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except ImportError:
+                pass
+
+    def server_bind(self):
+        # The socket file is created by bind(), so the umask decides who can connect until a
+        # chmod; binding under 077 makes it owner-only from the start
+        previous_umask = os.umask(0o077)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous_umask)
+
+    def load_skill(self, skill_name: str):
+        """
+        Return the skill function, re-importing only if the skill file or a repo file it imports changed
+
+        Changed helper modules (builder_utils/, <skill>_skill/) that are already imported are
+        reloaded before the skill module is executed again, so it binds their new versions.
+        """
+        from builder_utils.result_cache import source_files
+        from builder_utils.skill_registry import SkillRegistry
+        from builder_utils.skill_watch import changed_paths, file_signatures, load_skill_function, reload_changed_modules
+
+        entry = SkillRegistry(self.root).get(skill_name)
+        if entry is None:
+            return None
+
+        path = self.root / entry.file
+        signatures = file_signatures(source_files(path, self.root))
+        cached = self._modules.get(path)
+        if cached is None or cached[0] != signatures:
+            if cached is not None:
+                reload_changed_modules(changed_paths(cached[0], signatures))
+            self._modules[path] = (signatures, load_skill_function(path, entry.function))
+        return self._modules[path][1]
+
+    def run(self, request: dict) -> dict:
+        """Execute one run request and capture everything it prints"""
+        from builder_utils.output_sizes import OutputBudgetExceeded
+        from builder_utils.run_skill import execute_and_report
+
+        output = io.StringIO()
+        start = time.perf_counter()
+        ok = True
+        budget_exceeded = False
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            try:
+                execute_and_report(
+                    request["skill"],
+                    request.get("parameters") or {},
+                    export_dir=request.get("export_dir"),
+                    export_format=request.get("export_format"),
+                    export_workbook=request.get("export_workbook"),
+                    timing=request.get("timing", False),
+                    timing_json=request.get("timing_json"),
+                    sizes=request.get("sizes", False),
+                    budgets=request.get("budgets"),
+                    cache=request.get("cache", False),
+                    skill_function=self.load_skill(request["skill"]),
+                )
+            except OutputBudgetExceeded as e:
+                ok = False
+                budget_exceeded = True
+                print(f"\n❌ {e}")
+            except Exception as e:
+                ok = False
+                print(f"❌ Error: {e}")
+                traceback.print_exc()
+        self.runs += 1
+        return {"ok": ok, "budget_exceeded": budget_exceeded, "output": output.getvalue(), "pid": os.getpid(),
+                "seconds": time.perf_counter() - start}
+
+    def status(self) -> dict:
+        return {
+            "ok": True,
+            "pid": os.getpid(),
+            "root": str(self.root),
+            "uptime_seconds": time.time() - self.started,
+            "runs": self.runs,
+            "cached_modules": sorted(path.name for path in self._modules),
+        }
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            command = request.get("command")
+            if command == "run":
+                response = self.server.run(request)
+            elif command == "status":
+                response = self.server.status()
+            elif command == "shutdown":
+                response = {"ok": True, "pid": os.getpid()}
+                # shutdown() waits for serve_forever(), so it cannot run on the serving thread
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                response = {"ok": False, "output": f"Unknown command '{command}'\n"}
+        except Exception as e:
+            response = {"ok": False, "output": f"❌ Daemon error: {e}\n"}
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+def _send(request: dict, socket_path: Optional[Path], timeout: Optional[float] = None) -> Optional[dict]:
+    path = Path(socket_path) if socket_path is not None else default_socket_path()
+    if not path.exists():
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(CONNECT_TIMEOUT_SECONDS)
+        try:
+            client.connect(str(path))
+        except OSError:
+            # Stale socket from a daemon that is gone
+            return None
+        client.settimeout(timeout)
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with client.makefile("rb") as reader:
+            line = reader.readline()
+        return json.loads(line) if line else None
+    finally:
+        client.close()
+
+
+def _remove_stale_socket(path: Path):
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.settimeout(CONNECT_TIMEOUT_SECONDS)
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A skill daemon is already listening on {path}")
+
+
+def main():
+    """Start, stop or query the warm skill runner daemon"""
+    parser = argparse.ArgumentParser(description='Warm skill runner: keeps imports and skill modules loaded between run-skill calls')
+    parser.add_argument('command', choices=['start', 'stop', 'status'], help='start runs the daemon in the foreground')
+    parser.add_argument('--socket', help=f'Socket path (default: ./{SOCKET_FILE})')
+
+    args = parser.parse_args()
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+
+    if args.command == "status":
+        status = request_status(socket_path)
+        if status is None:
+            print("💤 No skill daemon running")
+            sys.exit(1)
+        if status.get("busy"):
+            print("⏳ Skill daemon is running a skill")
+            return
+        print(f"⚡ Skill daemon pid {status['pid']} - up {status['uptime_seconds']:.0f}s, {status['runs']} runs")
+        print(f"   Cached modules: {', '.join(status['cached_modules']) or 'none'}")
+        return
+
+    if args.command == "stop":
+        print("🛑 Stopped skill daemon" if request_shutdown(socket_path) else "💤 No skill daemon running")
+        return
+
+    root = Path.cwd()
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+    try:
+        daemon = SkillDaemon(root, socket_path)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"⚡ Skill daemon listening on {socket_path} (pid {os.getpid()}); stop with Ctrl+C or 'skill-daemon stop'")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Skill Memory
+Peak memory, net allocations and top allocation sites of a skill run, plus the size of its outputs (see output_sizes)
+"""
+
+import gc
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+from builder_utils.output_sizes import OutputSizes, measure_output, print_output_sizes
+
+RSS_SAMPLE_INTERVAL_SECONDS = 0.005
+TRACE_FRAMES = 16
+DEFAULT_TOP = 10
+
+
+@dataclass
+class AllocationSite:
+    """A source line still holding memory allocated during the run (the innermost repo frame when there is one)"""
+    file: str
+    line: int
+    size_bytes: int
+    blocks: int
+
+
+@dataclass
+class MemoryReport:
+    """Memory used by one skill run"""
+    traced_peak_bytes: int
+    traced_net_bytes: int
+    rss_start_bytes: int
+    rss_peak_bytes: int
+    rss_end_bytes: int
+    seconds: float
+    top_sites: List[AllocationSite] = field(default_factory=list)
+    outputs: Optional[OutputSizes] = None
+
+    @property
+    def rss_growth_bytes(self) -> int:
+        """Peak RSS above the RSS before the run: roughly what the run needs from a worker"""
+        return self.rss_peak_bytes - self.rss_start_bytes
+
+
+class RssSampler:
+    """
+    Samples this process's resident set size from a background thread.
+
+    RSS also covers memory tracemalloc cannot see (pyarrow's allocator, C extension buffers).
+    Short spikes between samples can be missed; on Linux the peak is cross-checked against
+    ru_maxrss when that rose during the run.
+    """
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.start_bytes = 0
+        self.peak_bytes = 0
+        self.end_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._maxrss_before = 0
+
+    def __enter__(self):
+        self.start_bytes = self.peak_bytes = current_rss_bytes()
+        self._maxrss_before = _max_rss_bytes()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.end_bytes = current_rss_bytes()
+        self.peak_bytes = max(self.peak_bytes, self.end_bytes)
+        max_rss = _max_rss_bytes()
+        if max_rss > self._maxrss_before:
+            # The process hit a new all-time high during the run, so that high is the run's peak
+            self.peak_bytes = max(self.peak_bytes, max_rss)
+        return False
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak_bytes = max(self.peak_bytes, current_rss_bytes())
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process (Linux /proc; ru_maxrss elsewhere)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return _max_rss_bytes()
+
+
+def measure_skill_memory(skill_name: str, parameters: dict, top: int = DEFAULT_TOP, skill_function=None,
+                         root: Optional[Path] = None) -> MemoryReport:
+    """
+    Run a skill once with tracemalloc and RSS sampling
+
+    Deferred work (lazy layouts, background export encodes) is finished inside the measured
+    region, and the SkillOutput is still alive when the final snapshot is taken, so the net
+    figure is what the run's output keeps in memory.
+
+    Args:
+        skill_name: Skill to run
+        parameters: Skill parameters
+        top: Number of allocation sites to report
+        skill_function: Already-loaded skill function
+        root: Project root used to shorten file names (default: current directory)
+
+    Returns:
+        MemoryReport
+    """
+    from builder_utils.phase_timing import PhaseTimer
+    from builder_utils.run_skill import _find_skill_function, run_skill
+    # Imported up front so their module objects are not counted as the run's allocations
+    import builder_utils.background_export  # noqa: F401
+    import builder_utils.lazy_visualization  # noqa: F401
+
+    if skill_function is None:
+        skill_function = _find_skill_function(skill_name)
+
+    gc.collect()
+    tracemalloc.start(TRACE_FRAMES)
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        with RssSampler() as rss:
+            result = run_skill(skill_name, parameters, skill_function=skill_function, timer=PhaseTimer())
+        seconds = time.perf_counter() - start
+        _, traced_peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    before, after = before.filter_traces(filters), after.filter_traces(filters)
+    differences = after.compare_to(before, "traceback")
+    net = sum(stat.size_diff for stat in differences)
+
+    return MemoryReport(
+        traced_peak_bytes=traced_peak - _total(before),
+        traced_net_bytes=net,
+        rss_start_bytes=rss.start_bytes,
+        rss_peak_bytes=rss.peak_bytes,
+        rss_end_bytes=rss.end_bytes,
+        seconds=seconds,
+        top_sites=_top_sites(differences, top, root),
+        outputs=measure_output(result, encode=False),
+    )
+
+
+def print_memory_report(report: MemoryReport):
+    mb = 1024 * 1024
+    print(f"\n🧠 Memory ({report.seconds:.2f}s run):")
+    print(f"  Traced peak:     {report.traced_peak_bytes / mb:10.1f} MB  (Python/numpy allocations above the start)")
+    print(f"  Traced net:      {report.traced_net_bytes / mb:10.1f} MB  (still held when the run returned)")
+    print(f"  RSS:             {report.rss_start_bytes / mb:10.1f} MB start, {report.rss_peak_bytes / mb:.1f} MB peak, {report.rss_end_bytes / mb:.1f} MB end")
+    print(f"  RSS growth:      {report.rss_growth_bytes / mb:10.1f} MB  (peak above start)")
+
+    if report.top_sites:
+        print(f"\n📍 Top allocation sites still held:")
+        for site in report.top_sites:
+            print(f"  {site.size_bytes / mb:9.2f} MB {site.blocks:9,} blocks  {site.file}:{site.line}")
+
+    if report.outputs is not None:
+        print_output_sizes(report.outputs, [])
+
+
+def _top_sites(differences, top: int, root: Optional[Path]) -> List[AllocationSite]:
+    from builder_utils.skill_profiler import is_repo_file
+
+    root = str(Path(root) if root is not None else Path.cwd())
+    sites = {}
+    for stat in differences:
+        if stat.size_diff <= 0:
+            continue
+        # Frames run oldest to newest; charge the allocation to the newest frame in repo code
+        frames = list(stat.traceback)
+        frame = next((frame for frame in reversed(frames) if is_repo_file(frame.filename, root)), frames[-1])
+        file = os.path.relpath(frame.filename, root) if frame.filename.startswith(root + os.sep) else frame.filename
+        site = sites.setdefault((file, frame.lineno), AllocationSite(file, frame.lineno, 0, 0))
+        site.size_bytes += stat.size_diff
+        site.blocks += stat.count_diff
+    return sorted(sites.values(), key=lambda site: site.size_bytes, reverse=True)[:top]
+
+
+def _total(snapshot: tracemalloc.Snapshot) -> int:
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def _max_rss_bytes() -> int:
+    import resource
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if os.uname().sysname == "Darwin" else max_rss * 1024
@@ -0,0 +1,261 @@
+"""
+Skill Profiler
+Run a skill under cProfile or a stack sampler and report the hotspots in this repository's code
+"""
+
+import argparse
+import cProfile
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROFILE_MODES = ("cprofile", "sampling")
+SAMPLE_INTERVAL_SECONDS = 0.001
+DEFAULT_TOP = 15
+EXTERNAL_PATH_MARKERS = ("site-packages", "dist-packages", f"{os.sep}.venv{os.sep}", f"{os.sep}venv{os.sep}")
+
+# pstats identifies a function by (file name, first line, function name)
+FunctionKey = Tuple[str, int, str]
+
+
+@dataclass
+class Hotspot:
+    """A function in repo code and the time spent in it"""
+    function: str
+    file: str
+    line: int
+    calls: int
+    self_seconds: float
+    cumulative_seconds: float
+
+
+@dataclass
+class ProfileResult:
+    """Where a profile was written and the loaded stats"""
+    mode: str
+    prof_path: str
+    collapsed_path: Optional[str]
+    stats: pstats.Stats
+    wall_seconds: float
+    samples: int = 0
+
+
+class StackSampler:
+    """
+    Samples one thread's Python stack at a fixed interval from a background thread.
+
+    Samples land on the next GIL switch, so the switch interval is lowered to the sample
+    interval while sampling. Each sample is weighted by the time since the previous one,
+    which keeps the totals honest when a sample is delayed by a long C call. When sampling
+    the thread that starts it, stacks are rooted below the function that started it.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_SECONDS, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.weights: Dict[tuple, float] = defaultdict(float)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._switch_interval = None
+        self._base_depth = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    def start(self):
+        if self.thread_id == threading.get_ident():
+            caller = sys._getframe(1)
+            if caller.f_code is StackSampler.__enter__.__code__:
+                caller = caller.f_back
+            self._base_depth = len(_stack(caller))
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.stacks.values())
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                continue
+            stack = _stack(frame)[self._base_depth:]
+            if not stack or stack[0] in _SAMPLER_FRAMES:
+                # Between samples: the caller itself, or the sampler being stopped
+                continue
+            self.stacks[stack] += 1
+            self.weights[stack] += now - last
+            last = now
+
+    def collapsed_lines(self) -> List[str]:
+        """Stacks in collapsed format ("root;caller;leaf count"), as read by flamegraph.pl/speedscope"""
+        lines = []
+        for stack, count in self.stacks.most_common():
+            lines.append(";".join(_frame_label(key) for key in stack) + f" {count}")
+        return lines
+
+    def to_pstats(self) -> dict:
+        """
+        The samples as a pstats dictionary, so the sampling profile opens in the same tools as
+        a cProfile one. Call counts are sample counts; times are sampled wall time.
+        """
+        stats = {}
+        callers: Dict[FunctionKey, Counter] = defaultdict(Counter)
+        for stack, count in self.stacks.items():
+            weight = self.weights[stack]
+            for key in set(stack):
+                cc, nc, tt, ct = stats.get(key, (0, 0, 0.0, 0.0))
+                stats[key] = (cc + count, nc + count, tt, ct + weight)
+            leaf = stack[-1]
+            cc, nc, tt, ct = stats[leaf]
+            stats[leaf] = (cc, nc, tt + weight, ct)
+            for caller, callee in zip(stack, stack[1:]):
+                callers[callee][caller] += count
+        return {key: (*values, dict(callers.get(key, {}))) for key, values in stats.items()}
+
+
+def profile_skill(skill_name: str, parameters: dict, mode: str = "cprofile", output_prefix: Optional[str] = None,
+                  interval: float = SAMPLE_INTERVAL_SECONDS) -> ProfileResult:
+    """
+    Run a skill once under a profiler
+
+    The skill's deferred work (lazy layouts, background export encodes) is finished inside the
+    profiled region, so waiting for it shows up as a cost of the run.
+
+    Args:
+        skill_name: Skill to run
+        parameters: Skill parameters
+        mode: "cprofile" (deterministic, exact call counts) or "sampling" (low overhead,
+            full stacks for flame graphs)
+        output_prefix: Path prefix for the output files (default: <skill_name>)
+        interval: Sampling interval in seconds
+
+    Returns:
+        ProfileResult with <prefix>.prof and, in sampling mode, <prefix>.collapsed
+    """
+    from builder_utils.phase_timing import PhaseTimer
+    from builder_utils.run_skill import _find_skill_function, run_skill
+
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode '{mode}', expected one of {', '.join(PROFILE_MODES)}")
+
+    output_prefix = output_prefix or skill_name
+    prof_path = f"{output_prefix}.prof"
+    collapsed_path = None
+    # Import the skill module and the helpers run_skill uses outside the profile
+    import builder_utils.background_export  # noqa: F401
+    import builder_utils.lazy_visualization  # noqa: F401
+    skill_function = _find_skill_function(skill_name)
+
+    start = time.perf_counter()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            run_skill(skill_name, parameters, skill_function=skill_function, timer=PhaseTimer())
+        finally:
+            profiler.disable()
+        wall_seconds = time.perf_counter() - start
+        profiler.dump_stats(prof_path)
+        samples = 0
+    else:
+        with StackSampler(interval=interval) as sampler:
+            run_skill(skill_name, parameters, skill_function=skill_function, timer=PhaseTimer())
+        wall_seconds = time.perf_counter() - start
+        with open(prof_path, "wb") as prof_file:
+            marshal.dump(sampler.to_pstats(), prof_file)
+        collapsed_path = f"{output_prefix}.collapsed"
+        with open(collapsed_path, "w", encoding="utf-8") as collapsed_file:
+            collapsed_file.write("\n".join(sampler.collapsed_lines()) + "\n")
+        samples = sampler.sample_count
+
+    return ProfileResult(mode, prof_path, collapsed_path, pstats.Stats(prof_path), wall_seconds, samples)
+
+
+def repo_hotspots(stats: pstats.Stats, root: Optional[Path] = None, top: int = DEFAULT_TOP) -> List[Hotspot]:
+    """Functions defined under root (excluding virtualenvs and site-packages), by cumulative time"""
+    root = str(Path(root) if root is not None else Path.cwd())
+    hotspots = []
+    for (file, line, function), (cc, nc, tt, ct, _callers) in stats.stats.items():
+        if not is_repo_file(file, root):
+            continue
+        hotspots.append(Hotspot(function, os.path.relpath(file, root), line, nc, tt, ct))
+    hotspots.sort(key=lambda hotspot: hotspot.cumulative_seconds, reverse=True)
+    return hotspots[:top]
+
+
+def print_hotspots(result: ProfileResult, hotspots: List[Hotspot]):
+    calls_label = "samples" if result.mode == "sampling" else "calls"
+    print(f"\n🔥 Repo hotspots by cumulative time ({result.mode}, run took {result.wall_seconds * 1000:.1f} ms):")
+    print(f"  {'cum ms':>9} {'self ms':>9} {calls_label:>8}  function")
+    for hotspot in hotspots:
+        print(f"  {hotspot.cumulative_seconds * 1000:9.1f} {hotspot.self_seconds * 1000:9.1f} {hotspot.calls:8,}  "
+              f"{hotspot.function} ({hotspot.file}:{hotspot.line})")
+    print(f"\n💾 Profile: {result.prof_path} (open with snakeviz or python -m pstats)")
+    if result.collapsed_path:
+        print(f"   Collapsed stacks: {result.collapsed_path} ({result.samples:,} samples; flamegraph.pl or speedscope)")
+
+
+_SAMPLER_FRAMES = {
+    (code.co_filename, code.co_firstlineno, code.co_name)
+    for code in (StackSampler.__exit__.__code__, StackSampler.stop.__code__)
+}
+
+
+def _stack(frame) -> Tuple[FunctionKey, ...]:
+    """Function keys from the root frame down to frame"""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+def is_repo_file(file: str, root: str) -> bool:
+    """Whether a file is under root and not in an installed package or virtualenv"""
+    return file.startswith(root + os.sep) and not any(marker in file for marker in EXTERNAL_PATH_MARKERS)
+
+
+def _frame_label(key: FunctionKey) -> str:
+    file, line, function = key
+    return f"{function} ({os.path.basename(file)}:{line})"
+
+
+def main():
+    """Print the repo hotspots of a saved .prof file"""
+    parser = argparse.ArgumentParser(description='Show the hotspots in repo code from a .prof file written by run-skill --profile')
+    parser.add_argument('prof_file', help='.prof file')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help=f'Number of functions to list (default: {DEFAULT_TOP})')
+
+    args = parser.parse_args()
+    stats = pstats.Stats(args.prof_file)
+    result = ProfileResult("saved", args.prof_file, None, stats, stats.total_tt)
+    print_hotspots(result, repo_hotspots(stats, top=args.top))
+
+
+if __name__ == "__main__":
+    main()
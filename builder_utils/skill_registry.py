@@ -0,0 +1,254 @@
+"""
+Skill Registry
+Index of the skills listed in skills.txt, read statically with ast and cached by file mtime/hash
+"""
+
+import argparse
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SKILLS_FILE = "skills.txt"
+INDEX_FILE = ".skill_index.json"
+INDEX_VERSION = 1
+
+
+@dataclass
+class SkillParameterInfo:
+    """A SkillParameter as written in the @skill decorator"""
+    name: str
+    description: Optional[str] = None
+    constrained_values: Optional[List[Any]] = None
+    default_value: Any = None
+    is_multi: Optional[bool] = None
+
+
+@dataclass
+class SkillEntry:
+    """A @skill-decorated function found in a skill file"""
+    name: str
+    function: str
+    file: str
+    description: Optional[str] = None
+    llm_name: Optional[str] = None
+    parameters: List[SkillParameterInfo] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SkillEntry":
+        parameters = [SkillParameterInfo(**parameter) for parameter in data.get("parameters", [])]
+        return cls(**{**data, "parameters": parameters})
+
+
+def scan_skill_file(path: Path) -> List[SkillEntry]:
+    """
+    Find @skill-decorated functions in a file without importing it
+
+    Decorator arguments are read with ast.literal_eval; values that are not literals
+    (e.g. a constant defined elsewhere) are recorded as None.
+
+    Args:
+        path: Skill .py file
+
+    Returns:
+        One SkillEntry per decorated function, in file order
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+    entries = []
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Call) and _call_name(decorator) == "skill":
+                keywords = {keyword.arg: keyword.value for keyword in decorator.keywords if keyword.arg}
+                entries.append(SkillEntry(
+                    name=_literal(keywords.get("name")) or node.name,
+                    function=node.name,
+                    file=path.name,
+                    description=_literal(keywords.get("description")),
+                    llm_name=_literal(keywords.get("llm_name")),
+                    parameters=_scan_parameters(keywords.get("parameters")),
+                ))
+    return entries
+
+
+class SkillRegistry:
+    """
+    Skills listed in skills.txt, indexed by function name, skill name, llm_name and file stem.
+
+    The index is cached in .skill_index.json. A file is re-parsed only when its mtime or size
+    changed and its sha256 no longer matches, so listing skills reads no skill module and
+    imports nothing beyond the standard library.
+    """
+
+    def __init__(self, root: Optional[Path] = None, index_path: Optional[Path] = None):
+        self.root = Path(root) if root is not None else Path.cwd()
+        self.index_path = Path(index_path) if index_path is not None else self.root / INDEX_FILE
+        self._entries: List[SkillEntry] = []
+        self._lookup: Dict[str, SkillEntry] = {}
+        self._loaded = False
+
+    @property
+    def entries(self) -> List[SkillEntry]:
+        self._ensure_loaded()
+        return self._entries
+
+    def get(self, name: str) -> Optional[SkillEntry]:
+        """Look up a skill by function name, skill name, llm_name or file stem"""
+        self._ensure_loaded()
+        return self._lookup.get(name)
+
+    def load_function(self, name: str):
+        """Import the skill's file and return its decorated function, or None if unknown"""
+        entry = self.get(name)
+        if entry is None:
+            return None
+        module_path = self.root / entry.file
+        spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return getattr(module, entry.function, None)
+
+    def refresh(self) -> bool:
+        """Re-read skills.txt and changed skill files; returns True if the index file was rewritten"""
+        cached = self._read_index()
+        files = {}
+        for file_name in self._listed_files():
+            path = self.root / file_name
+            if not path.exists():
+                continue
+            stat = path.stat()
+            record = cached.get(file_name)
+            if record and record["mtime_ns"] == stat.st_mtime_ns and record["size"] == stat.st_size:
+                files[file_name] = record
+                continue
+
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            if record and record["sha256"] == digest:
+                skills = record["skills"]
+            else:
+                skills = [asdict(entry) for entry in scan_skill_file(path)]
+            files[file_name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest, "skills": skills}
+
+        self._build_lookup(files)
+        if files != cached:
+            self._write_index(files)
+            return True
+        return False
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.refresh()
+            self._loaded = True
+
+    def _listed_files(self) -> List[str]:
+        skills_file = self.root / SKILLS_FILE
+        if not skills_file.exists():
+            return []
+        names = []
+        for line in skills_file.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                names.append(line if line.endswith(".py") else f"{line}.py")
+        return names
+
+    def _build_lookup(self, files: dict):
+        self._entries = [SkillEntry.from_dict(skill) for record in files.values() for skill in record["skills"]]
+        self._lookup = {}
+        # Function names win over skill names, llm names and file stems on collisions
+        for key_of in (lambda e: Path(e.file).stem, lambda e: e.llm_name, lambda e: e.name, lambda e: e.function):
+            for entry in self._entries:
+                key = key_of(entry)
+                if key:
+                    self._lookup[key] = entry
+
+    def _read_index(self) -> dict:
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if index.get("version") != INDEX_VERSION:
+            return {}
+        return index.get("files", {})
+
+    def _write_index(self, files: dict):
+        temp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            temp_path.write_text(json.dumps({"version": INDEX_VERSION, "files": files}, indent=2), encoding="utf-8")
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            # A read-only checkout still works, it just re-scans next time
+            temp_path.unlink(missing_ok=True)
+
+
+def _call_name(call: ast.Call) -> Optional[str]:
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    return None
+
+
+def _literal(node: Optional[ast.AST]) -> Any:
+    if node is None:
+        return None
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, SyntaxError, TypeError):
+        return None
+
+
+def _scan_parameters(node: Optional[ast.AST]) -> List[SkillParameterInfo]:
+    if not isinstance(node, (ast.List, ast.Tuple)):
+        return []
+    parameters = []
+    for element in node.elts:
+        if not (isinstance(element, ast.Call) and _call_name(element) == "SkillParameter"):
+            continue
+        keywords = {keyword.arg: keyword.value for keyword in element.keywords if keyword.arg}
+        name = _literal(keywords.get("name"))
+        if name is None:
+            continue
+        parameters.append(SkillParameterInfo(
+            name=name,
+            description=_literal(keywords.get("description")),
+            constrained_values=_literal(keywords.get("constrained_values")),
+            default_value=_literal(keywords.get("default_value")),
+            is_multi=_literal(keywords.get("is_multi")),
+        ))
+    return parameters
+
+
+def main():
+    """List the skills registered in skills.txt"""
+    parser = argparse.ArgumentParser(description='List skills registered in skills.txt without importing them')
+    parser.add_argument('--json', action='store_true', help='Print the registry as JSON')
+    parser.add_argument('--rebuild', action='store_true', help='Ignore the cached index and re-scan every skill file')
+
+    args = parser.parse_args()
+
+    registry = SkillRegistry()
+    if args.rebuild and registry.index_path.exists():
+        registry.index_path.unlink()
+
+    if args.json:
+        print(json.dumps([asdict(entry) for entry in registry.entries], indent=2))
+        return
+
+    print(f"📚 Skills ({len(registry.entries)}):")
+    for entry in registry.entries:
+        print(f"  - {entry.function} ({entry.file}) - skill name: '{entry.name}'")
+        for parameter in entry.parameters:
+            details = f"default: {parameter.default_value!r}" if parameter.default_value is not None else "no default"
+            if parameter.constrained_values:
+                details += f", one of {parameter.constrained_values}"
+            print(f"      {parameter.name}: {details}")
+
+
+if __name__ == "__main__":
+    main()
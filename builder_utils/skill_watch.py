@@ -0,0 +1,190 @@
+"""
+Skill Watch
+Re-run a skill whenever its file or a repo module it imports is saved, in one warm process
+"""
+
+import importlib
+import importlib.util
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+POLL_INTERVAL_SECONDS = 0.5
+
+# (mtime_ns, size) per watched file
+Signature = Tuple[int, int]
+
+
+class SkillWatcher:
+    """
+    Watches a skill file and every repo file it imports, directly or through other repo files
+    (result_cache.source_files, the same set the result cache and the daemon key on), and
+    re-runs the skill when any of them changes. The set is recomputed on every poll, so a
+    newly imported helper is picked up.
+
+    Only what changed is reloaded: a changed helper module is reloaded in place with
+    importlib.reload, and the skill module is re-executed (it binds helper names at import
+    time, so it picks up reloaded helpers that way). Everything else stays warm: third-party
+    imports and module-level caches in untouched modules.
+    Files are polled rather than watched with OS notifications, which needs no extra
+    dependency and works the same on every platform and editor.
+    """
+
+    def __init__(self, skill_name: str, parameters: dict, root: Optional[Path] = None):
+        from builder_utils.skill_registry import SkillRegistry
+
+        # Resolved, like the paths source_files returns
+        self.root = (Path(root) if root is not None else Path.cwd()).resolve()
+        entry = SkillRegistry(self.root).get(skill_name)
+        if entry is not None:
+            self.skill_file, self.function_name = self.root / entry.file, entry.function
+        else:
+            self.skill_file, self.function_name = self.root / f"{skill_name}.py", skill_name
+        if not self.skill_file.exists():
+            raise ValueError(f"Skill '{skill_name}' not found (no skills.txt entry or {self.skill_file.name})")
+
+        self.skill_name = skill_name
+        self.parameters = parameters
+        self.skill_function = None
+        self.previous_timer = None
+        self.runs = 0
+        self._signatures = self.snapshot()
+
+    def watched_files(self) -> List[Path]:
+        """The skill file first, then the repo files it imports"""
+        from builder_utils.result_cache import source_files
+
+        return [self.skill_file] + [path for path in source_files(self.skill_file, self.root) if path != self.skill_file]
+
+    def snapshot(self) -> Dict[Path, Signature]:
+        return file_signatures(self.watched_files())
+
+    def changed_files(self) -> List[Path]:
+        """Files added, edited or removed since the last call"""
+        signatures = self.snapshot()
+        changed = changed_paths(self._signatures, signatures)
+        self._signatures = signatures
+        return changed
+
+    def reload(self, changed: List[Path]) -> List[str]:
+        """
+        Reload the changed helper modules that are imported, then re-execute the skill module
+
+        Returns:
+            Names of the modules that were reloaded or executed
+        """
+        reloaded = reload_changed_modules(changed)
+        self.skill_function = load_skill_function(self.skill_file, self.function_name)
+        if self.skill_function is None:
+            raise ValueError(f"{self.skill_file.name} no longer defines '{self.function_name}'")
+        return reloaded + [self.skill_file.stem]
+
+    def run(self):
+        """Run the skill once, print its summary and the phase timing against the previous run"""
+        from builder_utils.phase_timing import PhaseTimer, print_phase_delta, print_phase_table
+        from builder_utils.run_skill import print_skill_result, run_skill
+
+        if self.skill_function is None:
+            self.reload([])
+        timer = PhaseTimer()
+        self.runs += 1
+        print(f"\n▶️ Run {self.runs}: '{self.skill_name}' with parameters: {self.parameters}")
+        result = run_skill(self.skill_name, dict(self.parameters), skill_function=self.skill_function, timer=timer)
+        print_skill_result(result)
+        if self.previous_timer is None:
+            print_phase_table(timer)
+        else:
+            print_phase_delta(timer, self.previous_timer)
+        self.previous_timer = timer
+        return result
+
+    def poll(self) -> bool:
+        """Reload and re-run if anything changed; returns True when a run was attempted"""
+        changed = self.changed_files()
+        if not changed:
+            return False
+        print(f"\n🔁 Changed: {', '.join(str(path.relative_to(self.root)) for path in changed)}")
+        try:
+            modules = self.reload(changed)
+            print(f"   Reloaded: {', '.join(modules)}")
+            self.run()
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            traceback.print_exc(limit=5)
+        return True
+
+
+def file_signatures(paths: Iterable[Path]) -> Dict[Path, Signature]:
+    """(mtime_ns, size) of each file that exists"""
+    signatures = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        signatures[path] = (stat.st_mtime_ns, stat.st_size)
+    return signatures
+
+
+def changed_paths(before: Dict[Path, Signature], after: Dict[Path, Signature]) -> List[Path]:
+    """Files added, edited or removed between two file_signatures() results"""
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+
+def reload_changed_modules(changed: Iterable[Path]) -> List[str]:
+    """
+    importlib.reload every imported module whose file is in changed
+
+    Returns:
+        Names of the reloaded modules
+    """
+    changed = {Path(path).resolve() for path in changed}
+    for path in changed:
+        # Bytecode is validated by whole-second mtime and size, which a quick save can match
+        Path(importlib.util.cache_from_source(str(path))).unlink(missing_ok=True)
+    reloaded = []
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and Path(module_file).resolve() in changed:
+            importlib.reload(module)
+            reloaded.append(name)
+    return reloaded
+
+
+def load_skill_function(skill_file: Path, function_name: str):
+    """Execute a skill file as a fresh module and return its skill function (None if it is missing)"""
+    Path(importlib.util.cache_from_source(str(skill_file))).unlink(missing_ok=True)
+    spec = importlib.util.spec_from_file_location(skill_file.stem, skill_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, function_name, None)
+
+
+def watch_skill(skill_name: str, parameters: dict, interval: float = POLL_INTERVAL_SECONDS,
+                max_runs: Optional[int] = None):
+    """
+    Run a skill, then re-run it on every save until interrupted
+
+    Args:
+        skill_name: Skill to run
+        parameters: Skill parameters, the same for every run
+        interval: Seconds between checks for changed files
+        max_runs: Stop after this many runs (default: run until Ctrl+C)
+    """
+    watcher = SkillWatcher(skill_name, parameters)
+    try:
+        watcher.run()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        traceback.print_exc(limit=5)
+
+    imported = len(watcher.watched_files()) - 1
+    print(f"\n👀 Watching {watcher.skill_file.relative_to(watcher.root)} and {imported} repo file(s) it imports (Ctrl+C to stop)")
+    try:
+        while max_runs is None or watcher.runs < max_runs:
+            time.sleep(interval)
+            watcher.poll()
+    except KeyboardInterrupt:
+        print(f"\n👋 Stopped watching after {watcher.runs} run(s)")
@@ -0,0 +1,118 @@
+"""
+SQL Replay
+Record AnswerRocket SQL query results to disk and serve them back later without a database
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+INDEX_FILE = "index.json"
+# Placeholders so AnswerRocketClient() and the skills' DATABASE_ID check pass while replaying
+REPLAY_ENVIRONMENT = {
+    "AR_URL": "http://replay.invalid",
+    "AR_TOKEN": "replay",
+    "DATABASE_ID": "00000000-0000-0000-0000-000000000000",
+}
+
+
+class MissingRecordingError(Exception):
+    """Raised when a query has no recording in replay mode"""
+
+
+def query_key(sql_query: str) -> str:
+    """Recording key for a query; whitespace differences (indentation, line breaks) are ignored"""
+    normalized = re.sub(r"\s+", " ", sql_query).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def save_recording(directory: str, sql_query: str, df: pd.DataFrame) -> Path:
+    """
+    Store a query result so it can be replayed
+
+    Args:
+        directory: Recordings directory (created if missing)
+        sql_query: The query as the skill sends it
+        df: Result frame
+
+    Returns:
+        Path of the written parquet file
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    key = query_key(sql_query)
+    path = directory / f"{key}.parquet"
+    df.to_parquet(path)
+
+    index = load_index(directory)
+    index[key] = {"sql": re.sub(r"\s+", " ", sql_query).strip(), "rows": len(df), "columns": list(map(str, df.columns))}
+    (directory / INDEX_FILE).write_text(json.dumps(index, indent=2), encoding="utf-8")
+    return path
+
+
+def load_recording(directory: str, sql_query: str) -> pd.DataFrame:
+    """Load the recorded result for a query, raising MissingRecordingError if it was never recorded"""
+    path = Path(directory) / f"{query_key(sql_query)}.parquet"
+    if not path.exists():
+        normalized = re.sub(r"\s+", " ", sql_query).strip()
+        raise MissingRecordingError(f"No recording in {directory} for query (capture it in record mode): {normalized}")
+    return pd.read_parquet(path)
+
+
+def load_index(directory: str) -> Dict[str, dict]:
+    """Recorded queries by key: {"sql", "rows", "columns"}"""
+    try:
+        return json.loads((Path(directory) / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+@contextlib.contextmanager
+def sql_replay(directory: str, record: bool = False):
+    """
+    Route AnswerRocket execute_sql_query calls through a recordings directory
+
+    In replay mode every query is answered from disk and no client connection is made;
+    placeholder AR_URL/AR_TOKEN/DATABASE_ID values are set for the duration if missing.
+    In record mode queries run against the real database and each result is saved.
+
+    Args:
+        directory: Recordings directory
+        record: Run queries for real and save the results instead of replaying them
+    """
+    from answer_rocket.data import Data, ExecuteSqlQueryResult
+
+    original = Data.execute_sql_query
+
+    def execute_sql_query(self, database_id, sql_query: str, row_limit: Optional[int] = None, *args, **kwargs):
+        if record:
+            result = original(self, database_id, sql_query, row_limit, *args, **kwargs)
+            if result is not None and result.df is not None:
+                save_recording(directory, sql_query, result.df)
+            return result
+        df = load_recording(directory, sql_query)
+        return ExecuteSqlQueryResult(success=True, df=df.head(row_limit) if row_limit else df)
+
+    previous_environment = {}
+    if not record:
+        for name, value in REPLAY_ENVIRONMENT.items():
+            if not os.getenv(name):
+                previous_environment[name] = os.environ.get(name)
+                os.environ[name] = value
+
+    Data.execute_sql_query = execute_sql_query
+    try:
+        yield Path(directory)
+    finally:
+        Data.execute_sql_query = original
+        for name, value in previous_environment.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
@@ -0,0 +1,308 @@
+"""
+Streaming Export
+Write exports chunk by chunk to a file sink so large exports never sit in memory whole
+"""
+
+import argparse
+import dataclasses
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import weakref
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from skill_framework import ExportData
+
+STREAM_FORMATS = ("parquet", "csv", "arrow")
+DEFAULT_CHUNK_ROWS = 250_000
+
+
+class OwnedDirectory:
+    """
+    Mixin for file references (dataclasses with an owned_directory field) that may own the
+    temporary directory their file was written to.
+
+    The owned directory is deleted by cleanup(), on leaving a `with` block, when the reference
+    is garbage collected, or at interpreter exit, whichever comes first. Copies and unpickled
+    references point at the same file but never own it.
+    """
+
+    def __post_init__(self):
+        self._finalizer = None
+        if self.owned_directory is not None:
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self.owned_directory, True)
+
+    def cleanup(self):
+        """Delete the owned directory now (does nothing for files this reference does not own)"""
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+
+    def __getstate__(self):
+        state = {key: value for key, value in self.__dict__.items() if key != "_finalizer"}
+        state["owned_directory"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._finalizer = None
+
+
+@dataclass
+class ExportFile(OwnedDirectory):
+    """
+    Reference to an export written to disk, used as ExportData.data instead of a DataFrame
+
+    When owned_directory is set (stream_export's temporary directory), this reference owns
+    it; see OwnedDirectory.
+    """
+    path: str
+    format: str
+    columns: List[str] = field(default_factory=list)
+    row_count: int = 0
+    owned_directory: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.row_count, len(self.columns))
+
+    @property
+    def size_bytes(self) -> int:
+        return os.path.getsize(self.path)
+
+    def iter_chunks(self, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """Read the export back one chunk at a time"""
+        if self.format == "parquet":
+            pq = _require_pyarrow_parquet()
+            parquet_file = pq.ParquetFile(self.path)
+            for batch in parquet_file.iter_batches(batch_size=chunk_rows):
+                yield batch.to_pandas()
+        elif self.format == "arrow":
+            for batch in self.memory_map().to_batches(max_chunksize=chunk_rows):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(self.path, chunksize=chunk_rows)
+
+    def memory_map(self):
+        """
+        Open an Arrow IPC export as a pyarrow Table backed by the memory-mapped file
+
+        Column buffers point into the mapping rather than being copied, so pages are only
+        read in (and shared with the OS page cache) when a consumer touches them.
+        """
+        if self.format != "arrow":
+            raise ValueError(f"Only Arrow IPC exports can be memory-mapped, this export is '{self.format}'")
+        pa = _require_pyarrow()
+        import pyarrow.ipc
+        return pyarrow.ipc.open_file(pa.memory_map(self.path, "r")).read_all()
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Load the whole export into memory (only for exports known to be small)"""
+        if self.format == "parquet":
+            return pd.read_parquet(self.path)
+        if self.format == "arrow":
+            return self.memory_map().to_pandas()
+        return pd.read_csv(self.path)
+
+
+class ChunkedExportWriter:
+    """
+    Appends DataFrame chunks to a Parquet, CSV or Arrow IPC file.
+
+    Only the chunk being written is held in memory; the schema (Parquet/Arrow) or header
+    (CSV) is taken from the first chunk. Arrow IPC files are uncompressed so they can be
+    memory-mapped back without a decode step.
+    """
+
+    def __init__(self, path: str, format: str = "parquet", compression: Optional[str] = "snappy"):
+        if format not in STREAM_FORMATS:
+            raise ValueError(f"Unsupported streaming export format '{format}', expected one of {', '.join(STREAM_FORMATS)}")
+        self.path = path
+        self.format = format
+        self.compression = compression
+        self.columns: List[str] = []
+        self.row_count = 0
+        self._parquet_writer = None
+        self._csv_file = None
+        self._arrow_sink = None
+        self._arrow_writer = None
+
+    def write(self, chunk: pd.DataFrame):
+        """Append one chunk to the sink; a named index (e.g. a RangeIndex id) is written as a column"""
+        if chunk.index.name is not None:
+            chunk = chunk.reset_index()
+        if self.row_count == 0 and not self.columns:
+            self.columns = [str(column) for column in chunk.columns]
+
+        if self.format == "parquet":
+            self._write_parquet(chunk)
+        elif self.format == "arrow":
+            self._write_arrow(chunk)
+        else:
+            self._write_csv(chunk)
+        self.row_count += len(chunk)
+
+    def close(self) -> ExportFile:
+        """Finish the file and return a reference to it"""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+        if self._arrow_writer is not None:
+            self._arrow_writer.close()
+            self._arrow_writer = None
+        if self._arrow_sink is not None:
+            self._arrow_sink.close()
+            self._arrow_sink = None
+        return ExportFile(path=self.path, format=self.format, columns=self.columns, row_count=self.row_count)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_parquet(self, chunk: pd.DataFrame):
+        pa = _require_pyarrow()
+        pq = _require_pyarrow_parquet()
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self.path, table.schema, compression=self.compression)
+        self._parquet_writer.write_table(table)
+
+    def _write_arrow(self, chunk: pd.DataFrame):
+        pa = _require_pyarrow()
+        import pyarrow.ipc
+        batch = pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+        if self._arrow_writer is None:
+            self._arrow_sink = pa.OSFile(self.path, "wb")
+            self._arrow_writer = pyarrow.ipc.new_file(self._arrow_sink, batch.schema)
+        self._arrow_writer.write_batch(batch)
+
+    def _write_csv(self, chunk: pd.DataFrame):
+        write_header = self._csv_file is None
+        if self._csv_file is None:
+            self._csv_file = open(self.path, "w", newline="", encoding="utf-8")
+        chunk.to_csv(self._csv_file, header=write_header, index=False)
+
+
+def stream_export(name: str,
+                  chunks: Iterable[pd.DataFrame],
+                  format: str = "parquet",
+                  directory: Optional[str] = None) -> ExportData:
+    """
+    Write chunks to a file sink and return an ExportData that references the file
+
+    Args:
+        name: Export name (sheet/file label)
+        chunks: Iterable of DataFrames with identical columns, e.g. a generator
+        format: "parquet", "csv" or "arrow" (uncompressed Arrow IPC, memory-mappable)
+        directory: Where to write the file (defaults to a new temporary directory, owned by the
+            returned ExportFile and deleted with it)
+
+    Returns:
+        ExportData whose data is an ExportFile
+    """
+    owned_directory = None
+    if directory is None:
+        directory = owned_directory = tempfile.mkdtemp(prefix="skill_export_")
+    path = os.path.join(directory, f"{_safe_file_stem(name)}.{format}")
+
+    try:
+        with ChunkedExportWriter(path, format=format) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+            export_file = writer.close()
+    except BaseException:
+        if owned_directory is not None:
+            shutil.rmtree(owned_directory, ignore_errors=True)
+        raise
+
+    if owned_directory is not None:
+        export_file = dataclasses.replace(export_file, owned_directory=owned_directory)
+    return ExportData(name=name, data=export_file)
+
+
+def _safe_file_stem(name: str) -> str:
+    stem = "".join(char if char.isalnum() or char in "-_" else "_" for char in name).strip("_")
+    return stem or "export"
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet/Arrow export requires pyarrow. Install it with: pip install -e '.[exports]'")
+    return pyarrow
+
+
+def _require_pyarrow_parquet():
+    _require_pyarrow()
+    import pyarrow.parquet
+    return pyarrow.parquet
+
+
+# Producer + consumer for one export path, run in a fresh interpreter so ru_maxrss is per mode
+_RSS_PROBE = """
+import resource, sys
+from skill_framework import ExportData
+from builder_utils.streaming_export import stream_export, DEFAULT_CHUNK_ROWS
+from builder_utils.synthetic_data import generate_synthetic_rows
+
+mode, rows, directory = sys.argv[1], int(sys.argv[2]), sys.argv[3]
+if mode == "in_memory":
+    export = ExportData(name="large_df", data=generate_synthetic_rows(1, rows))
+    total = float(export.data["score"].sum())
+else:
+    chunks = (generate_synthetic_rows(start, min(DEFAULT_CHUNK_ROWS, rows - start + 1))
+              for start in range(1, rows + 1, DEFAULT_CHUNK_ROWS))
+    export = stream_export("large_df", chunks, format=mode, directory=directory)
+    if mode == "arrow":
+        total = export.data.memory_map().column("score").to_numpy().sum()
+    else:
+        total = sum(float(chunk["score"].sum()) for chunk in export.data.iter_chunks())
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure_export_rss(mode: str, rows: int) -> int:
+    """Peak RSS in bytes of producing and consuming a rows-sized export with the given mode"""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = subprocess.run(
+            [sys.executable, "-c", _RSS_PROBE, mode, str(rows), temp_dir],
+            cwd=project_root, capture_output=True, text=True, check=True
+        )
+    # ru_maxrss is reported in KiB on Linux
+    return int(result.stdout.strip().splitlines()[-1]) * 1024
+
+
+def main():
+    """Compare peak RSS of in-memory ExportData against streamed file-backed exports"""
+    parser = argparse.ArgumentParser(description='Compare peak RSS of export paths for export_large_df-shaped data')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000], help='Row counts to measure (default: 1,000,000)')
+    parser.add_argument('--modes', nargs='+', default=["in_memory", "arrow", "parquet"],
+                        choices=("in_memory",) + STREAM_FORMATS, help='Export paths to measure')
+
+    args = parser.parse_args()
+
+    print(f"{'Rows':>12} {'Mode':<10} {'Peak RSS MB':>12}")
+    print("-" * 36)
+    for rows in args.rows:
+        for mode in args.modes:
+            print(f"{rows:>12,} {mode:<10} {measure_export_rss(mode, rows) / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
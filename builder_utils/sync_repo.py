@@ -1,9 +1,5 @@
-from answer_rocket.types import MaxResult
-from answer_rocket import AnswerRocketClient
 from dotenv import load_dotenv
-import argparse
 import os
-import pandas
 
 def sync_repo() -> bool:
     """Synchronize a MAX skill repository with AnswerRocket
@@ -11,6 +7,9 @@ def sync_repo() -> bool:
     Returns:
         bool: True if the repository sync was successful, False otherwise
     """
+    from answer_rocket import AnswerRocketClient
+    from answer_rocket.types import MaxResult
+
     load_dotenv()
 
     repo_id = os.getenv('REPO_ID')
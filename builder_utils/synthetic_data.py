@@ -0,0 +1,122 @@
+"""
+Synthetic Data
+Generates the id/value/category/score sample frames used by the export example skills
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+CATEGORIES = ['A', 'B', 'C', 'D']
+
+
+def generate_synthetic_rows(start_id: int, row_count: int, compact: bool = False) -> pd.DataFrame:
+    """
+    Generate synthetic rows with ids starting at start_id
+
+    Args:
+        start_id: First id value
+        row_count: Number of rows
+        compact: Use compact dtypes - uint8 value, categorical category, float32 score and
+            id held by a RangeIndex named "id" instead of an int64 column
+
+    Returns:
+        DataFrame with id, value, category and score
+    """
+    if not compact:
+        return pd.DataFrame({
+            'id': range(start_id, start_id + row_count),
+            'value': np.random.randint(0, 100, row_count),
+            'category': np.random.choice(CATEGORIES, row_count),
+            'score': np.random.uniform(0, 1, row_count)
+        })
+
+    rng = np.random.default_rng()
+    return pd.DataFrame(
+        {
+            'value': rng.integers(0, 100, row_count, dtype=np.uint8),
+            'category': pd.Categorical.from_codes(rng.integers(0, len(CATEGORIES), row_count, dtype=np.int8), CATEGORIES),
+            'score': rng.random(row_count, dtype=np.float32)
+        },
+        index=pd.RangeIndex(start_id, start_id + row_count, name='id')
+    )
+
+
+def with_id_column(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the frame with a RangeIndex-backed id turned back into a leading column
+
+    The other columns share their data with df rather than being copied, and ids that fit
+    are stored as uint32, so the result holds 4 bytes per row more than df.
+    """
+    if df.index.name != 'id':
+        return df
+    ids = df.index.to_numpy()
+    if len(ids) and ids.min() >= 0 and ids.max() <= np.iinfo(np.uint32).max:
+        ids = ids.astype(np.uint32)
+    columns = {'id': ids}
+    columns.update((name, df[name].array) for name in df.columns)
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(df)), copy=False)
+
+
+def frame_memory_bytes(df: pd.DataFrame) -> int:
+    """Deep memory footprint of a frame, including its index"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def compare_footprints(row_count: int) -> list:
+    """Measure memory (of the frame as exported, id column included) and export time of the standard and compact representations"""
+    from builder_utils.streaming_export import stream_export
+
+    rows = []
+    for compact in (False, True):
+        start = time.perf_counter()
+        df = generate_synthetic_rows(1, row_count, compact=compact)
+        generate_seconds = time.perf_counter() - start
+
+        row = {
+            "mode": "compact" if compact else "standard",
+            "memory_bytes": frame_memory_bytes(with_id_column(df)),
+            "generate_seconds": generate_seconds,
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for export_format in ("parquet", "csv"):
+                start = time.perf_counter()
+                try:
+                    export = stream_export("large_df", [df], format=export_format, directory=temp_dir)
+                except ImportError:
+                    continue
+                row[f"{export_format}_seconds"] = time.perf_counter() - start
+                row[f"{export_format}_bytes"] = os.path.getsize(export.data.path)
+        rows.append(row)
+    return rows
+
+
+def main():
+    """Report memory and export time for standard vs compact synthetic data"""
+    parser = argparse.ArgumentParser(description='Compare standard and compact dtypes for the synthetic export data')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Number of rows to generate (default: 1,000,000)')
+
+    args = parser.parse_args()
+
+    rows = compare_footprints(args.rows)
+    standard_memory = rows[0]["memory_bytes"]
+
+    print(f"Synthetic data footprint for {args.rows:,} rows")
+    print(f"{'Mode':<10} {'Memory MB':>10} {'Saved':>7} {'Parquet s':>10} {'Parquet MB':>11} {'CSV s':>7} {'CSV MB':>8}")
+    print("-" * 70)
+    for row in rows:
+        saved = 100.0 * (1 - row["memory_bytes"] / standard_memory)
+        print(
+            f"{row['mode']:<10} {row['memory_bytes'] / 1e6:>10.1f} {saved:>6.1f}% "
+            f"{row.get('parquet_seconds', float('nan')):>10.2f} {row.get('parquet_bytes', 0) / 1e6:>11.1f} "
+            f"{row.get('csv_seconds', float('nan')):>7.2f} {row.get('csv_bytes', 0) / 1e6:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
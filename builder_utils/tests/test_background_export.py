@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Background Export Test Suite
+Tests that exports encode on a worker thread only when asked, and overlap with layout building
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def test_encodes_in_background():
+    """Test that nothing is encoded until asked, and the result matches a synchronous encode"""
+    from builder_utils.background_export import BackgroundExport
+    from builder_utils.export_encoders import decode_export, encode_export
+    from builder_utils.synthetic_data import generate_synthetic_rows
+    from skill_framework import ExportData, SkillOutput
+
+    df = generate_synthetic_rows(1, 5_000)
+    export = BackgroundExport(name="large_df", data=df)
+
+    assert isinstance(export, ExportData)
+    assert export.data is df
+    assert export.format == "csv"
+    assert not export.started and not export.done
+
+    encoded = export.wait(timeout=30)
+    assert export.done
+    assert encoded.payload == encode_export(df, format="csv").payload
+    assert decode_export(encoded)["id"].tolist() == df["id"].tolist()
+
+    output = SkillOutput(final_prompt="", export_data=[export])
+    assert output.export_data[0] is export
+
+    print("  ✓ Background encode test passed")
+
+
+def test_overlaps_with_layout():
+    """Test that encoding runs while the calling thread builds its layout"""
+    from builder_utils.background_export import BackgroundExport
+    from builder_utils.export_encoders import encode_export
+    from builder_utils.synthetic_data import generate_synthetic_rows
+
+    df = generate_synthetic_rows(1, 300_000)
+
+    start = time.perf_counter()
+    encode_export(df, format="parquet-zstd")
+    encode_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    export = BackgroundExport(name="large_df", data=df, format="parquet-zstd")
+    export.start()
+    time.sleep(encode_seconds)  # stands in for layout wiring
+    export.wait(timeout=30)
+    total_seconds = time.perf_counter() - start
+
+    assert total_seconds < 1.6 * encode_seconds, f"{total_seconds:.3f}s vs {encode_seconds:.3f}s sequential"
+
+    print("  ✓ Overlap test passed")
+
+
+def test_errors_and_reuse():
+    """Test that encoder errors surface on wait() and results are reused when writing files"""
+    from builder_utils.background_export import BackgroundExport
+    from builder_utils.export_encoders import write_export_file
+    from builder_utils.synthetic_data import generate_synthetic_rows
+    import pandas as pd
+
+    broken = BackgroundExport(name="broken", data=object(), format="csv")
+    try:
+        broken.wait(timeout=30)
+        assert False, "Expected TypeError"
+    except TypeError:
+        pass
+
+    export = BackgroundExport(name="large df", data=generate_synthetic_rows(1, 100), format="csv.gz")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Not started: encoded straight into the file
+        path = write_export_file(export, temp_dir)
+        assert not export.started
+        assert path.endswith("large_df.csv.gz")
+        assert len(pd.read_csv(path)) == 100
+
+        export.start()
+        path = write_export_file(export, temp_dir)
+        assert export.done
+        assert len(pd.read_csv(path)) == 100
+
+    print("  ✓ Error and reuse test passed")
+
+
+def test_copy_and_pickle():
+    """Test that copies and pickles of a started export carry the data but no encode job"""
+    import copy
+    import pickle
+    from builder_utils.background_export import BackgroundExport
+    from builder_utils.synthetic_data import generate_synthetic_rows
+
+    export = BackgroundExport(name="large_df", data=generate_synthetic_rows(1, 100))
+    export.wait(timeout=30)
+
+    for restored in (copy.deepcopy(export), pickle.loads(pickle.dumps(export))):
+        assert restored.format == "csv"
+        assert not restored.started
+        assert restored.data["id"].tolist() == export.data["id"].tolist()
+        assert restored.wait(timeout=30).payload == export.wait().payload
+
+    print("  ✓ Copy and pickle test passed")
+
+
+def main():
+    """Run all background export tests"""
+    print("=== BACKGROUND EXPORT TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Background Encode", test_encodes_in_background),
+        ("Overlap", test_overlaps_with_layout),
+        ("Errors and Reuse", test_errors_and_reuse),
+        ("Copy and Pickle", test_copy_and_pickle),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All background export tests passed!")
+        return 0
+    else:
+        print("⚠️ Some background export tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
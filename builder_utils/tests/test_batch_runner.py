@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Batch Runner Test Suite
+Tests JSONL job parsing, streaming results from the process pool and loading each skill once per worker
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def test_load_jobs():
+    """Test job parsing, default ids and validation"""
+    from builder_utils.batch_runner import load_jobs
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "jobs.jsonl")
+        with open(path, "w") as jobs_file:
+            jobs_file.write('# catalog regression\n')
+            jobs_file.write('{"skill": "special_tab_names"}\n\n')
+            jobs_file.write('{"skill_name": "export_large_df", "parameters": {"size_of_df": "10"}, "id": "small"}\n')
+        jobs = load_jobs(path)
+
+        assert [(job.id, job.skill, job.parameters) for job in jobs] == [
+            ("2:special_tab_names", "special_tab_names", {}),
+            ("small", "export_large_df", {"size_of_df": "10"}),
+        ]
+
+        with open(path, "w") as jobs_file:
+            jobs_file.write('{"parameters": {}}\n')
+        try:
+            load_jobs(path)
+            assert False, "Expected ValueError"
+        except ValueError as e:
+            assert "no 'skill'" in str(e)
+
+    print("  ✓ Job parsing test passed")
+
+
+def test_run_batch_streams_results():
+    """Test that every job gets a result line with status, latency and sizes"""
+    from builder_utils.batch_runner import BatchJob, run_batch
+
+    jobs = [
+        BatchJob(id="default", skill="special_tab_names"),
+        BatchJob(id="compact", skill="special_tab_names", parameters={"compact_dtypes": "true"}),
+        BatchJob(id="large", skill="export_large_df", parameters={"size_of_df": "1000", "display_rows": "5"}),
+        BatchJob(id="missing", skill="no_such_skill"),
+    ]
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results_path = os.path.join(temp_dir, "results.jsonl")
+            summary = run_batch(jobs, results_path, workers=2, verbose=False)
+            with open(results_path) as results_file:
+                records = {record["id"]: record for record in map(json.loads, results_file)}
+    finally:
+        os.chdir(cwd)
+
+    assert (summary.total, summary.succeeded, summary.failed) == (4, 3, 1)
+    assert set(records) == {"default", "compact", "large", "missing"}
+
+    assert records["default"]["status"] == "ok"
+    assert records["default"]["exports"] == 3
+    assert records["default"]["layout_bytes"] > 0
+    assert records["compact"]["export_bytes"] < records["default"]["export_bytes"]
+    assert records["large"]["export_rows"] == 1000
+    assert records["missing"]["status"] == "error" and "not found" in records["missing"]["error"]
+    assert all(record["seconds"] >= 0 for record in records.values())
+
+    print("  ✓ Batch results test passed")
+
+
+def test_skill_loaded_once_per_worker():
+    """Test that a worker executes each skill module once, not once per job"""
+    from builder_utils import batch_runner
+    from builder_utils.batch_runner import BatchJob, run_job
+    from builder_utils.skill_registry import SkillRegistry
+
+    loads = []
+    original = SkillRegistry.load_function
+
+    def counting_load(self, name):
+        loads.append(name)
+        return original(self, name)
+
+    batch_runner._skill_functions.clear()
+    SkillRegistry.load_function = counting_load
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        records = [run_job(BatchJob(id=str(i), skill="special_tab_names")) for i in range(3)]
+    finally:
+        os.chdir(cwd)
+        SkillRegistry.load_function = original
+        batch_runner._skill_functions.clear()
+
+    assert [record["status"] for record in records] == ["ok"] * 3
+    assert loads == ["special_tab_names"]
+
+    print("  ✓ Skill loaded once test passed")
+
+
+def main():
+    """Run all batch runner tests"""
+    print("=== BATCH RUNNER TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Job Parsing", test_load_jobs),
+        ("Batch Results", test_run_batch_streams_results),
+        ("Skill Loaded Once", test_skill_loaded_once_per_worker),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All batch runner tests passed!")
+        return 0
+    else:
+        print("⚠️ Some batch runner tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite Test Suite
+Tests warm-up/repeat timing, case selection, result files and regression detection
+"""
+
+import sys
+import os
+import tempfile
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def test_measure_warmup_and_repeat():
+    """Test that warm-up runs are untimed and every repeat is timed"""
+    from builder_utils.bench.harness import BenchStats, measure
+
+    calls = []
+    samples = measure(lambda: calls.append(1), warmup=3, repeat=5)
+    assert len(calls) == 8 and len(samples) == 5
+
+    stats = BenchStats("case", "group", 3, [0.003, 0.001, 0.002])
+    assert (stats.minimum, stats.median, stats.maximum) == (0.001, 0.002, 0.003)
+    assert abs(stats.stdev - 0.001) < 1e-12
+    assert stats.to_dict()["median"] == 0.002
+
+    print("  ✓ Warm-up and repeat test passed")
+
+
+def test_case_selection():
+    """Test that the suite covers each area and filters by name or group"""
+    from builder_utils.bench.harness import registered_cases
+
+    groups = {case.group for case in registered_cases()}
+    assert {"skill", "layout", "datatable", "export", "preview"} <= groups
+    assert [case.name for case in registered_cases(["export"])] == ["export.csv", "export.parquet_zstd", "export.arrow"]
+    assert [case.name for case in registered_cases(["*.wire_layout"])] == ["layout.wire_layout"]
+
+    print("  ✓ Case selection test passed")
+
+
+def test_run_and_compare():
+    """Test running cases, the results file round trip and regression statuses"""
+    from builder_utils.bench.cli import run_suite
+    from builder_utils.bench.harness import compare_results, load_results, save_results
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        results, failed = run_suite(["layout.wire_layout", "skill.basic_data_bar_chart", "datatable.format"], warmup=1, repeat=3, verbose=False)
+    finally:
+        os.chdir(cwd)
+    assert failed == {}
+    assert [result.name for result in results] == ["skill.basic_data_bar_chart", "layout.wire_layout", "datatable.format"]
+    assert all(len(result.samples) == 3 and result.median > 0 for result in results)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "results.json")
+        save_results(results, path)
+        current = load_results(path)
+    assert current["environment"]["python"]
+    assert set(current["benchmarks"]) == {result.name for result in results}
+
+    def document(**medians):
+        return {"benchmarks": {name: {"median": median} for name, median in medians.items()}}
+
+    baseline = document(steady=0.100, slower=0.100, faster=0.100, tiny=0.0001, gone=0.1)
+    current = document(steady=0.110, slower=0.130, faster=0.070, tiny=0.0004, added=0.1)
+    statuses = {c.name: c.status for c in compare_results(baseline, current, threshold=0.2)}
+    assert statuses == {"steady": "ok", "slower": "regressed", "faster": "improved", "tiny": "ok", "added": "new", "gone": "missing"}
+    assert {c.name: c.status for c in compare_results(baseline, current, threshold=0.5)}["slower"] == "ok"
+
+    print("  ✓ Run and compare test passed")
+
+
+def test_failed_and_missing_cases():
+    """Test that a raising case is recorded as failed and failed/missing cases fail the comparison"""
+    from builder_utils.bench.cli import run_suite
+    from builder_utils.bench.harness import _CASES, benchmark, compare_results, comparison_failed, results_document
+
+    @benchmark("test.broken", "test")
+    def broken():
+        raise RuntimeError("no data")
+        yield
+
+    try:
+        results, failed = run_suite(["test.broken"], warmup=0, repeat=1, verbose=False)
+    finally:
+        del _CASES["test.broken"]
+    assert results == [] and failed == {"test.broken": "RuntimeError: no data"}
+
+    baseline = {"benchmarks": {"test.broken": {"median": 0.1}, "other": {"median": 0.1}}}
+    comparisons = compare_results(baseline, results_document(results, failed))
+    assert {c.name: c.status for c in comparisons} == {"test.broken": "failed", "other": "missing"}
+    assert comparison_failed(comparisons)
+    assert not comparison_failed(compare_results(baseline, {"benchmarks": {"test.broken": {"median": 0.1}, "other": {"median": 0.1}}}))
+
+    print("  ✓ Failed and missing cases test passed")
+
+
+def main():
+    """Run all benchmark suite tests"""
+    print("=== BENCHMARK SUITE TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Warm-up and Repeat", test_measure_warmup_and_repeat),
+        ("Case Selection", test_case_selection),
+        ("Run and Compare", test_run_and_compare),
+        ("Failed and Missing Cases", test_failed_and_missing_cases),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All benchmark suite tests passed!")
+        return 0
+    else:
+        print("⚠️ Some benchmark suite tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Export Encoders Test Suite
+Tests format round trips, size-based defaults and file-backed export encoding
+"""
+
+import sys
+import os
+import tempfile
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def test_round_trip_all_formats():
+    """Test that every format decodes back to the same rows"""
+    from builder_utils.export_encoders import EXPORT_FORMATS, encode_export, decode_export
+    from builder_utils.synthetic_data import generate_synthetic_rows
+    from skill_framework import ExportData
+
+    df = generate_synthetic_rows(1, 1_000)
+    for export_format in EXPORT_FORMATS:
+        encoded = encode_export(ExportData(name="large_df", data=df), format=export_format)
+        decoded = decode_export(encoded)
+
+        assert encoded.name == "large_df"
+        assert encoded.size_bytes > 0
+        assert list(decoded.columns) == ["id", "value", "category", "score"]
+        assert decoded["id"].tolist() == df["id"].tolist()
+        assert abs(decoded["score"].sum() - df["score"].sum()) < 1e-6
+
+    print("  ✓ Round trip test passed")
+
+
+def test_compact_frame_keeps_id():
+    """Test that a RangeIndex-backed id is written as a column across chunks"""
+    from builder_utils import export_encoders
+    from builder_utils.synthetic_data import generate_synthetic_rows
+
+    df = generate_synthetic_rows(1, 2_500, compact=True)
+    chunks = list(export_encoders.iter_export_chunks(df, chunk_rows=1_000))
+    assert [len(chunk) for chunk in chunks] == [1_000, 1_000, 500]
+
+    for export_format in ("csv", "parquet-zstd", "arrow"):
+        decoded = export_encoders.decode_export(export_encoders.encode_export(df, format=export_format))
+        assert decoded["id"].tolist() == list(range(1, 2_501))
+
+    print("  ✓ Compact id test passed")
+
+
+def test_default_format_by_size():
+    """Test that small exports stay CSV and larger ones move to zstd Parquet"""
+    from builder_utils import export_encoders
+    from builder_utils.synthetic_data import generate_synthetic_rows
+
+    assert export_encoders.choose_format(generate_synthetic_rows(1, 100)) == "csv"
+    assert export_encoders.choose_format(generate_synthetic_rows(1, 100_000)) == "parquet-zstd"
+
+    try:
+        export_encoders.encode_export(generate_synthetic_rows(1, 10), format="xlsx")
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+    print("  ✓ Default format test passed")
+
+
+def test_file_backed_export():
+    """Test re-encoding a streamed ExportFile into a file"""
+    from builder_utils.export_encoders import write_export_file
+    from builder_utils.streaming_export import stream_export
+    from builder_utils.synthetic_data import generate_synthetic_rows
+    import pandas as pd
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        chunks = [generate_synthetic_rows(start, 500) for start in (1, 501)]
+        export = stream_export("large df", chunks, format="csv", directory=temp_dir)
+
+        path = write_export_file(export, temp_dir, format="csv.gz")
+        assert path.endswith("large_df.csv.gz")
+        assert len(pd.read_csv(path)) == 1_000
+
+    print("  ✓ File-backed export test passed")
+
+
+def main():
+    """Run all export encoder tests"""
+    print("=== EXPORT ENCODERS TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Round Trip", test_round_trip_all_formats),
+        ("Compact Id", test_compact_frame_keeps_id),
+        ("Default Format", test_default_format_by_size),
+        ("File-Backed Export", test_file_backed_export),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All export encoder tests passed!")
+        return 0
+    else:
+        print("⚠️ Some export encoder tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Import Time Test Suite
+Checks that CLI entry points load without heavy dependencies, using python -X importtime
+"""
+
+import sys
+import os
+import subprocess
+import tomllib
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Packages that must only load on the code path that needs them
+HEAVY_PACKAGES = {"pandas", "numpy", "answer_rocket", "playwright", "skill_framework", "pyarrow"}
+
+# Entry points whose every command needs one of the heavy packages anyway
+ALLOWED_HEAVY = {
+    # pandas loads pyarrow itself when it is installed
+    "builder_utils.export_encoders": {"pandas", "numpy", "pyarrow"},
+}
+
+# Extra modules that are imported by CLIs but are not entry points
+EXTRA_MODULES = ["builder_utils.viz_previewer"]
+
+# Cumulative import time allowed per entry point module (best of several runs)
+IMPORT_BUDGET_MS = 150
+IMPORT_RUNS = 3
+
+
+def entry_point_modules():
+    """Modules referenced by [project.scripts] in pyproject.toml, plus EXTRA_MODULES"""
+    with open(os.path.join(PROJECT_ROOT, "pyproject.toml"), "rb") as pyproject:
+        scripts = tomllib.load(pyproject)["project"]["scripts"]
+    modules = sorted({target.split(":")[0] for target in scripts.values()})
+    return modules + [module for module in EXTRA_MODULES if module not in modules]
+
+
+def measure_import(module):
+    """Return (cumulative milliseconds, top-level packages imported) for importing module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    cumulative_ms = None
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if not parts[1].isdigit():
+            continue  # header line
+        name = parts[2]
+        packages.add(name.split(".")[0])
+        if name == module:
+            cumulative_ms = int(parts[1]) / 1000
+    return cumulative_ms, packages
+
+
+def test_no_heavy_imports_at_load():
+    """Test that importing a CLI module does not load pandas, answer_rocket, playwright, ..."""
+    failures = []
+    for module in entry_point_modules():
+        _, packages = measure_import(module)
+        unexpected = (packages & HEAVY_PACKAGES) - ALLOWED_HEAVY.get(module, set())
+        if unexpected:
+            failures.append(f"{module} imports {', '.join(sorted(unexpected))}")
+
+    assert not failures, "; ".join(failures)
+
+    print("  ✓ Heavy import test passed")
+
+
+def test_import_time_budget():
+    """Test that each CLI module imports within the time budget"""
+    failures = []
+    for module in entry_point_modules():
+        if module in ALLOWED_HEAVY:
+            continue
+        best_ms = min(measure_import(module)[0] for _ in range(IMPORT_RUNS))
+        print(f"    {module}: {best_ms:.1f} ms")
+        if best_ms > IMPORT_BUDGET_MS:
+            failures.append(f"{module} took {best_ms:.0f} ms (budget {IMPORT_BUDGET_MS} ms)")
+
+    assert not failures, "; ".join(failures)
+
+    print("  ✓ Import time budget test passed")
+
+
+def main():
+    """Run all import time tests"""
+    print("=== IMPORT TIME TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Heavy Imports", test_no_heavy_imports_at_load),
+        ("Import Time Budget", test_import_time_budget),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All import time tests passed!")
+        return 0
+    else:
+        print("⚠️ Some import time tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
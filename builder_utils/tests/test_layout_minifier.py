@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Layout Minifier Test Suite
+Tests default stripping, nested style cleanup and compact serialization of layouts
+"""
+
+import sys
+import os
+import json
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+SAMPLE_LAYOUT = {
+    "type": "Document",
+    "rows": 90,
+    "columns": 160,
+    "children": [
+        {
+            "name": "Header0",
+            "type": "Header",
+            "text": "Title",
+            "style": {"fontSize": "20px", "border": "null", "fontFamily": ""},
+            "hidden": False
+        },
+        {
+            "name": "Header1",
+            "type": "Header",
+            "text": "Subtitle",
+            "style": {"fontSize": "20px", "border": "null"},
+            "hidden": True
+        },
+        {
+            "name": "Chart0",
+            "type": "HighchartsChart",
+            "options": {"legend": {"enabled": False}, "series": [{"data": [0, 1]}]},
+            "hidden": 0
+        }
+    ]
+}
+
+
+def test_drops_framework_defaults():
+    """Test that default-valued keys are removed and everything else is kept"""
+    from builder_utils.layout_minifier import minify_layout
+
+    result = minify_layout(SAMPLE_LAYOUT)
+    minified = json.loads(result.layout)
+    header0, header1, chart = minified["children"]
+
+    assert "hidden" not in header0
+    assert header1["hidden"] is True
+    assert chart["hidden"] == 0  # only the boolean default is dropped
+    assert header0["style"] == {"fontSize": "20px"}
+    assert chart["options"]["legend"]["enabled"] is False  # non-style falsy values are untouched
+    assert result.dropped_defaults == 4
+
+    print("  ✓ Default stripping test passed")
+
+
+def test_cleans_nested_style_groups():
+    """Test that default values are stripped from nested style groups and styles stay independent"""
+    from builder_utils.layout_minifier import minify_layout
+
+    layout = {
+        "type": "Document",
+        "children": [
+            {"name": "Table0", "type": "DataTable", "styles": {"th": {"color": "red", "border": "null"}, "td": {"padding": ""}}},
+            {"name": "Header0", "type": "Header", "style": {"fontSize": "20px"}},
+            {"name": "Header1", "type": "Header", "style": {"fontSize": "20px"}},
+        ],
+    }
+    result = minify_layout(layout)
+    table, header0, header1 = json.loads(result.layout)["children"]
+
+    assert table["styles"] == {"th": {"color": "red"}, "td": {}}
+    assert header0["style"] == header1["style"] == {"fontSize": "20px"}
+    assert result.dropped_defaults == 2
+
+    print("  ✓ Nested style group test passed")
+
+
+def test_compact_serialization():
+    """Test whitespace-free output and byte accounting for string input"""
+    from builder_utils.layout_minifier import minify_layout, minified_visualization
+
+    pretty = json.dumps(SAMPLE_LAYOUT, indent=2)
+    result = minify_layout(pretty)
+
+    assert "\n" not in result.layout
+    assert ": " not in result.layout
+    assert result.original_bytes == len(pretty.encode("utf-8"))
+    assert result.minified_bytes == len(result.layout.encode("utf-8"))
+    assert result.saved_bytes > 0
+    assert 0 < result.reduction_pct < 100
+
+    viz = minified_visualization("Minified", pretty)
+    assert viz.title == "Minified"
+    assert viz.layout == result.layout
+    assert (viz.minify_result.saved_bytes, viz.minify_result.reduction_pct) == (result.saved_bytes, result.reduction_pct)
+
+    print("  ✓ Compact serialization test passed")
+
+
+def main():
+    """Run all layout minifier tests"""
+    print("=== LAYOUT MINIFIER TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Default Stripping", test_drops_framework_defaults),
+        ("Nested Style Groups", test_cleans_nested_style_groups),
+        ("Compact Serialization", test_compact_serialization),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All layout minifier tests passed!")
+        return 0
+    else:
+        print("⚠️ Some layout minifier tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
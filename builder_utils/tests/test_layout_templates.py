@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Layout Template Test Suite
+Tests fragment reuse, copy-on-write overrides and pooled fragments across tabs
+"""
+
+import sys
+import os
+import json
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+BASE_LAYOUT = {
+    "type": "Document",
+    "rows": 90,
+    "columns": 160,
+    "children": [
+        {"name": "Header0", "type": "Header", "text": "Title", "style": {"fontSize": "20px"}},
+        {
+            "name": "Chart0",
+            "type": "HighchartsChart",
+            "options": {"chart": {"type": "pie"}, "series": [{"data": [1, 2, 3]}]}
+        }
+    ],
+    "style": {"backgroundColor": "#ffffff"}
+}
+
+
+def test_render_matches_layout():
+    """Test that a plain render is the compact JSON of the layout and is cached"""
+    from builder_utils.layout_templates import LayoutTemplate
+
+    template = LayoutTemplate(json.dumps(BASE_LAYOUT, indent=2))
+    rendered = template.render()
+
+    assert json.loads(rendered) == BASE_LAYOUT
+    assert rendered is template.render()
+    assert template.element_names == ["Header0", "Chart0"]
+
+    print("  ✓ Render test passed")
+
+
+def test_overrides_are_copy_on_write():
+    """Test that overrides apply to one render without touching the template"""
+    from builder_utils.layout_templates import LayoutTemplate
+
+    template = LayoutTemplate(BASE_LAYOUT)
+    rendered = json.loads(template.render({
+        "Chart0": {"options.chart.type": "line"},
+        "Header0": {"text": "Tab 2"}
+    }))
+
+    assert rendered["children"][0]["text"] == "Tab 2"
+    assert rendered["children"][1]["options"]["chart"]["type"] == "line"
+    assert rendered["children"][1]["options"]["series"] == [{"data": [1, 2, 3]}]
+
+    # The template and its source layout are unchanged
+    assert BASE_LAYOUT["children"][1]["options"]["chart"]["type"] == "pie"
+    assert json.loads(template.render()) == BASE_LAYOUT
+
+    try:
+        template.render({"Missing0": {"text": "x"}})
+        assert False, "Expected KeyError for unknown element"
+    except KeyError:
+        pass
+
+    print("  ✓ Copy-on-write override test passed")
+
+
+def test_variants_share_fragments():
+    """Test that identical elements across variants are stored once"""
+    from builder_utils.layout_templates import LayoutTemplate
+
+    variant = json.loads(json.dumps(BASE_LAYOUT))
+    variant["children"][1]["options"]["chart"]["type"] = "column"
+
+    first, second = LayoutTemplate.from_variants([BASE_LAYOUT, variant])
+
+    assert first._fragments[0] is second._fragments[0]
+    assert first._fragments[1] is not second._fragments[1]
+    assert json.loads(second.render()) == variant
+
+    viz = second.visualization("Tab")
+    assert viz.title == "Tab"
+    assert viz.layout is second.render()
+
+    print("  ✓ Shared fragment test passed")
+
+
+def main():
+    """Run all layout template tests"""
+    print("=== LAYOUT TEMPLATE TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Render", test_render_matches_layout),
+        ("Copy-on-write Overrides", test_overrides_are_copy_on_write),
+        ("Shared Fragments", test_variants_share_fragments),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All layout template tests passed!")
+        return 0
+    else:
+        print("⚠️ Some layout template tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
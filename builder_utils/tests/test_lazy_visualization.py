@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Lazy Visualization Test Suite
+Tests deferred layout rendering, serialization and preview of lazy visualizations
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _counting_factory(calls, layout):
+    def factory():
+        calls.append(1)
+        return layout
+    return factory
+
+
+def test_layout_renders_on_first_access():
+    """Test that the factory runs once, on first access"""
+    from builder_utils.lazy_visualization import LazySkillVisualization
+
+    calls = []
+    viz = LazySkillVisualization("Tab", _counting_factory(calls, {"type": "Document", "children": []}))
+
+    assert viz.title == "Tab"
+    assert not viz.is_rendered
+    assert calls == []
+
+    assert json.loads(viz.layout) == {"type": "Document", "children": []}
+    assert viz.layout is viz.layout
+    assert viz.is_rendered
+    assert len(calls) == 1
+
+    print("  ✓ First access rendering test passed")
+
+
+def test_output_dump_renders_pending():
+    """Test that dumping a plain SkillOutput includes every layout"""
+    from skill_framework import SkillOutput
+    from builder_utils.lazy_visualization import LazySkillVisualization
+
+    calls = []
+    output = SkillOutput(visualizations=[
+        LazySkillVisualization(f"Tab {i}", _counting_factory(calls, f'{{"tab":{i}}}'))
+        for i in range(5)
+    ])
+    assert not any(viz.is_rendered for viz in output.visualizations)
+    assert calls == []
+
+    dumped = json.loads(output.model_dump_json())
+    assert [viz["layout"] for viz in dumped["visualizations"]] == [f'{{"tab":{i}}}' for i in range(5)]
+    assert all(viz.is_rendered for viz in output.visualizations)
+    assert len(calls) == 5
+
+    single = LazySkillVisualization("Single", lambda: "{}")
+    assert single.model_dump() == {"title": "Single", "layout": "{}"}
+
+    print("  ✓ Output dump test passed")
+
+
+def test_copy_and_pickle():
+    """Test that deepcopy and pickle keep the rendered layout"""
+    import copy
+    import pickle
+    from skill_framework import SkillOutput
+    from builder_utils.lazy_visualization import LazySkillVisualization
+
+    def output():
+        return SkillOutput(visualizations=[LazySkillVisualization("Tab", lambda: {"type": "Document"})])
+
+    original = output()
+    copied = copy.deepcopy(original)
+    assert copied.visualizations[0].layout == '{"type":"Document"}'
+    assert copied.visualizations[0]._render_lock is not original.visualizations[0]._render_lock
+    assert "_render_lock" not in copied.visualizations[0].model_dump()
+    unpickled = pickle.loads(pickle.dumps(output()))
+    assert unpickled.visualizations[0].layout == '{"type":"Document"}'
+    assert unpickled.visualizations[0].is_rendered
+
+    restored = SkillOutput.model_validate_json(output().model_dump_json())
+    assert restored.visualizations[0].layout == '{"type":"Document"}'
+
+    print("  ✓ Copy and pickle test passed")
+
+
+def test_concurrent_first_access():
+    """Test that threads reading an unrendered layout all get the rendered one"""
+    import threading
+    import time
+    from builder_utils.lazy_visualization import LazySkillVisualization
+
+    calls = []
+
+    def slow_factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return "{}"
+
+    viz = LazySkillVisualization("Tab", slow_factory)
+    layouts = []
+    threads = [threading.Thread(target=lambda: layouts.append(viz.layout)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert layouts == ["{}"] * 4
+    assert len(calls) == 1
+
+    # Different visualizations do not wait for each other: each factory needs the other running
+    first_running, second_running, overlapped = threading.Event(), threading.Event(), []
+
+    def first_factory():
+        first_running.set()
+        overlapped.append(second_running.wait(timeout=2))
+        return "{}"
+
+    def second_factory():
+        second_running.set()
+        overlapped.append(first_running.wait(timeout=2))
+        return "{}"
+
+    pair = [LazySkillVisualization("First", first_factory), LazySkillVisualization("Second", second_factory)]
+    threads = [threading.Thread(target=lambda viz=viz: viz.render()) for viz in pair]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert overlapped == [True, True]
+
+    print("  ✓ Concurrent first access test passed")
+
+
+def test_preview_renders_each_tab():
+    """Test that preview_skill writes lazy tabs"""
+    from skill_framework import skill, SkillInput, preview_skill
+    from skill_framework import SkillOutput
+    from builder_utils.lazy_visualization import LazySkillVisualization
+
+    @skill(name="lazy_preview_skill", description="Lazy preview test")
+    def lazy_preview_skill(skill_input: SkillInput) -> SkillOutput:
+        return SkillOutput(visualizations=[
+            LazySkillVisualization(f"Tab {i}", lambda i=i: {"type": "Document", "tab": i})
+            for i in range(3)
+        ])
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            output = lazy_preview_skill(SkillInput(assistant_id="test", arguments=None))
+            preview_skill(lazy_preview_skill, output)
+            with open(".previews/lazy_preview_skill/viz-2.json") as f:
+                preview = json.load(f)
+        finally:
+            os.chdir(original_cwd)
+
+    assert preview["title"] == "Tab 2"
+    assert preview["layout"] == {"type": "Document", "tab": 2}
+
+    print("  ✓ Preview test passed")
+
+
+def main():
+    """Run all lazy visualization tests"""
+    print("=== LAZY VISUALIZATION TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("First Access Rendering", test_layout_renders_on_first_access),
+        ("Output Dump", test_output_dump_renders_pending),
+        ("Copy and Pickle", test_copy_and_pickle),
+        ("Concurrent First Access", test_concurrent_first_access),
+        ("Preview", test_preview_renders_each_tab),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All lazy visualization tests passed!")
+        return 0
+    else:
+        print("⚠️ Some lazy visualization tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Load Test Test Suite
+Tests latency percentiles, request/duration limits, ramp-up and thread/process workers
+"""
+
+import sys
+import os
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+PARAMETERS = {"compact_dtypes": "false"}
+
+
+def test_percentile():
+    """Test interpolated percentiles and the latency summary"""
+    from builder_utils.load_test import LoadResult, Sample, percentile
+
+    values = [0.4, 0.1, 0.3, 0.2, 0.5]
+    assert percentile(values, 50) == 0.3
+    assert percentile(values, 100) == 0.5
+    assert abs(percentile(values, 95) - 0.48) < 1e-9
+    assert percentile([], 99) == 0.0
+
+    result = LoadResult(concurrency=2, mode="thread", ramp_up=1.0, samples=[
+        Sample(0, 0.0, 0.5), Sample(1, 0.5, 1.0, error="boom"), Sample(0, 1.5, 0.5),
+    ])
+    assert result.errors == 1
+    assert result.wall_seconds == 2.0
+    assert result.throughput == 1.0
+    assert result.summary()["requests"] == 2
+    assert result.summary(steady_only=True)["requests"] == 1
+    assert result.to_dict()["steady_latency"]["max"] == 0.5
+
+    print("  ✓ Percentile test passed")
+
+
+def test_thread_load():
+    """Test that thread workers share a request count and ramp-up staggers their starts"""
+    from builder_utils.load_test import run_load
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        result = run_load("special_tab_names", PARAMETERS, concurrency=3, requests=12)
+        assert len(result.samples) == 12 and result.errors == 0
+        assert {sample.worker for sample in result.samples} <= {0, 1, 2}
+        assert result.throughput > 0 and result.summary()["p99"] >= result.summary()["p50"] > 0
+
+        ramped = run_load("special_tab_names", PARAMETERS, concurrency=2, duration=0.5, ramp_up=0.2)
+        first_start = {}
+        for sample in ramped.samples:
+            first_start.setdefault(sample.worker, sample.start)
+        assert first_start[0] < 0.05 and first_start[1] >= 0.1
+        assert all(sample.start < 0.5 for sample in ramped.samples)
+    finally:
+        os.chdir(cwd)
+
+    print("  ✓ Thread load test passed")
+
+
+def test_process_load():
+    """Test that process workers share the request count across processes"""
+    from builder_utils.load_test import run_load
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        result = run_load("special_tab_names", PARAMETERS, concurrency=2, mode="process", requests=6)
+        assert len(result.samples) == 6 and result.errors == 0
+    finally:
+        os.chdir(cwd)
+
+    print("  ✓ Process load test passed")
+
+
+def test_invalid_arguments():
+    """Test that unknown modes and skills are rejected"""
+    from builder_utils.load_test import run_load
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        for kwargs in ({"skill_name": "special_tab_names", "mode": "fiber"}, {"skill_name": "no_such_skill"}):
+            try:
+                run_load(parameters={}, requests=1, **kwargs)
+                assert False, f"{kwargs} should be rejected"
+            except ValueError:
+                pass
+    finally:
+        os.chdir(cwd)
+
+    print("  ✓ Invalid arguments test passed")
+
+
+def main():
+    """Run all load test tests"""
+    print("=== Load Test Tests ===")
+    print()
+
+    tests = [
+        ("Percentile", test_percentile),
+        ("Thread Load", test_thread_load),
+        ("Process Load", test_process_load),
+        ("Invalid Arguments", test_invalid_arguments),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All load test tests passed!")
+        return 0
+    else:
+        print("⚠️ Some load test tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
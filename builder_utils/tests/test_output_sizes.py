@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Output Sizes Test Suite
+Tests layout byte/cell/point counts, export sizes, budget files and the run-skill budget check
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def _chart_and_table_output():
+    import pandas as pd
+    from skill_framework import ExportData, SkillOutput, SkillVisualization
+
+    layout = {
+        "type": "Document",
+        "children": [
+            {"type": "FlexContainer", "children": [
+                {"type": "HighchartsChart", "options": {"series": [{"data": [1, 2, 3]}, {"data": [[0, 1], [1, 2]]}]}},
+                {"type": "DataTable", "columns": [{"name": "a"}, {"name": "b"}], "data": [[1, 2], [3, 4], [5, 6]]},
+            ]},
+        ],
+    }
+    export = ExportData(name="frame", data=pd.DataFrame({"a": range(1000), "b": ["x"] * 1000}))
+    return SkillOutput(
+        final_prompt="",
+        visualizations=[SkillVisualization(title="Chart", layout=json.dumps(layout))],
+        export_data=[export],
+    )
+
+
+def test_measure_output():
+    """Test that layouts report bytes, gzipped bytes, table cells and chart points"""
+    from builder_utils.output_sizes import measure_output
+
+    result = _chart_and_table_output()
+    sizes = measure_output(result)
+
+    viz = sizes.visualizations[0]
+    assert viz.layout_bytes == len(result.visualizations[0].layout.encode("utf-8"))
+    assert 0 < viz.compressed_bytes
+    assert (viz.datatables, viz.datatable_cells) == (1, 6)
+    assert (viz.charts, viz.highcharts_points) == (1, 5)
+
+    export = sizes.exports[0]
+    assert (export.rows, export.columns) == (1000, 2)
+    assert export.memory_bytes > 0 and export.encoded_bytes > 0 and export.format
+
+    assert measure_output(result, encode=False).exports[0].encoded_bytes is None
+    assert viz.minified_saved_bytes is None
+
+    # A minified visualization reports what minifying saved
+    from builder_utils.layout_minifier import minified_visualization
+    minified = minified_visualization("Chart", json.dumps(json.loads(result.visualizations[0].layout), indent=2))
+    result.visualizations.append(minified)
+    viz = measure_output(result, encode=False).visualizations[1]
+    assert viz.minified_saved_bytes == minified.minify_result.saved_bytes > 0
+    assert viz.minified_reduction_pct == minified.minify_result.reduction_pct
+
+    print("  ✓ Measure output test passed")
+
+
+def test_measure_file_backed_exports():
+    """Test that streamed and workbook exports are measured from their files, without encoding"""
+    from skill_framework import SkillOutput
+    from builder_utils.export_encoders import encode_export
+    from builder_utils.output_sizes import measure_output, output_totals
+    from builder_utils.streaming_export import stream_export
+    from builder_utils.workbook_export import workbook_export
+
+    frame = _chart_and_table_output().export_data[0].data
+    with tempfile.TemporaryDirectory() as temp_dir:
+        streamed = stream_export("streamed", [frame], format="csv", directory=temp_dir)
+        exports = [streamed]
+        try:
+            exports.append(workbook_export("workbook", [frame], directory=temp_dir))
+        except ImportError:
+            print("  ⚠️ xlsxwriter not installed, skipping the workbook export")
+        sizes = measure_output(SkillOutput(final_prompt="", export_data=exports))
+
+        for export, size in zip(exports, sizes.exports):
+            assert size.on_disk and size.memory_bytes == 0
+            assert size.encoded_bytes == os.path.getsize(export.data.path)
+        assert (sizes.exports[0].rows, sizes.exports[0].format) == (1000, "csv")
+
+        # The flat totals batch and sweep records use count file-backed exports by file size
+        totals = output_totals(SkillOutput(final_prompt="done", export_data=exports))
+        assert totals["export_bytes"] == sum(size.encoded_bytes for size in sizes.exports)
+        assert (totals["exports"], totals["export_rows"], totals["final_prompt_chars"]) == (len(exports), sum(size.rows or 0 for size in sizes.exports), 4)
+
+    in_memory = measure_output(_chart_and_table_output()).exports[0]
+    assert in_memory.encoded_bytes == encode_export(frame, in_memory.format).size_bytes
+
+    print("  ✓ File-backed export test passed")
+
+
+def test_budget_levels():
+    """Test that a size over its fail limit is one failure and one over its warn limit a warning"""
+    from builder_utils.output_sizes import DEFAULT_BUDGETS, check_budgets, measure_output
+
+    sizes = measure_output(_chart_and_table_output(), encode=False)
+    assert check_budgets(sizes, DEFAULT_BUDGETS) == []
+    # Only a configured budget can fail a run
+    assert all(levels["fail"] is None for levels in DEFAULT_BUDGETS.values())
+
+    budgets = {"datatable_cells": {"warn": 4, "fail": 5}, "highcharts_points": {"warn": 4, "fail": None}}
+    violations = {violation.metric: violation for violation in check_budgets(sizes, budgets)}
+    assert set(violations) == {"datatable_cells", "highcharts_points"}
+    assert (violations["datatable_cells"].level, violations["datatable_cells"].limit) == ("fail", 5)
+    assert violations["highcharts_points"].level == "warn"
+    assert violations["highcharts_points"].subject == "visualization 'Chart'"
+
+    print("  ✓ Budget levels test passed")
+
+
+def test_load_budgets():
+    """Test that a budgets file overlays the defaults, per skill, and rejects unknown metrics"""
+    from builder_utils.output_sizes import DEFAULT_BUDGETS, load_budgets
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "budgets.json")
+        with open(path, "w") as budgets_file:
+            json.dump({"layout_bytes": {"warn": 10}, "skills": {"big": {"layout_bytes": {"fail": 20}}}}, budgets_file)
+
+        budgets = load_budgets(path)
+        assert budgets["layout_bytes"] == {"warn": 10, "fail": DEFAULT_BUDGETS["layout_bytes"]["fail"]}
+        assert load_budgets(path, "big")["layout_bytes"] == {"warn": 10, "fail": 20}
+        assert load_budgets(path, "other")["layout_bytes"]["fail"] == DEFAULT_BUDGETS["layout_bytes"]["fail"]
+
+        with open(path, "w") as budgets_file:
+            json.dump({"layout_size": {"warn": 10}}, budgets_file)
+        try:
+            load_budgets(path)
+            assert False, "unknown metric should be rejected"
+        except ValueError as e:
+            assert "layout_size" in str(e)
+
+    print("  ✓ Load budgets test passed")
+
+
+def test_run_skill_budget_check():
+    """Test that execute_and_report prints the sizes and raises on a fail-level budget"""
+    import contextlib
+    import io
+    from builder_utils.output_sizes import OutputBudgetExceeded
+    from builder_utils.run_skill import execute_and_report
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            execute_and_report("special_tab_names", {"compact_dtypes": "false"}, sizes=True)
+        assert "📏 Output sizes:" in output.getvalue()
+        assert "table cells" in output.getvalue()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "budgets.json")
+            with open(path, "w") as budgets_file:
+                json.dump({"skills": {"special_tab_names": {"datatable_cells": {"fail": 10}}}}, budgets_file)
+            output = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(output):
+                    execute_and_report("special_tab_names", {"compact_dtypes": "false"}, budgets=path)
+                assert False, "fail-level budget should raise"
+            except OutputBudgetExceeded:
+                pass
+            assert "over the fail budget of 10" in output.getvalue()
+
+        # Sizes are opt-in
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            execute_and_report("special_tab_names", {"compact_dtypes": "false"})
+        assert "📏 Output sizes:" not in output.getvalue()
+    finally:
+        os.chdir(cwd)
+
+    print("  ✓ run_skill budget check test passed")
+
+
+def main():
+    """Run all output sizes tests"""
+    print("=== Output Sizes Tests ===")
+    print()
+
+    tests = [
+        ("Measure Output", test_measure_output),
+        ("File-Backed Exports", test_measure_file_backed_exports),
+        ("Budget Levels", test_budget_levels),
+        ("Load Budgets", test_load_budgets),
+        ("run_skill Budget Check", test_run_skill_budget_check),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All output sizes tests passed!")
+        return 0
+    else:
+        print("⚠️ Some output sizes tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Parameter Sweep Test Suite
+Tests combination enumeration/sampling, SQL replay and sweeping a skill against recorded data
+"""
+
+import sys
+import os
+import csv
+import tempfile
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+CHART_SQL = """
+        SELECT
+            segment,
+            SUM(sales) as total_sales
+        FROM w_b6b5_pasta_v8_a65f
+        WHERE sales IS NOT NULL
+        GROUP BY segment
+        ORDER BY total_sales DESC
+        LIMIT {limit}
+        """
+
+
+def test_combinations():
+    """Test the full product, pinned parameters, multi-value axes and seeded sampling"""
+    from builder_utils.param_sweep import combinations, count_combinations, default_parameters, sweep_axes
+    from builder_utils.skill_registry import SkillRegistry
+
+    entry = SkillRegistry(PROJECT_ROOT).get("basic_data_bar_chart")
+    axes = sweep_axes(entry, fixed={"new_metric": "sales"})
+    assert [name for name, _ in axes] == ["dimension", "metric", "limit"]
+    assert dict(axes)["metric"][0] == ["sales"]
+    assert count_combinations(axes) == 6 * 5 * 4
+
+    base = {**default_parameters(entry), "new_metric": "sales"}
+    full = combinations(axes, fixed=base)
+    assert len(full) == 120
+    assert len({tuple(map(str, c.values())) for c in full}) == 120
+    assert full[0] == {"dimension": "segment", "metric": ["sales"], "limit": "5", "new_metric": "sales"}
+    assert full[1]["limit"] == "10"
+
+    sampled = combinations(axes, fixed=base, sample=7, seed=3)
+    assert len(sampled) == 7
+    assert sampled == combinations(axes, fixed=base, sample=7, seed=3)
+    assert all(c in full for c in sampled)
+
+    assert sweep_axes(entry, only=["limit"]) == [("limit", ["5", "10", "15", "20"])]
+
+    print("  ✓ Combinations test passed")
+
+
+def test_sql_replay():
+    """Test that recordings are matched regardless of whitespace and misses are reported"""
+    import pandas as pd
+    from answer_rocket import AnswerRocketClient
+    from builder_utils.sql_replay import MissingRecordingError, load_index, save_recording, sql_replay
+
+    frame = pd.DataFrame({"segment": ["Dry", "Fresh"], "total_sales": [10.5, 3.25]})
+    with tempfile.TemporaryDirectory() as temp_dir:
+        save_recording(temp_dir, CHART_SQL.format(limit=5), frame)
+        assert list(load_index(temp_dir).values())[0]["rows"] == 2
+
+        with sql_replay(temp_dir):
+            client = AnswerRocketClient()
+            result = client.data.execute_sql_query(database_id=os.environ["DATABASE_ID"], sql_query=" ".join(CHART_SQL.format(limit=5).split()))
+            assert result.success
+            pd.testing.assert_frame_equal(result.df, frame)
+
+            try:
+                client.data.execute_sql_query(database_id=os.environ["DATABASE_ID"], sql_query=CHART_SQL.format(limit=10))
+                assert False, "Expected MissingRecordingError"
+            except MissingRecordingError as e:
+                assert "LIMIT 10" in str(e)
+
+    print("  ✓ SQL replay test passed")
+
+
+def test_sweep_against_replay():
+    """Test sweeping a SQL-backed skill with recorded results, including missing recordings"""
+    import pandas as pd
+    from builder_utils.param_sweep import combinations, run_sweep, slow_points, sweep_axes, write_matrix_csv
+    from builder_utils.skill_registry import SkillRegistry
+    from builder_utils.sql_replay import save_recording
+
+    entry = SkillRegistry(PROJECT_ROOT).get("basic_data_bar_chart")
+    fixed = {"dimension": "segment", "metric": ["sales"], "new_metric": "sales"}
+    axes = sweep_axes(entry, fixed=fixed)
+    parameter_sets = combinations(axes, fixed=fixed)
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for limit in (5, 10):
+                frame = pd.DataFrame({"segment": [f"s{i}" for i in range(limit)], "total_sales": [float(i) for i in range(limit)]})
+                save_recording(temp_dir, CHART_SQL.format(limit=limit), frame)
+
+            points = run_sweep(entry.function, parameter_sets, repeat=2, replay_dir=temp_dir, verbose=False)
+
+            matrix_path = os.path.join(temp_dir, "matrix.csv")
+            write_matrix_csv(points, matrix_path)
+            with open(matrix_path, newline="") as matrix_file:
+                rows = list(csv.DictReader(matrix_file))
+    finally:
+        os.chdir(cwd)
+
+    assert [point.parameters["limit"] for point in points] == ["5", "10", "15", "20"]
+    assert [point.status for point in points] == ["ok", "ok", "error", "error"]
+    assert all(len(point.runs) == 2 for point in points[:2])
+    assert points[0].sizes["export_rows"] == 5 and points[1].sizes["export_rows"] == 10
+    assert points[1].sizes["layout_bytes"] > points[0].sizes["layout_bytes"]
+    assert "No recording" in points[2].error
+    assert all(point.status == "ok" for point in slow_points(points, factor=0))
+
+    assert [row["limit"] for row in rows] == ["5", "10", "15", "20"]
+    assert rows[0]["metric"] == "sales" and rows[0]["status"] == "ok" and float(rows[0]["median_ms"]) > 0
+    assert "DATABASE_ID" not in os.environ or os.environ["DATABASE_ID"] != "00000000-0000-0000-0000-000000000000"
+
+    print("  ✓ Replayed sweep test passed")
+
+
+def main():
+    """Run all parameter sweep tests"""
+    print("=== PARAMETER SWEEP TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Combinations", test_combinations),
+        ("SQL Replay", test_sql_replay),
+        ("Replayed Sweep", test_sweep_against_replay),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All parameter sweep tests passed!")
+        return 0
+    else:
+        print("⚠️ Some parameter sweep tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Phase Timing Test Suite
+Tests exclusive phase accounting and the breakdown collected by run_skill
+"""
+
+import sys
+import os
+import json
+import time
+import tempfile
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def test_exclusive_phases():
+    """Test that nested phases are charged exclusively and everything adds up to the total"""
+    from builder_utils.phase_timing import PhaseTimer, phase
+
+    # No active timer: phases are no-ops
+    with phase("fetch"):
+        pass
+
+    timer = PhaseTimer()
+    with timer.activate():
+        with phase("fetch"):
+            time.sleep(0.02)
+        with phase("layout"):
+            time.sleep(0.01)
+            with phase("serialize"):
+                time.sleep(0.05)
+        with phase("layout"):
+            pass
+        time.sleep(0.01)
+
+    phases = {stats.name: stats for stats in timer.breakdown()}
+    assert list(phases) == ["fetch", "layout", "serialize", "other"]
+    assert phases["layout"].calls == 2
+    assert 0.01 <= phases["layout"].seconds < 0.04
+    assert phases["serialize"].seconds >= 0.05
+    assert phases["other"].seconds >= 0.01
+    assert abs(sum(stats.seconds for stats in phases.values()) - timer.total_seconds) < 1e-6
+
+    report = timer.to_dict()
+    assert [entry["name"] for entry in report["phases"]] == ["fetch", "layout", "serialize", "other"]
+    assert abs(sum(entry["percent"] for entry in report["phases"]) - 100) < 0.5
+
+    print("  ✓ Exclusive phases test passed")
+
+
+def test_run_skill_breakdown():
+    """Test the breakdown of a real skill run, including the JSON report"""
+    from builder_utils.phase_timing import PhaseTimer, write_phase_report
+    from builder_utils.run_skill import run_skill
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        timer = PhaseTimer()
+        result = run_skill("export_large_df", {"size_of_df": "50000", "display_rows": "20"}, timer=timer)
+    finally:
+        os.chdir(cwd)
+
+    phases = {stats.name: stats for stats in timer.breakdown()}
+    assert {"fetch", "transform", "layout", "export", "other"} <= set(phases)
+    assert phases["export"].calls == 1
+    assert list(result.export_data[0].data.columns)[0] == "id"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report_path = os.path.join(temp_dir, "timing.json")
+        write_phase_report(timer, report_path, skill="export_large_df")
+        with open(report_path) as report_file:
+            report = json.load(report_file)
+    assert report["skill"] == "export_large_df"
+    assert report["total_ms"] > 0 and report["phases"][0]["name"] == "fetch"
+
+    print("  ✓ run_skill breakdown test passed")
+
+
+def test_serialize_phase_in_chart():
+    """Test that dumps_layout is reported as serialize inside the bar chart's layout phase"""
+    import pandas as pd
+    from builder_utils.phase_timing import PhaseTimer
+    from builder_utils.run_skill import run_skill
+    from builder_utils.sql_replay import save_recording, sql_replay
+
+    sql = ("SELECT segment, SUM(sales) as total_sales FROM w_b6b5_pasta_v8_a65f WHERE sales IS NOT NULL "
+           "GROUP BY segment ORDER BY total_sales DESC LIMIT 10")
+    frame = pd.DataFrame({"segment": [f"s{i}" for i in range(10)], "total_sales": [float(i) for i in range(10)]})
+    parameters = {"dimension": "segment", "metric": ["sales"], "limit": "10", "new_metric": "sales"}
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_recording(temp_dir, sql, frame)
+            timer = PhaseTimer()
+            with sql_replay(temp_dir):
+                run_skill("basic_data_bar_chart", parameters, timer=timer)
+    finally:
+        os.chdir(cwd)
+
+    names = [stats.name for stats in timer.breakdown()]
+    assert names[:4] == ["fetch", "layout", "serialize", "export"]
+    assert timer.phases["serialize"].calls == 1
+
+    print("  ✓ Serialize phase test passed")
+
+
+def main():
+    """Run all phase timing tests"""
+    print("=== PHASE TIMING TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Exclusive Phases", test_exclusive_phases),
+        ("run_skill Breakdown", test_run_skill_breakdown),
+        ("Serialize Phase", test_serialize_phase_in_chart),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All phase timing tests passed!")
+        return 0
+    else:
+        print("⚠️ Some phase timing tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Result Cache Test Suite
+Tests cache keys over skill/helper source, parameters, data settings and epoch, hits, eviction and concurrent readers
+"""
+
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def _write_skill_tree(root: Path):
+    (root / "my_skill_skill").mkdir()
+    (root / "my_skill_skill" / "__init__.py").write_text("")
+    (root / "my_skill_skill" / "helpers.py").write_text("from . import formats\n\ndef title():\n    return 'Sales'\n")
+    (root / "my_skill_skill" / "formats.py").write_text("CURRENCY = '$'\n")
+    (root / "unused.py").write_text("X = 1\n")
+    (root / "my_skill.py").write_text("import json\nfrom my_skill_skill.helpers import title\n")
+
+
+def _output(rows: int = 3):
+    import pandas as pd
+    from skill_framework import ExportData, SkillOutput, SkillVisualization
+
+    return SkillOutput(
+        final_prompt="done",
+        visualizations=[SkillVisualization(title="Chart", layout='{"type":"Document"}')],
+        export_data=[ExportData(name="rows", data=pd.DataFrame({"a": range(rows)}))],
+    )
+
+
+def test_source_files():
+    """Test that imported repo helpers are followed and other files are not"""
+    from builder_utils.result_cache import source_files
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir).resolve()
+        _write_skill_tree(root)
+        files = [str(path.relative_to(root)) for path in source_files(root / "my_skill.py", root)]
+        assert files == ["my_skill.py", "my_skill_skill/__init__.py", "my_skill_skill/formats.py", "my_skill_skill/helpers.py"]
+
+    print("  ✓ Source files test passed")
+
+
+def test_cache_key():
+    """Test that the key ignores parameter order but changes with helper source, parameters, data settings and epoch"""
+    from builder_utils.result_cache import ResultCache
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        _write_skill_tree(root)
+        cache = ResultCache(root=root)
+
+        key = cache.key("my_skill", {"a": 1, "b": [1, 2]})
+        assert key == cache.key("my_skill", {"b": [1, 2], "a": 1})
+        assert key != cache.key("my_skill", {"a": 2, "b": [1, 2]})
+
+        (root / "unused.py").write_text("X = 2\n")
+        assert key == cache.key("my_skill", {"a": 1, "b": [1, 2]})
+        (root / "my_skill_skill" / "formats.py").write_text("CURRENCY = 'EUR'\n")
+        edited = cache.key("my_skill", {"a": 1, "b": [1, 2]})
+        assert edited != key
+
+        assert cache.bump_epoch() == "1"
+        bumped = cache.key("my_skill", {"a": 1, "b": [1, 2]})
+        assert bumped != edited
+
+        # Another database, from .env or the environment, is another key
+        saved = {name: os.environ.pop(name, None) for name in ("DATABASE_ID", "DATASET_ID")}
+        try:
+            unset = cache.key("my_skill", {"a": 1, "b": [1, 2]})
+            (root / ".env").write_text("DATABASE_ID=first\n")
+            from_dotenv = cache.key("my_skill", {"a": 1, "b": [1, 2]})
+            assert from_dotenv != unset
+            os.environ["DATABASE_ID"] = "second"
+            assert cache.key("my_skill", {"a": 1, "b": [1, 2]}) not in (unset, from_dotenv)
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+        try:
+            cache.key("missing_skill")
+            assert False, "unknown skills cannot be keyed"
+        except ValueError:
+            pass
+
+    print("  ✓ Cache key test passed")
+
+
+def test_put_get_and_eviction():
+    """Test the round trip, plain copies of lazy outputs, and LRU eviction by count and size"""
+    import time
+    from builder_utils.background_export import BackgroundExport
+    from skill_framework import SkillOutput
+    from builder_utils.lazy_visualization import LazySkillVisualization
+    from builder_utils.result_cache import ResultCache
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResultCache(root=temp_dir, max_entries=2)
+        assert cache.get("absent") is None
+
+        lazy = SkillOutput(
+            final_prompt="lazy",
+            visualizations=[LazySkillVisualization("Lazy", lambda: {"type": "Document"})],
+            export_data=[BackgroundExport("bg", _output().export_data[0].data)],
+        )
+        lazy.export_data[0].wait()
+        assert cache.put("lazy", lazy) > 0
+        restored = cache.get("lazy")
+        assert type(restored).__name__ == "SkillOutput"
+        assert restored.final_prompt == "lazy"
+        assert restored.visualizations[0].layout == '{"type":"Document"}'
+        assert list(restored.export_data[0].data["a"]) == [0, 1, 2]
+
+        cache.put("second", _output())
+        past = time.time() - 60
+        os.utime(cache.directory / "lazy.pkl", (past, past))
+        os.utime(cache.directory / "second.pkl", (past + 1, past + 1))
+        cache.get("lazy")  # now the most recently used
+        cache.put("third", _output())
+        assert cache.get("second") is None
+        assert cache.get("lazy") is not None and cache.get("third") is not None
+
+        cache.max_bytes = cache.stats().total_bytes - 1
+        assert cache.evict() == 1 and cache.stats().entries == 1
+        assert cache.put("huge", _output(100_000)) is None
+
+        from builder_utils.streaming_export import stream_export
+        streamed = _output()
+        streamed.export_data = [stream_export("rows", [streamed.export_data[0].data], format="csv", directory=temp_dir)]
+        assert cache.put("streamed", streamed) is None
+        assert cache.get("streamed") is None
+        assert cache.clear() == 1 and cache.stats().entries == 0
+
+    print("  ✓ Put/get and eviction test passed")
+
+
+def test_concurrent_readers():
+    """Test that readers racing a writer always get a whole entry"""
+    from builder_utils.result_cache import ResultCache
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResultCache(root=temp_dir)
+        cache.put("shared", _output(10))
+        failures = []
+        stop = threading.Event()
+
+        def read():
+            while not stop.is_set():
+                result = cache.get("shared")
+                if result is None or len(result.export_data[0].data) not in (10, 20):
+                    failures.append(result)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(20):
+            cache.put("shared", _output(10 if i % 2 else 20))
+        stop.set()
+        for reader in readers:
+            reader.join()
+        assert not failures
+        assert not list(Path(temp_dir, ".skill_output_cache").glob("*.tmp"))
+
+    print("  ✓ Concurrent readers test passed")
+
+
+def test_cached_run_skill():
+    """Test that a hit skips running the skill"""
+    from builder_utils.result_cache import ResultCache, cached_run_skill
+
+    calls = []
+
+    def counting_skill(skill_input):
+        calls.append(skill_input)
+        return _output()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResultCache(root=PROJECT_ROOT, directory=temp_dir)
+        parameters = {"compact_dtypes": "false"}
+        first, hit = cached_run_skill(cache, "special_tab_names", parameters, skill_function=counting_skill)
+        assert not hit and len(calls) == 1
+        second, hit = cached_run_skill(cache, "special_tab_names", dict(parameters), skill_function=counting_skill)
+        assert hit and len(calls) == 1
+        assert second.final_prompt == first.final_prompt
+
+    print("  ✓ cached_run_skill test passed")
+
+
+def main():
+    """Run all result cache tests"""
+    print("=== Result Cache Tests ===")
+    print()
+
+    tests = [
+        ("Source Files", test_source_files),
+        ("Cache Key", test_cache_key),
+        ("Put/Get and Eviction", test_put_get_and_eviction),
+        ("Concurrent Readers", test_concurrent_readers),
+        ("cached_run_skill", test_cached_run_skill),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All result cache tests passed!")
+        return 0
+    else:
+        print("⚠️ Some result cache tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Shared Frame Test Suite
+Tests JSON fragment splicing and the memory cost of serializing a shared frame
+"""
+
+import sys
+import os
+import json
+import tracemalloc
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def test_fragments_splice_into_layout():
+    """Test that fragments replace their placeholders and the result is valid JSON"""
+    from builder_utils.shared_frame import SharedFrame, dumps_layout
+    import numpy as np
+    import pandas as pd
+
+    frame = pd.DataFrame({
+        "brand": ['Acme "Deluxe"', None, "Zed"],
+        "sales": [1.5, np.nan, 3.25],
+    })
+    shared = SharedFrame(frame)
+
+    layout = {
+        "title": "__fragment_lookalike_0",
+        "options": {"xAxis": {"categories": shared.column_json(0)}, "series": [{"data": shared.column_json("sales")}]},
+        "table": shared.rows_json(),
+    }
+    parsed = json.loads(dumps_layout(layout))
+
+    assert parsed["title"] == "__fragment_lookalike_0"
+    assert parsed["options"]["xAxis"]["categories"] == ['Acme "Deluxe"', None, "Zed"]
+    assert parsed["options"]["series"][0]["data"] == [1.5, None, 3.25]
+    assert parsed["table"] == [['Acme "Deluxe"', 1.5], [None, None], ["Zed", 3.25]]
+    assert dumps_layout({"plain": [1, 2]}) == json.dumps({"plain": [1, 2]})
+
+    print("  ✓ Fragment splicing test passed")
+
+
+def test_export_shares_frame():
+    """Test that the export reads the same frame object the layout was built from"""
+    from builder_utils.export_encoders import encode_export
+    from builder_utils.shared_frame import SharedFrame
+    import pandas as pd
+
+    frame = pd.DataFrame({"brand": ["a", "b"], "sales": [1.0, 2.0]})
+    shared = SharedFrame(frame)
+    export = shared.export("sales_by_brand")
+
+    assert export.data is frame
+    assert encode_export(export, "csv").payload.decode("utf-8").splitlines()[0] == "brand,sales"
+
+    print("  ✓ Shared export test passed")
+
+
+def test_serialization_peak_memory():
+    """Test that building a chart layout needs about 1x the data size beyond the layout itself"""
+    from builder_utils.shared_frame import SharedFrame, dumps_layout
+    import numpy as np
+    import pandas as pd
+
+    rows = 500_000
+    rng = np.random.default_rng(0)
+    shared = SharedFrame(pd.DataFrame({
+        "brand": np.arange(rows),
+        "sales": rng.random(rows),
+        "volume": rng.integers(0, 1000, rows),
+    }))
+
+    tracemalloc.start()
+    layout = dumps_layout({
+        "categories": shared.column_json(0),
+        "series": [{"name": name, "data": shared.column_json(name)} for name in ("sales", "volume")],
+    })
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    overhead = (peak - sys.getsizeof(layout)) / shared.nbytes
+    assert overhead < 1.5, f"serialization overhead is {overhead:.2f}x the data size"
+
+    print(f"  ✓ Peak memory test passed ({overhead:.2f}x data size beyond the layout)")
+
+
+def main():
+    """Run all shared frame tests"""
+    print("=== SHARED FRAME TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Fragment Splicing", test_fragments_splice_into_layout),
+        ("Shared Export", test_export_shares_frame),
+        ("Peak Memory", test_serialization_peak_memory),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All shared frame tests passed!")
+        return 0
+    else:
+        print("⚠️ Some shared frame tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
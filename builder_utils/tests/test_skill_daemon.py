@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Skill Daemon Test Suite
+Tests the warm runner daemon protocol, module reloading (skill and helpers) and client fallback
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+import textwrap
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+SKILL_TEMPLATE = textwrap.dedent('''
+    from skill_framework import skill, SkillParameter, SkillInput, SkillOutput
+
+    @skill(
+        name="greeter",
+        parameters=[SkillParameter(name="who", default_value="world")]
+    )
+    def greeter(skill_input: SkillInput) -> SkillOutput:
+        return SkillOutput(final_prompt="{greeting}, " + skill_input.arguments.who)
+''')
+
+
+def _write_skill(root, greeting):
+    path = root / "greeter.py"
+    path.write_text(SKILL_TEMPLATE.replace("{greeting}", greeting), encoding="utf-8")
+    # Make sure the change is visible even on filesystems with coarse mtimes
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _start_daemon(root):
+    from builder_utils.skill_daemon import SkillDaemon
+
+    daemon = SkillDaemon(root, root / "daemon.sock")
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    return daemon, thread
+
+
+def test_run_and_reload():
+    """Test that runs go through the daemon and a module is re-imported only after it changes"""
+    from builder_utils.skill_daemon import request_run, request_shutdown, request_status
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        (root / "skills.txt").write_text("greeter\n", encoding="utf-8")
+        _write_skill(root, "Hello")
+        daemon, thread = _start_daemon(root)
+        socket_path = root / "daemon.sock"
+
+        try:
+            response = request_run("greeter", {"who": "daemon"}, socket_path=socket_path)
+            assert response["ok"], response["output"]
+            assert "Hello, daemon" in response["output"]
+            assert response["pid"] == os.getpid()
+            first_module = daemon._modules[root / "greeter.py"][1]
+
+            request_run("greeter", {"who": "again"}, socket_path=socket_path)
+            assert daemon._modules[root / "greeter.py"][1] is first_module
+
+            _write_skill(root, "Goodbye")
+            response = request_run("greeter", {"who": "daemon"}, socket_path=socket_path)
+            assert "Goodbye, daemon" in response["output"]
+            assert daemon._modules[root / "greeter.py"][1] is not first_module
+
+            failed = request_run("missing_skill", {}, socket_path=socket_path)
+            assert not failed["ok"] and "not found" in failed["output"]
+
+            status = request_status(socket_path)
+            assert status["runs"] == 4 and status["cached_modules"] == ["greeter.py"]
+        finally:
+            request_shutdown(socket_path)
+            thread.join(timeout=5)
+            daemon.server_close()
+
+        assert not socket_path.exists()
+
+    print("  ✓ Run and reload test passed")
+
+
+def test_helper_change_reloads():
+    """Test that editing a repo module the skill imports invalidates the cached skill"""
+    from builder_utils.skill_daemon import SkillDaemon
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        (root / "skills.txt").write_text("helped\n", encoding="utf-8")
+        (root / "helped_skill").mkdir()
+        (root / "helped_skill" / "__init__.py").write_text("")
+        words = root / "helped_skill" / "words.py"
+        words.write_text("GREETING = 'Hello'\n")
+        (root / "helped.py").write_text(textwrap.dedent('''
+            from skill_framework import skill, SkillInput, SkillOutput
+            from helped_skill.words import GREETING
+
+            @skill(name="helped")
+            def helped(skill_input: SkillInput) -> SkillOutput:
+                return SkillOutput(final_prompt=GREETING)
+        '''))
+        sys.path.insert(0, str(root))
+        daemon = SkillDaemon(root, root / "daemon.sock")
+        try:
+            first = daemon.load_skill("helped")
+            assert daemon.load_skill("helped") is first
+
+            words.write_text("GREETING = 'Goodbye'\n")
+            stat = words.stat()
+            os.utime(words, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            response = daemon.run({"skill": "helped", "parameters": {}, "sizes": False})
+            assert response["ok"], response["output"]
+            assert "Goodbye" in response["output"]
+            assert daemon.load_skill("helped") is not first
+        finally:
+            daemon.server_close()
+            sys.path.remove(str(root))
+            for name in [name for name in sys.modules if name.startswith("helped")]:
+                del sys.modules[name]
+
+    print("  ✓ Helper change reload test passed")
+
+
+def test_client_fallback():
+    """Test that clients get None without a daemon, including for a stale socket file"""
+    from builder_utils.skill_daemon import SkillDaemon, request_run, request_status
+    import socket
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        socket_path = root / "daemon.sock"
+        assert request_run("greeter", {}, socket_path=socket_path) is None
+
+        # Leave a socket file behind with nobody listening
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+        assert socket_path.exists()
+        assert request_status(socket_path) is None
+
+        # A new daemon replaces the stale socket
+        daemon = SkillDaemon(root, socket_path)
+        try:
+            assert socket_path.exists()
+            # Only the owner can connect
+            assert socket_path.stat().st_mode & 0o077 == 0
+            try:
+                SkillDaemon(root, socket_path)
+                assert False, "Expected RuntimeError for a second daemon"
+            except RuntimeError:
+                pass
+        finally:
+            daemon.server_close()
+
+    print("  ✓ Client fallback test passed")
+
+
+def main():
+    """Run all skill daemon tests"""
+    print("=== SKILL DAEMON TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Run and Reload", test_run_and_reload),
+        ("Helper Change Reload", test_helper_change_reloads),
+        ("Client Fallback", test_client_fallback),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All skill daemon tests passed!")
+        return 0
+    else:
+        print("⚠️ Some skill daemon tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
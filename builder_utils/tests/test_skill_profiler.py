@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Skill Profiler Test Suite
+Tests cProfile and sampling runs, collapsed stacks and the repo-code hotspot filter
+"""
+
+import sys
+import os
+import time
+import pstats
+import tempfile
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+PARAMETERS = {"size_of_df": "200000", "display_rows": "500"}
+
+
+def _busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_stack_sampler():
+    """Test that samples are rooted at the caller and convert to loadable pstats"""
+    import marshal
+    from builder_utils.skill_profiler import StackSampler
+
+    with StackSampler(interval=0.001) as sampler:
+        _busy(0.1)
+
+    assert sampler.sample_count > 10
+    lines = sampler.collapsed_lines()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert all(line.startswith("_busy (test_skill_profiler.py:") for line in lines)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "busy.prof")
+        with open(path, "wb") as prof_file:
+            marshal.dump(sampler.to_pstats(), prof_file)
+        stats = pstats.Stats(path)
+    busy = [values for (file, line, name), values in stats.stats.items() if name == "_busy"][0]
+    cc, nc, tt, ct, callers = busy
+    assert nc == sampler.sample_count
+    assert 0.05 < ct < 1.0
+
+    print("  ✓ Stack sampler test passed")
+
+
+def test_cprofile_hotspots():
+    """Test a cProfile run of a skill and the repo-only hotspot list"""
+    from builder_utils.skill_profiler import profile_skill, repo_hotspots
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = profile_skill("export_large_df", PARAMETERS, mode="cprofile", output_prefix=os.path.join(temp_dir, "large"))
+            assert os.path.exists(result.prof_path) and result.collapsed_path is None
+            hotspots = repo_hotspots(result.stats, root=PROJECT_ROOT)
+    finally:
+        os.chdir(cwd)
+
+    functions = [hotspot.function for hotspot in hotspots]
+    assert "export_large_df" in functions and "generate_synthetic_rows" in functions
+    assert all(not hotspot.file.startswith("..") and "site-packages" not in hotspot.file for hotspot in hotspots)
+    assert [h.cumulative_seconds for h in hotspots] == sorted((h.cumulative_seconds for h in hotspots), reverse=True)
+
+    print("  ✓ cProfile hotspots test passed")
+
+
+def test_sampling_profile():
+    """Test that a sampling run writes both the .prof and the collapsed stacks"""
+    from builder_utils.skill_profiler import profile_skill, repo_hotspots
+
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = profile_skill("export_large_df", PARAMETERS, mode="sampling", output_prefix=os.path.join(temp_dir, "large"))
+            with open(result.collapsed_path) as collapsed_file:
+                lines = collapsed_file.read().splitlines()
+            hotspots = repo_hotspots(pstats.Stats(result.prof_path), root=PROJECT_ROOT)
+    finally:
+        os.chdir(cwd)
+
+    assert result.samples > 0
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == result.samples
+    assert all(line.startswith("run_skill (run_skill.py:") for line in lines)
+    # The skill is run_skill's only callee, so their cumulative sample counts are close
+    assert hotspots[0].function in ("run_skill", "export_large_df")
+
+    try:
+        profile_skill("export_large_df", PARAMETERS, mode="perf")
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+    print("  ✓ Sampling profile test passed")
+
+
+def main():
+    """Run all skill profiler tests"""
+    print("=== SKILL PROFILER TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Stack Sampler", test_stack_sampler),
+        ("cProfile Hotspots", test_cprofile_hotspots),
+        ("Sampling Profile", test_sampling_profile),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All skill profiler tests passed!")
+        return 0
+    else:
+        print("⚠️ Some skill profiler tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
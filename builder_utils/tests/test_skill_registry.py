@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Skill Registry Test Suite
+Tests static @skill scanning, the cached index and import-free listing
+"""
+
+import sys
+import os
+import subprocess
+import tempfile
+import textwrap
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+SKILL_SOURCE = textwrap.dedent('''
+    import pandas as pd
+    from skill_framework import skill, SkillParameter, SkillInput, SkillOutput
+
+    LIMITS = ["5", "10"]
+
+    def helper():
+        return 1
+
+    @skill(
+        name="Sales Report",
+        llm_name="sales_report_llm",
+        description="Reports sales",
+        parameters=[
+            SkillParameter(name="metric", constrained_values=["sales", "volume"], default_value="sales"),
+            SkillParameter(name="limit", constrained_values=LIMITS, default_value="5", is_multi=False),
+        ]
+    )
+    def sales_report(skill_input: SkillInput) -> SkillOutput:
+        return SkillOutput(final_prompt=str(skill_input.arguments.metric))
+''')
+
+
+def _make_project(temp_dir):
+    root = Path(temp_dir)
+    (root / "skills.txt").write_text("# registered skills\nsales_report\nmissing_skill\n\n", encoding="utf-8")
+    (root / "sales_report.py").write_text(SKILL_SOURCE, encoding="utf-8")
+    return root
+
+
+def test_scan_skill_file():
+    """Test that decorator arguments and parameters are read without importing the file"""
+    from builder_utils.skill_registry import scan_skill_file
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        entries = scan_skill_file(_make_project(temp_dir) / "sales_report.py")
+
+    assert len(entries) == 1
+    entry = entries[0]
+    assert (entry.name, entry.function, entry.file, entry.llm_name) == ("Sales Report", "sales_report", "sales_report.py", "sales_report_llm")
+    assert [parameter.name for parameter in entry.parameters] == ["metric", "limit"]
+    assert entry.parameters[0].constrained_values == ["sales", "volume"]
+    # Non-literal values are recorded as unknown
+    assert entry.parameters[1].constrained_values is None
+    assert entry.parameters[1].default_value == "5"
+
+    print("  ✓ Static scan test passed")
+
+
+def test_lookup_and_index_cache():
+    """Test lookup keys and that unchanged files are served from the index"""
+    from builder_utils import skill_registry
+    from builder_utils.skill_registry import SkillRegistry
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = _make_project(temp_dir)
+        registry = SkillRegistry(root)
+
+        for key in ("sales_report", "Sales Report", "sales_report_llm"):
+            assert registry.get(key).function == "sales_report"
+        assert registry.get("missing_skill") is None
+        assert (root / ".skill_index.json").exists()
+
+        scans = []
+        original_scan = skill_registry.scan_skill_file
+        skill_registry.scan_skill_file = lambda path: scans.append(path) or original_scan(path)
+        try:
+            assert SkillRegistry(root).refresh() is False
+            assert scans == []
+
+            # A touch without a content change updates the index but does not re-parse
+            stat = (root / "sales_report.py").stat()
+            os.utime(root / "sales_report.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert SkillRegistry(root).refresh() is True
+            assert scans == []
+
+            (root / "sales_report.py").write_text(SKILL_SOURCE.replace('"Sales Report"', '"Sales Summary"'), encoding="utf-8")
+            changed = SkillRegistry(root)
+            assert changed.refresh() is True
+            assert len(scans) == 1
+            assert changed.get("Sales Summary").function == "sales_report"
+            assert changed.get("Sales Report") is None
+        finally:
+            skill_registry.scan_skill_file = original_scan
+
+    print("  ✓ Lookup and index cache test passed")
+
+
+def test_listing_skips_heavy_imports():
+    """Test that listing the repo's skills imports neither pandas nor answer_rocket"""
+    script = (
+        "import sys\n"
+        "from builder_utils.skill_registry import SkillRegistry\n"
+        "registry = SkillRegistry()\n"
+        "assert registry.get('export_large_df').name == 'large_df'\n"
+        "print(len(registry.entries), 'pandas' in sys.modules, 'answer_rocket' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    count, pandas_loaded, answer_rocket_loaded = result.stdout.split()
+
+    with open(os.path.join(PROJECT_ROOT, "skills.txt")) as skills_file:
+        assert int(count) == len([line for line in skills_file if line.strip()])
+    assert pandas_loaded == "False"
+    assert answer_rocket_loaded == "False"
+
+    print("  ✓ Import-free listing test passed")
+
+
+def main():
+    """Run all skill registry tests"""
+    print("=== SKILL REGISTRY TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Static Scan", test_scan_skill_file),
+        ("Lookup and Index Cache", test_lookup_and_index_cache),
+        ("Import-Free Listing", test_listing_skips_heavy_imports),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All skill registry tests passed!")
+        return 0
+    else:
+        print("⚠️ Some skill registry tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Skill Watch Test Suite
+Tests change detection over the skill's imports, reloading only changed helper modules, and phase timing deltas between runs
+"""
+
+import sys
+import os
+import contextlib
+import io
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+SKILL_SOURCE = '''
+from skill_framework import skill, SkillInput, SkillOutput
+from watched_demo_skill.helpers import message
+from watched_demo_skill import stable
+
+@skill(name="watched_demo", description="Watch test skill", parameters=[])
+def watched_demo(skill_input: SkillInput) -> SkillOutput:
+    stable.CALLS.append(1)
+    return SkillOutput(final_prompt=message())
+'''
+
+
+def _bump(path: Path, source: str):
+    """Rewrite a file so its signature changes even within one mtime tick"""
+    path.write_text(source)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@contextlib.contextmanager
+def _skill_tree():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        (root / "watched_demo_skill").mkdir()
+        (root / "watched_demo_skill" / "__init__.py").write_text("")
+        (root / "watched_demo_skill" / "helpers.py").write_text("def message():\n    return 'v1'\n")
+        (root / "watched_demo_skill" / "stable.py").write_text("CALLS = []\n")
+        (root / "watched_demo.py").write_text(SKILL_SOURCE)
+        sys.path.insert(0, str(root))
+        try:
+            yield root
+        finally:
+            sys.path.remove(str(root))
+            for name in [name for name in sys.modules if name.startswith("watched_demo")]:
+                del sys.modules[name]
+
+
+def test_change_detection():
+    """Test that edits, newly imported files and deletions among the skill's imports are seen"""
+    from builder_utils.skill_watch import SkillWatcher
+
+    with _skill_tree() as root:
+        watcher = SkillWatcher("watched_demo", {}, root=root)
+        assert watcher.changed_files() == []
+        assert [path.name for path in watcher.watched_files()] == ["watched_demo.py", "__init__.py", "helpers.py", "stable.py"]
+
+        # A file nothing imports is not watched; importing it adds it to the watch set
+        (root / "watched_demo_skill" / "extra.py").write_text("")
+        (root / "unrelated.py").write_text("")
+        assert watcher.changed_files() == []
+        _bump(root / "watched_demo_skill" / "helpers.py", "from watched_demo_skill import extra\n\ndef message():\n    return 'v2'\n")
+        assert [path.name for path in watcher.changed_files()] == ["extra.py", "helpers.py"]
+
+        (root / "watched_demo_skill" / "extra.py").unlink()
+        assert [path.name for path in watcher.changed_files()] == ["extra.py"]
+        assert watcher.changed_files() == []
+
+    print("  ✓ Change detection test passed")
+
+
+def test_reload_changed_module_only():
+    """Test that a helper edit reloads that module and the skill, and keeps other modules' state"""
+    from builder_utils.skill_watch import SkillWatcher
+
+    with _skill_tree() as root:
+        watcher = SkillWatcher("watched_demo", {}, root=root)
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert watcher.run().final_prompt == "v1"
+        stable = sys.modules["watched_demo_skill.stable"]
+
+        _bump(root / "watched_demo_skill" / "helpers.py", "def message():\n    return 'v2'\n")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            assert watcher.poll()
+        assert "Reloaded: watched_demo_skill.helpers, watched_demo" in output.getvalue()
+        assert "vs previous run" in output.getvalue()
+        assert watcher.previous_timer is not None and watcher.runs == 2
+
+        # The untouched module is the same object, with the state from both runs
+        assert sys.modules["watched_demo_skill.stable"] is stable
+        assert len(stable.CALLS) == 2
+        assert watcher.skill_function is not None
+
+        _bump(root / "watched_demo_skill" / "helpers.py", "def message(:\n")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            assert watcher.poll()
+        assert "❌ Error" in output.getvalue()
+        assert not watcher.poll()
+
+    print("  ✓ Reload changed module only test passed")
+
+
+def test_phase_delta():
+    """Test the per-phase delta table against the previous run"""
+    from builder_utils.phase_timing import PhaseStats, PhaseTimer, print_phase_delta
+
+    previous, current = PhaseTimer(), PhaseTimer()
+    previous.phases = {"fetch": PhaseStats("fetch", 0.2, 1), "legacy": PhaseStats("legacy", 0.05, 1)}
+    previous.total_seconds = 0.3
+    current.phases = {"fetch": PhaseStats("fetch", 0.1, 1)}
+    current.total_seconds = 0.15
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        print_phase_delta(current, previous)
+    lines = output.getvalue().splitlines()
+    assert "-150.0 ms vs previous run" in lines[1]
+    rows = {line.split()[0]: line.split()[1:] for line in lines[3:]}
+    assert list(rows) == ["fetch", "legacy", "other"]
+    assert rows["fetch"] == ["100.0", "200.0", "-100.0"]
+    assert rows["legacy"] == ["0.0", "50.0", "-50.0"]
+
+    print("  ✓ Phase delta test passed")
+
+
+def main():
+    """Run all skill watch tests"""
+    print("=== Skill Watch Tests ===")
+    print()
+
+    tests = [
+        ("Change Detection", test_change_detection),
+        ("Reload Changed Module Only", test_reload_changed_module_only),
+        ("Phase Delta", test_phase_delta),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All skill watch tests passed!")
+        return 0
+    else:
+        print("⚠️ Some skill watch tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
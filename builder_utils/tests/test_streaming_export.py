@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Streaming Export Test Suite
+Tests chunked Parquet/CSV/Arrow export sinks and file-backed ExportData
+"""
+
+import sys
+import os
+import tempfile
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _chunks(chunk_count, chunk_rows):
+    import pandas as pd
+
+    for index in range(chunk_count):
+        start = index * chunk_rows
+        yield pd.DataFrame({
+            'id': range(start, start + chunk_rows),
+            'category': ['A', 'B'] * (chunk_rows // 2),
+            'score': [0.5] * chunk_rows
+        })
+
+
+def test_csv_stream_roundtrip():
+    """Test that CSV chunks are appended under a single header"""
+    from builder_utils.streaming_export import stream_export, ExportFile
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        export = stream_export("Sales @ Q1", _chunks(3, 10), format="csv", directory=temp_dir)
+
+        assert export.name == "Sales @ Q1"
+        assert isinstance(export.data, ExportFile)
+        assert export.data.shape == (30, 3)
+        assert os.path.basename(export.data.path) == "Sales___Q1.csv"
+
+        frame = export.data.to_pandas()
+        assert list(frame.columns) == ['id', 'category', 'score']
+        assert frame['id'].tolist() == list(range(30))
+        assert [len(chunk) for chunk in export.data.iter_chunks(chunk_rows=12)] == [12, 12, 6]
+
+    print("  ✓ CSV streaming test passed")
+
+
+def test_parquet_stream_roundtrip():
+    """Test that Parquet chunks land in one file with a shared schema"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("  ⚠️ pyarrow not installed, skipping Parquet streaming test")
+        return
+
+    from builder_utils.streaming_export import stream_export
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        export = stream_export("large_df", _chunks(4, 50), format="parquet", directory=temp_dir)
+
+        assert export.data.shape == (200, 3)
+        assert export.data.size_bytes > 0
+        frame = export.data.to_pandas()
+        assert frame['id'].tolist() == list(range(200))
+        assert sum(len(chunk) for chunk in export.data.iter_chunks(chunk_rows=64)) == 200
+
+    print("  ✓ Parquet streaming test passed")
+
+
+def test_arrow_stream_memory_map():
+    """Test that Arrow IPC exports map back without copying column buffers"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        print("  ⚠️ pyarrow not installed, skipping Arrow streaming test")
+        return
+
+    from builder_utils.streaming_export import stream_export
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        export = stream_export("large_df", _chunks(3, 40), format="arrow", directory=temp_dir)
+
+        assert os.path.basename(export.data.path) == "large_df.arrow"
+        assert export.data.shape == (120, 3)
+
+        allocated_before = pa.total_allocated_bytes()
+        table = export.data.memory_map()
+        assert table.num_rows == 120
+        assert table.column("id").to_pylist() == list(range(120))
+        # Buffers live in the mapping, not in the Arrow memory pool
+        assert pa.total_allocated_bytes() == allocated_before
+
+        assert export.data.to_pandas()['score'].sum() == 60.0
+        assert [len(chunk) for chunk in export.data.iter_chunks(chunk_rows=50)] == [40, 40, 40]
+
+        csv_export = stream_export("large_csv", _chunks(1, 10), format="csv", directory=temp_dir)
+        try:
+            csv_export.data.memory_map()
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+
+    print("  ✓ Arrow memory-map test passed")
+
+
+def test_temporary_directory_cleanup():
+    """Test that stream_export's own temporary directory is deleted with its ExportFile"""
+    import gc
+    import pickle
+    from builder_utils.streaming_export import stream_export
+
+    export = stream_export("large_csv", _chunks(1, 10), format="csv")
+    directory = export.data.owned_directory
+    assert directory is not None and os.path.isfile(export.data.path)
+
+    # A copy points at the same file without owning it
+    copied = pickle.loads(pickle.dumps(export))
+    assert copied.data.owned_directory is None
+    del copied
+    gc.collect()
+    assert os.path.isdir(directory)
+
+    del export
+    gc.collect()
+    assert not os.path.exists(directory)
+
+    with stream_export("large_csv", _chunks(1, 10), format="csv").data as export_file:
+        directory = export_file.owned_directory
+        assert os.path.isdir(directory)
+    assert not os.path.exists(directory)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        export = stream_export("large_csv", _chunks(1, 10), format="csv", directory=temp_dir)
+        assert export.data.owned_directory is None
+        export.data.cleanup()
+        assert os.path.isfile(export.data.path)
+
+    print("  ✓ Temporary directory cleanup test passed")
+
+
+def test_rejects_unknown_format():
+    """Test that unsupported sink formats are rejected"""
+    from builder_utils.streaming_export import ChunkedExportWriter
+
+    try:
+        ChunkedExportWriter("out.xyz", format="xyz")
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+    print("  ✓ Format validation test passed")
+
+
+def main():
+    """Run all streaming export tests"""
+    print("=== STREAMING EXPORT TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("CSV Streaming", test_csv_stream_roundtrip),
+        ("Parquet Streaming", test_parquet_stream_roundtrip),
+        ("Arrow Memory Map", test_arrow_stream_memory_map),
+        ("Temporary Directory Cleanup", test_temporary_directory_cleanup),
+        ("Format Validation", test_rejects_unknown_format),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All streaming export tests passed!")
+        return 0
+    else:
+        print("⚠️ Some streaming export tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Synthetic Data Test Suite
+Tests standard and compact synthetic frames used by the export skills
+"""
+
+import sys
+import os
+import tempfile
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def test_compact_dtypes():
+    """Test compact dtypes and the RangeIndex-backed id"""
+    import numpy as np
+    import pandas as pd
+    from builder_utils.synthetic_data import generate_synthetic_rows, with_id_column
+
+    df = generate_synthetic_rows(11, 1000, compact=True)
+
+    assert list(df.columns) == ['value', 'category', 'score']
+    assert df['value'].dtype == np.uint8
+    assert isinstance(df['category'].dtype, pd.CategoricalDtype)
+    assert df['score'].dtype == np.float32
+    assert isinstance(df.index, pd.RangeIndex) and df.index.name == 'id'
+    assert df['value'].between(0, 99).all()
+
+    restored = with_id_column(df)
+    assert list(restored.columns) == ['id', 'value', 'category', 'score']
+    assert restored['id'].iloc[0] == 11 and restored['id'].iloc[-1] == 1010
+    # The id column is the only new data; the other columns share df's buffers
+    assert restored['id'].dtype == np.uint32
+    assert np.shares_memory(restored['score'].to_numpy(), df['score'].to_numpy())
+    assert np.shares_memory(restored['category'].array.codes, df['category'].array.codes)
+
+    standard = generate_synthetic_rows(11, 1000)
+    assert list(standard.columns) == ['id', 'value', 'category', 'score']
+    assert with_id_column(standard) is standard
+
+    print("  ✓ Compact dtype test passed")
+
+
+def test_compact_saves_memory():
+    """Test that the compact frame, id column included, uses well under half the standard footprint"""
+    from builder_utils.synthetic_data import generate_synthetic_rows, frame_memory_bytes, with_id_column
+
+    standard = frame_memory_bytes(generate_synthetic_rows(1, 100_000))
+    compact = frame_memory_bytes(with_id_column(generate_synthetic_rows(1, 100_000, compact=True)))
+
+    assert compact < 0.5 * standard, f"compact {compact} bytes vs standard {standard} bytes"
+
+    print("  ✓ Memory footprint test passed")
+
+
+def test_streamed_compact_keeps_ids():
+    """Test that streaming a compact frame writes the id index as a column"""
+    from builder_utils.synthetic_data import generate_synthetic_rows
+    from builder_utils.streaming_export import stream_export
+
+    chunks = [generate_synthetic_rows(1, 50, compact=True), generate_synthetic_rows(51, 50, compact=True)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        export = stream_export("compact", chunks, format="csv", directory=temp_dir)
+        frame = export.data.to_pandas()
+
+    assert export.data.columns == ['id', 'value', 'category', 'score']
+    assert frame['id'].tolist() == list(range(1, 101))
+
+    print("  ✓ Streamed id test passed")
+
+
+def test_compact_exports_keep_ids():
+    """Test that the example skills export the id column in compact mode"""
+    from builder_utils.run_skill import run_skill
+
+    for skill_name, parameters in [
+        ("special_tab_names", {"compact_dtypes": "true"}),
+        ("export_large_df", {"size_of_df": "50", "display_rows": "5", "compact_dtypes": "true"}),
+    ]:
+        result = run_skill(skill_name, parameters)
+        for export in result.export_data:
+            if export.name.startswith("This ia"):
+                # describe() has one column of statistics per input column
+                assert 'id' in export.data.columns, skill_name
+                continue
+            assert list(export.data.columns) == ['id', 'value', 'category', 'score'], (skill_name, export.name)
+            assert export.data['id'].between(1, 100).all()
+
+    print("  ✓ Compact export id test passed")
+
+
+def main():
+    """Run all synthetic data tests"""
+    print("=== SYNTHETIC DATA TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Compact Dtypes", test_compact_dtypes),
+        ("Memory Footprint", test_compact_saves_memory),
+        ("Streamed Ids", test_streamed_compact_keeps_ids),
+        ("Compact Export Ids", test_compact_exports_keep_ids),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All synthetic data tests passed!")
+        return 0
+    else:
+        print("⚠️ Some synthetic data tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
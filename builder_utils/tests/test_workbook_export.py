@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Workbook Export Test Suite
+Tests sheet name sanitizing and streaming multi-sheet workbook export
+"""
+
+import sys
+import os
+import re
+from html import unescape
+import tempfile
+import zipfile
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _sheet_names(path):
+    with zipfile.ZipFile(path) as archive:
+        workbook_xml = archive.read("xl/workbook.xml").decode("utf-8")
+    return [unescape(name) for name in re.findall(r'<sheet name="([^"]*)"', workbook_xml)]
+
+
+def _sheet_row_count(path, sheet_number):
+    with zipfile.ZipFile(path) as archive:
+        sheet_xml = archive.read(f"xl/worksheets/sheet{sheet_number}.xml").decode("utf-8")
+    return sheet_xml.count("<row ")
+
+
+def test_sanitize_sheet_names():
+    """Test invalid characters, length limit, reserved names and case-insensitive dedupe"""
+    from builder_utils.workbook_export import sanitize_sheet_name
+
+    assert sanitize_sheet_name("Main Data [Q1]: a/b*c?\\d") == "Main Data _Q1__ a_b_c__d"
+    assert sanitize_sheet_name("x" * 40) == "x" * 31
+    assert sanitize_sheet_name("'quoted'") == "quoted"
+    assert sanitize_sheet_name("   ") == "Sheet"
+    assert sanitize_sheet_name("History") == "History_"
+
+    used = set()
+    assert sanitize_sheet_name("Sales", used) == "Sales"
+    assert sanitize_sheet_name("SALES", used) == "SALES (2)"
+    assert sanitize_sheet_name("sales", used) == "sales (3)"
+
+    long_name = "A very long export name that will be cut"
+    first = sanitize_sheet_name(long_name, used)
+    second = sanitize_sheet_name(long_name, used)
+    assert len(first) == 31 and len(second) == 31
+    assert second.endswith(" (2)") and first.lower() != second.lower()
+
+    print("  ✓ Sheet name test passed")
+
+
+def test_write_special_tab_exports():
+    """Test that each export lands on its own, safely named sheet"""
+    from builder_utils.workbook_export import write_workbook
+    from builder_utils.synthetic_data import generate_synthetic_rows
+    from skill_framework import ExportData
+
+    df = generate_synthetic_rows(1, 100, compact=True)
+    exports = [
+        ExportData(name="Main Data @#$%^&*()_+-=[]{}|;:,.<>?/", data=df),
+        ExportData(name="This is a very long tab name that should be truncated", data=df.describe()),
+        ExportData(name="this is a very long tab name that should be truncated too", data=df.head(0)),
+        ExportData(name="Category A Only", data=df[df['category'] == 'A']),
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "exports.xlsx")
+        workbook = write_workbook(exports, path)
+
+        assert _sheet_names(path) == workbook.sheet_names
+        assert workbook.sheet_names[0] == "Main Data @#$%^&_()_+-=__{}|;_,"
+        assert workbook.sheet_names[2].endswith(" (2)")
+        assert [sheet.row_count for sheet in workbook.sheets] == [100, 8, 0, int((df['category'] == 'A').sum())]
+        # Header plus data rows; the describe() sheet keeps its statistic labels as a column
+        assert _sheet_row_count(path, 1) == 101
+        assert _sheet_row_count(path, 2) == 9
+        assert _sheet_row_count(path, 3) == 1
+
+    print("  ✓ Multi-sheet export test passed")
+
+
+def test_spills_past_row_limit():
+    """Test that exports longer than the sheet row limit continue on extra sheets"""
+    from builder_utils import workbook_export
+    from builder_utils.synthetic_data import generate_synthetic_rows
+
+    original = workbook_export.EXCEL_MAX_ROWS
+    workbook_export.EXCEL_MAX_ROWS = 101
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "exports.xlsx")
+            workbook = workbook_export.write_workbook([generate_synthetic_rows(1, 250)], path, chunk_rows=60)
+    finally:
+        workbook_export.EXCEL_MAX_ROWS = original
+
+    assert workbook.sheet_names == ["Sheet1", "Sheet1 (2)", "Sheet1 (3)"]
+    assert [sheet.row_count for sheet in workbook.sheets] == [100, 100, 50]
+
+    print("  ✓ Row limit test passed")
+
+
+def main():
+    """Run all workbook export tests"""
+    print("=== WORKBOOK EXPORT TEST SUITE ===")
+    print(f"Python version: {sys.version}")
+    print()
+
+    tests = [
+        ("Sheet Names", test_sanitize_sheet_names),
+        ("Multi-Sheet Export", test_write_special_tab_exports),
+        ("Row Limit", test_spills_past_row_limit),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            print(f"Running {test_name}...")
+            test_func()
+            results.append((True, f"✓ {test_name}: Passed"))
+            print(f"✓ {test_name}: Passed")
+        except Exception as e:
+            results.append((False, f"❌ {test_name}: Failed - {str(e)}"))
+            print(f"❌ {test_name}: Failed - {str(e)}")
+
+    print()
+    print("=== SUMMARY ===")
+
+    successful = sum(1 for success, _ in results if success)
+    total = len(results)
+
+    print(f"Successful tests: {successful}/{total}")
+
+    if successful == total:
+        print("🎉 All workbook export tests passed!")
+        return 0
+    else:
+        print("⚠️ Some workbook export tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
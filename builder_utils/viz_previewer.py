@@ -3,7 +3,6 @@ Visualization Testing Module for Claude Code
 Provides JSON validation and console error detection for skill visualizations
 """
 
-from playwright.sync_api import sync_playwright
 import json
 import time
 import subprocess
@@ -11,9 +10,13 @@ import os
 import signal
 import tempfile
 import shutil
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 from dataclasses import dataclass
-from skill_framework import SkillOutput, SkillVisualization, preview_skill
+
+# playwright and skill_framework's preview are imported where they are used, so JSON-only
+# validation does not pay for loading the browser tooling
+if TYPE_CHECKING:
+    from skill_framework import SkillOutput, SkillVisualization
 
 
 @dataclass
@@ -156,7 +159,7 @@ class VisualizationTester:
 
     def test_skill_visualization(self,
                                 skill_function,
-                                skill_output: SkillOutput,
+                                skill_output: "SkillOutput",
                                 test_name: str = None) -> ValidationResult:
         """
         Test skill visualization with full browser validation using temporary files
@@ -201,6 +204,7 @@ class VisualizationTester:
 
         # Generate preview files in temporary directory
         try:
+            from skill_framework import preview_skill
             preview_skill(skill_function, skill_output)
             print(f"✅ Preview files generated for {test_name}")
         except Exception as e:
@@ -223,6 +227,8 @@ class VisualizationTester:
         performance_metrics = {}
 
         try:
+            from playwright.sync_api import sync_playwright
+
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=self.headless)
                 page = browser.new_page()
@@ -379,7 +385,7 @@ class VisualizationTester:
 
 
 
-    def test_visualization_json(self, visualization: SkillVisualization) -> ValidationResult:
+    def test_visualization_json(self, visualization: "SkillVisualization") -> ValidationResult:
         """
         Test visualization JSON structure without browser rendering
 
@@ -632,7 +638,7 @@ def quick_json_validation(skill_file_path: str, skill_name: str, test_parameters
 
 
 # Convenience functions for easy testing
-def quick_test_visualization(skill_function, skill_output: SkillOutput, headless: bool = True) -> bool:
+def quick_test_visualization(skill_function, skill_output: "SkillOutput", headless: bool = True) -> bool:
     """
     Quick test of a skill visualization - returns True if successful
 
@@ -662,7 +668,7 @@ def quick_test_visualization(skill_function, skill_output: SkillOutput, headless
         tester.stop_preview_server()
 
 
-def test_visualization_json_only(visualization: SkillVisualization) -> bool:
+def test_visualization_json_only(visualization: "SkillVisualization") -> bool:
     """
     Test only the JSON structure of a visualization (no browser testing)
 
@@ -691,6 +697,8 @@ def check_webpage(url: str = "http://localhost:8484", headless: bool = False) ->
     """
     console_logs = []
 
+    from playwright.sync_api import sync_playwright
+
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=headless)
         page = browser.new_page()
@@ -781,7 +789,7 @@ if __name__ == "__main__":
 
 
 # Convenience functions for easy testing
-def quick_test_visualization(skill_function, skill_output: SkillOutput, headless: bool = True) -> bool:
+def quick_test_visualization(skill_function, skill_output: "SkillOutput", headless: bool = True) -> bool:
     """
     Quick test of a skill visualization - returns True if successful
 
@@ -811,7 +819,7 @@ def quick_test_visualization(skill_function, skill_output: SkillOutput, headless
         tester.stop_preview_server()
 
 
-def test_visualization_json_only(visualization: SkillVisualization) -> bool:
+def test_visualization_json_only(visualization: "SkillVisualization") -> bool:
     """
     Test only the JSON structure of a visualization (no browser testing)
 
@@ -840,6 +848,8 @@ def check_webpage(url: str = "http://localhost:8484", headless: bool = False) ->
     """
     console_logs = []
 
+    from playwright.sync_api import sync_playwright
+
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=headless)
         page = browser.new_page()
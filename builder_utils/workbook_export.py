@@ -0,0 +1,221 @@
+"""
+Workbook Export
+Stream all of a skill's exports into one multi-sheet .xlsx in constant-memory mode
+"""
+
+import argparse
+import dataclasses
+import math
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Set
+
+import pandas as pd
+
+from builder_utils.export_encoders import ENCODE_CHUNK_ROWS, iter_export_chunks
+from builder_utils.streaming_export import OwnedDirectory
+
+EXCEL_MAX_SHEET_NAME = 31
+EXCEL_MAX_ROWS = 1_048_576
+INVALID_SHEET_CHARS = '[]:*?/\\'
+RESERVED_SHEET_NAMES = {"history"}
+DEFAULT_SHEET_NAME = "Sheet"
+
+
+@dataclass
+class WorkbookSheet:
+    """One worksheet written from an export"""
+    export_name: str
+    sheet_name: str
+    row_count: int = 0
+
+
+@dataclass
+class WorkbookFile(OwnedDirectory):
+    """A multi-sheet workbook written to disk, optionally owning its temporary directory"""
+    path: str
+    sheets: List[WorkbookSheet] = field(default_factory=list)
+    owned_directory: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def size_bytes(self) -> int:
+        return os.path.getsize(self.path)
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return [sheet.sheet_name for sheet in self.sheets]
+
+
+def sanitize_sheet_name(name: str, existing: Optional[Set[str]] = None) -> str:
+    """
+    Turn an export name into a valid, unique Excel sheet name
+
+    Invalid characters ([]:*?/\\) become "_", leading/trailing apostrophes are stripped,
+    the name is cut to 31 characters and, when it collides case-insensitively with a name
+    in `existing`, a " (n)" suffix is added within the length limit. The result is added to
+    `existing` (lowercased) when a set is given.
+
+    Args:
+        name: Export name
+        existing: Lowercased names already used in the workbook
+
+    Returns:
+        Sheet name Excel will accept
+    """
+    cleaned = "".join("_" if char in INVALID_SHEET_CHARS or ord(char) < 32 else char for char in str(name))
+    cleaned = cleaned.strip().strip("'").strip() or DEFAULT_SHEET_NAME
+    if cleaned.lower() in RESERVED_SHEET_NAMES:
+        cleaned = f"{cleaned}_"
+    cleaned = cleaned[:EXCEL_MAX_SHEET_NAME].rstrip("'")
+
+    used = existing if existing is not None else set()
+    candidate = cleaned
+    suffix_number = 2
+    while candidate.lower() in used:
+        suffix = f" ({suffix_number})"
+        candidate = cleaned[:EXCEL_MAX_SHEET_NAME - len(suffix)].rstrip("'") + suffix
+        suffix_number += 1
+
+    used.add(candidate.lower())
+    return candidate
+
+
+def write_workbook(exports: Iterable, path: str, chunk_rows: int = ENCODE_CHUNK_ROWS) -> WorkbookFile:
+    """
+    Write each export to its own sheet of one workbook
+
+    Rows are streamed chunk by chunk into xlsxwriter's constant_memory mode, so only the
+    current chunk and one row buffer are held in memory regardless of sheet size. Exports
+    longer than Excel's row limit continue on extra sheets named "<sheet> (2)", etc.
+
+    Args:
+        exports: ExportData objects (DataFrame or ExportFile data), or bare DataFrames
+        path: Output .xlsx path
+        chunk_rows: Rows read per chunk
+
+    Returns:
+        WorkbookFile describing the sheets written
+    """
+    xlsxwriter = _require_xlsxwriter()
+
+    workbook = xlsxwriter.Workbook(path, {
+        "constant_memory": True,
+        "nan_inf_to_errors": True,
+        "strings_to_urls": False,
+        "strings_to_formulas": False,
+        "default_date_format": "yyyy-mm-dd hh:mm:ss",
+    })
+    used_names: Set[str] = set()
+    result = WorkbookFile(path=path)
+
+    try:
+        for position, export in enumerate(exports, 1):
+            export_name = getattr(export, "name", None) or f"{DEFAULT_SHEET_NAME}{position}"
+            base_name = sanitize_sheet_name(export_name, used_names)
+
+            worksheet = None
+            sheet = None
+            header = None
+            row_index = 0
+            for chunk in iter_export_chunks(getattr(export, "data", export), chunk_rows):
+                if header is None:
+                    header = [str(column) for column in chunk.columns]
+                for values in chunk.itertuples(index=False, name=None):
+                    if worksheet is None or row_index == EXCEL_MAX_ROWS:
+                        sheet_name = base_name if worksheet is None else sanitize_sheet_name(base_name, used_names)
+                        worksheet = workbook.add_worksheet(sheet_name)
+                        sheet = WorkbookSheet(export_name=export_name, sheet_name=sheet_name)
+                        result.sheets.append(sheet)
+                        worksheet.write_row(0, 0, header)
+                        row_index = 1
+                    worksheet.write_row(row_index, 0, [_cell_value(value) for value in values])
+                    row_index += 1
+                    sheet.row_count += 1
+
+            if worksheet is None:
+                # Empty export: still give it a sheet with its header
+                worksheet = workbook.add_worksheet(base_name)
+                result.sheets.append(WorkbookSheet(export_name=export_name, sheet_name=base_name))
+                if header:
+                    worksheet.write_row(0, 0, header)
+    finally:
+        workbook.close()
+
+    return result
+
+
+def workbook_export(name: str, exports: Iterable, directory: Optional[str] = None):
+    """
+    Write exports to one workbook and return an ExportData referencing the WorkbookFile
+
+    Without a directory the workbook goes to a new temporary directory, owned by the returned
+    WorkbookFile and deleted with it.
+    """
+    from skill_framework import ExportData
+    from builder_utils.streaming_export import _safe_file_stem
+
+    owned_directory = None
+    if directory is None:
+        directory = owned_directory = tempfile.mkdtemp(prefix="skill_export_")
+    try:
+        workbook = write_workbook(exports, os.path.join(directory, f"{_safe_file_stem(name)}.xlsx"))
+    except BaseException:
+        if owned_directory is not None:
+            shutil.rmtree(owned_directory, ignore_errors=True)
+        raise
+    if owned_directory is not None:
+        workbook = dataclasses.replace(workbook, owned_directory=owned_directory)
+    return ExportData(name=name, data=workbook)
+
+
+def _cell_value(value):
+    if value is None or value is pd.NaT or value is pd.NA or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, pd.Timestamp) and value.tzinfo is not None:
+        # Excel has no timezone support
+        return value.tz_localize(None)
+    return value
+
+
+def _require_xlsxwriter():
+    try:
+        import xlsxwriter
+    except ImportError:
+        raise ImportError("Workbook export requires xlsxwriter. Install it with: pip install -e '.[exports]'")
+    return xlsxwriter
+
+
+def main():
+    """Measure workbook size, time and peak memory for a large synthetic export"""
+    import resource
+    from skill_framework import ExportData
+    from builder_utils.synthetic_data import generate_synthetic_rows
+    from builder_utils.streaming_export import stream_export, DEFAULT_CHUNK_ROWS
+
+    parser = argparse.ArgumentParser(description='Stream a large synthetic export into a multi-sheet workbook')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows in the large sheet (default: 1,000,000)')
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        chunks = (generate_synthetic_rows(start, min(DEFAULT_CHUNK_ROWS, args.rows - start + 1), compact=True)
+                  for start in range(1, args.rows + 1, DEFAULT_CHUNK_ROWS))
+        large = stream_export("large_df", chunks, format="csv", directory=temp_dir)
+        small = ExportData(name="Category A Only", data=generate_synthetic_rows(1, 100))
+        summary = ExportData(name="Summary: large_df", data=small.data.describe())
+
+        start = time.perf_counter()
+        workbook = write_workbook([large, summary, small], os.path.join(temp_dir, "exports.xlsx"))
+        seconds = time.perf_counter() - start
+
+        print(f"📗 Workbook: {workbook.size_bytes / 1e6:.1f} MB in {seconds:.1f}s")
+        for sheet in workbook.sheets:
+            print(f"  - {sheet.sheet_name}: {sheet.row_count:,} rows (from '{sheet.export_name}')")
+        print(f"  Peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,9 @@ import json
 import pandas as pd
 from dotenv import load_dotenv
 from answer_rocket import AnswerRocketClient
-from skill_framework import skill, SkillParameter, SkillInput, SkillOutput, SkillVisualization, ExportData, ExitFromSkillException
+from skill_framework import skill, SkillParameter, SkillInput, SkillOutput, SkillVisualization, ExitFromSkillException
+from builder_utils.phase_timing import phase
+from builder_utils.shared_frame import SharedFrame, dumps_layout
 
 @skill(
     name="data_table_display",
@@ -57,7 +59,8 @@ def data_table_display(skill_input: SkillInput) -> SkillOutput:
         sort_order = skill_input.arguments.sort_order
         
         # Get data
-        data = get_table_data(dimensions, metrics, row_limit, sort_by, sort_order)
+        with phase("fetch"):
+            data = get_table_data(dimensions, metrics, row_limit, sort_by, sort_order)
         
         if data is None or data.empty:
             raise ExitFromSkillException(
@@ -65,16 +68,16 @@ def data_table_display(skill_input: SkillInput) -> SkillOutput:
                 "No data available for your selection. Please try different parameters."
             )
         
-        # Create visualization
-        visualization = create_data_table(data, dimensions, metrics, sort_by, sort_order)
-        
-        # Create export data
+        # Share one frame between the table and the export
+        shared = SharedFrame(data)
         dimensions_str = "_".join(dimensions)
         metrics_str = "_".join(metrics)
-        export_data = ExportData(
-            data=data,
-            name=f"data_table_{dimensions_str}_{metrics_str}"
-        )
+        with phase("export"):
+            export_data = shared.export(name=f"data_table_{dimensions_str}_{metrics_str}")
+        
+        # Create visualization
+        with phase("layout"):
+            visualization = create_data_table(shared, dimensions, metrics, sort_by, sort_order)
         
         # Create final prompt
         dim_display = format_list_display([format_dimension_name(d) for d in dimensions])
@@ -181,36 +184,24 @@ def get_table_data(dimensions: list, metrics: list, row_limit: int, sort_by: str
     except Exception as e:
         raise Exception(f"Database access failed: {str(e)}")
 
-def create_data_table(data: pd.DataFrame, dimensions: list, metrics: list, sort_by: str, sort_order: str) -> SkillVisualization:
+def create_data_table(shared: SharedFrame, dimensions: list, metrics: list, sort_by: str, sort_order: str) -> SkillVisualization:
     """Creates a data table visualization using dynamic-layout framework"""
     
-    # Prepare table data
+    data = shared.frame
     table_headers = data.columns.tolist()
-    table_rows = data.values.tolist()
+    metric_by_column = {format_metric_name(metric): metric for metric in metrics}
     
-    # Format table data for better display
-    formatted_rows = []
-    for row in table_rows:
-        formatted_row = []
-        for i, cell in enumerate(row):
-            column_name = table_headers[i]
-            # Check if this column represents a metric for formatting
-            original_metric = None
-            for metric in metrics:
-                if format_metric_name(metric) == column_name:
-                    original_metric = metric
-                    break
-            
-            if original_metric:
-                # Format numeric values based on metric type
-                if pd.isna(cell):
-                    formatted_row.append("N/A")
-                else:
-                    formatted_row.append(format_metric_value(cell, original_metric))
-            else:
-                # Keep dimension values as-is
-                formatted_row.append(str(cell) if not pd.isna(cell) else "N/A")
-        formatted_rows.append(formatted_row)
+    # Format table data for better display, column by column rather than cell by cell
+    formatted_columns = {}
+    for column_name in table_headers:
+        original_metric = metric_by_column.get(column_name)
+        if original_metric:
+            # Format numeric values based on metric type
+            formatted_columns[column_name] = data[column_name].map(lambda cell, metric=original_metric: format_metric_value(cell, metric))
+        else:
+            # Keep dimension values as-is
+            formatted_columns[column_name] = data[column_name].map(lambda cell: str(cell) if not pd.isna(cell) else "N/A")
+    formatted_rows = SharedFrame(pd.DataFrame(formatted_columns, index=data.index)).rows_json()
     
     # Create table configuration using correct property names
     # Use "columns" and "data" directly on DataTable component
@@ -245,7 +236,7 @@ def create_data_table(data: pd.DataFrame, dimensions: list, metrics: list, sort_
     
     return SkillVisualization(
         title="Data Table",
-        layout=json.dumps(layout)
+        layout=dumps_layout(layout)
     )
 
 def format_list_display(items: list) -> str:
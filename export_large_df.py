@@ -1,10 +1,12 @@
 import os
 import pandas as pd
-import numpy as np
 from dotenv import load_dotenv
 from answer_rocket import AnswerRocketClient
 from skill_framework import skill, SkillParameter, SkillInput, SkillOutput, SkillVisualization, ExportData, ExitFromSkillException
 from skill_framework.layouts import wire_layout
+from builder_utils.phase_timing import phase
+from builder_utils.streaming_export import stream_export, DEFAULT_CHUNK_ROWS
+from builder_utils.synthetic_data import generate_synthetic_rows, with_id_column
 
 @skill(
     name="large_df",
@@ -21,6 +23,18 @@ from skill_framework.layouts import wire_layout
             description="The number of rows to display in the artifact",
             is_multi=False,
             default_value="100"
+        ),
+        SkillParameter(
+            name="export_mode",
+            description="How to export the full dataset: in memory, or streamed in chunks to a Parquet/CSV/memory-mappable Arrow IPC file",
+            constrained_values=["in_memory", "parquet", "csv", "arrow"],
+            default_value="in_memory"
+        ),
+        SkillParameter(
+            name="compact_dtypes",
+            description="Generate the dataset with compact dtypes (uint8 values, categorical category, float32 scores, RangeIndex id)",
+            constrained_values=["true", "false"],
+            default_value="false"
         )
     ],
     
@@ -29,16 +43,40 @@ def export_large_df(skill_input: SkillInput) -> SkillOutput:
 
     size_of_df = int(skill_input.arguments.size_of_df)
     display_rows = int(skill_input.arguments.display_rows)
-    # Generate full dataset
-    df = pd.DataFrame({
-        'id': range(1, size_of_df + 1),
-        'value': np.random.randint(0, 100, size_of_df),
-        'category': np.random.choice(['A', 'B', 'C', 'D'], size_of_df),
-        'score': np.random.uniform(0, 1, size_of_df)
-    })
+    export_mode = getattr(skill_input.arguments, 'export_mode', None) or "in_memory"
+    compact = str(getattr(skill_input.arguments, 'compact_dtypes', None) or "false").lower() == "true"
+
+    if export_mode == "in_memory":
+        # Generate full dataset
+        with phase("fetch"):
+            df = generate_synthetic_rows(1, size_of_df, compact=compact)
 
-    # Take only top 100 rows for display
-    df_display = df.head(display_rows)
+        # Take only top 100 rows for display
+        df_display = with_id_column(df.head(display_rows))
+
+        # Export full dataset
+        with phase("export"):
+            export_data = ExportData(
+                name="large_df",
+                data=with_id_column(df)
+            )
+    else:
+        # Stream the dataset to a file chunk by chunk, keeping the first rows for display
+        display_chunks = []
+
+        def chunks():
+            shown = 0
+            for start in range(1, size_of_df + 1, DEFAULT_CHUNK_ROWS):
+                chunk = generate_synthetic_rows(start, min(DEFAULT_CHUNK_ROWS, size_of_df - start + 1), compact=compact)
+                if shown < display_rows:
+                    display_chunks.append(with_id_column(chunk.head(display_rows - shown)).copy())
+                    shown += len(display_chunks[-1])
+                yield chunk
+
+        # Generation is interleaved with writing, so it is all charged to export
+        with phase("export"):
+            export_data = stream_export("large_df", chunks(), format=export_mode)
+        df_display = pd.concat(display_chunks, ignore_index=True) if display_chunks else with_id_column(generate_synthetic_rows(1, 0, compact=compact))
 
     # Create layout structure for table
     table_layout = {
@@ -125,14 +163,16 @@ def export_large_df(skill_input: SkillInput) -> SkillOutput:
 
     # Prepare data for wire_layout
     table_columns = [{"name": col} for col in df_display.columns]
-    table_data = df_display.fillna('').to_numpy().tolist()
+    with phase("transform"):
+        table_data = df_display.fillna('').to_numpy().tolist()
 
     # Wire the layout with data
-    rendered_layout = wire_layout(table_layout, {
-        "title": f"Top {display_rows} Rows (Total: {len(df):,} rows)",
-        "table_columns": table_columns,
-        "table_data": table_data
-    })
+    with phase("layout"):
+        rendered_layout = wire_layout(table_layout, {
+            "title": f"Top {display_rows} Rows (Total: {size_of_df:,} rows)",
+            "table_columns": table_columns,
+            "table_data": table_data
+        })
 
     # Create table visualization
     visualization = SkillVisualization(
@@ -140,14 +180,8 @@ def export_large_df(skill_input: SkillInput) -> SkillOutput:
         layout=rendered_layout
     )
 
-    # Export full dataset
-    export_data = ExportData(
-        name="large_df",
-        data=df
-    )
-
     return SkillOutput(
         visualizations=[visualization],
         export_data=[export_data],
-        final_prompt=f"Here are the top {display_rows} rows from the dataset (total rows: {len(df):,})"
+        final_prompt=f"Here are the top {display_rows} rows from the dataset (total rows: {size_of_df:,})"
     )
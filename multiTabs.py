@@ -1,4 +1,5 @@
-from skill_framework import skill, SkillParameter, SkillInput, SkillOutput,SkillVisualization
+from skill_framework import skill, SkillInput, SkillOutput
+from builder_utils.layout_templates import LayoutTemplate
 import json
 LAYOUT = """
 [
@@ -780,6 +781,10 @@ LAYOUT = """
     }
 ]
 """
+
+# Parsed and serialized once per process; elements shared between tabs are stored once
+TAB_TEMPLATES = LayoutTemplate.from_variants(json.loads(LAYOUT), minify=True)
+
 @skill(
     name="multiTabs",
     description="An example skill",
@@ -788,10 +793,8 @@ LAYOUT = """
 )
 def multiTabs(parameters: SkillInput) -> SkillOutput:
     viz = []
-    viz_list = json.loads(LAYOUT)
 
-    for tab in viz_list:
-        table = SkillVisualization(title="tab",
-        layout=json.dumps(tab))
+    for template in TAB_TEMPLATES:
+        table = template.visualization(title="tab", lazy=True)
         viz.append(table)
     return SkillOutput(visualizations=viz)
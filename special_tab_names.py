@@ -1,15 +1,20 @@
 import os
-import pandas as pd
-import numpy as np
 from dotenv import load_dotenv
 from answer_rocket import AnswerRocketClient
 from skill_framework import skill, SkillParameter, SkillInput, SkillOutput, SkillVisualization, ExportData, ExitFromSkillException
 from skill_framework.layouts import wire_layout
+from builder_utils.synthetic_data import generate_synthetic_rows, with_id_column
 
 @skill(
     name="special_tab_names",
     description="A skill to export a dataframe with special tab names",
     parameters=[
+        SkillParameter(
+            name="compact_dtypes",
+            description="Generate the dataset with compact dtypes (uint8 values, categorical category, float32 scores, RangeIndex id)",
+            constrained_values=["true", "false"],
+            default_value="false"
+        )
     ],
     
 )
@@ -17,16 +22,12 @@ def special_tab_names(skill_input: SkillInput) -> SkillOutput:
 
     size_of_df = 100
     display_rows = 100
+    compact = str(getattr(skill_input.arguments, 'compact_dtypes', None) or "false").lower() == "true"
     # Generate full dataset
-    df = pd.DataFrame({
-        'id': range(1, size_of_df + 1),
-        'value': np.random.randint(0, 100, size_of_df),
-        'category': np.random.choice(['A', 'B', 'C', 'D'], size_of_df),
-        'score': np.random.uniform(0, 1, size_of_df)
-    })
+    df = generate_synthetic_rows(1, size_of_df, compact=compact)
 
     # Take only top 100 rows for display
-    df_display = df.head(display_rows)
+    df_display = with_id_column(df.head(display_rows))
 
     # Create layout structure for table
     table_layout = {
@@ -128,7 +129,8 @@ def special_tab_names(skill_input: SkillInput) -> SkillOutput:
         layout=rendered_layout
     )
 
-    # Create dictionary of exports with custom sheet names
+    # Create dictionary of exports with custom sheet names; compact frames keep id in the index
+    df = with_id_column(df)
     export_data_dict = {
         "Main Data @#$%^&*()_+-=[]{}|;:,.<>?/": df,
         "This ia a very long tab name that should be truncated.This ia a very long tab name that should be truncated": df.describe(),
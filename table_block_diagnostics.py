@@ -1,7 +1,8 @@
 import json
 import pandas as pd
-from skill_framework import skill, SkillInput, SkillOutput, SkillVisualization, ExportData
+from skill_framework import skill, SkillInput, SkillOutput, ExportData
 from skill_framework.layouts import wire_layout
+from builder_utils.layout_minifier import minified_visualization
 
 VIZ_LAYOUT = """
 [
@@ -462,7 +463,7 @@ def table_block_diagnostics(skill_input: SkillInput) -> SkillOutput:
     })
 
     # Create visualization
-    visualization = SkillVisualization(
+    visualization = minified_visualization(
         title="Table Block Diagnostics",
         layout=rendered_layout
     )
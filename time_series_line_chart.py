@@ -4,6 +4,7 @@ import pandas as pd
 from dotenv import load_dotenv
 from answer_rocket import AnswerRocketClient
 from skill_framework import skill, SkillParameter, SkillInput, SkillOutput, SkillVisualization, ExportData, ExitFromSkillException
+from builder_utils.phase_timing import phase
 
 @skill(
     name="time_series_line_chart",
@@ -42,7 +43,8 @@ def time_series_line_chart(skill_input: SkillInput) -> SkillOutput:
         time_period = skill_input.arguments.time_period
         
         # Get data
-        data = get_time_series_data(dimension, metric, dimension_limit, time_period)
+        with phase("fetch"):
+            data = get_time_series_data(dimension, metric, dimension_limit, time_period)
         
         if data is None or data.empty:
             raise ExitFromSkillException(
@@ -51,7 +53,8 @@ def time_series_line_chart(skill_input: SkillInput) -> SkillOutput:
             )
         
         # Create visualization
-        visualization = create_line_chart(data, dimension, metric, time_period)
+        with phase("layout"):
+            visualization = create_line_chart(data, dimension, metric, time_period)
         
         # Create export data
         export_data = ExportData(
@@ -146,10 +149,11 @@ def get_time_series_data(dimension: str, metric: str, dimension_limit: int, time
             raise Exception("No data returned from time series query")
             
         # Pivot the data to have time periods as rows and dimension values as columns
-        pivoted_data = result.df.pivot(index=time_column_alias, columns=dimension, values=f'{metric}_value').fillna(0)
-        
-        # Reset index to make time_period a column
-        pivoted_data = pivoted_data.reset_index()
+        with phase("transform"):
+            pivoted_data = result.df.pivot(index=time_column_alias, columns=dimension, values=f'{metric}_value').fillna(0)
+            
+            # Reset index to make time_period a column
+            pivoted_data = pivoted_data.reset_index()
         
         return pivoted_data
         
@@ -244,9 +248,12 @@ def create_line_chart(data: pd.DataFrame, dimension: str, metric: str, time_peri
         ]
     }
     
+    with phase("serialize"):
+        layout_json = json.dumps(layout)
+    
     return SkillVisualization(
         title="Time Series Line Chart",
-        layout=json.dumps(layout)
+        layout=layout_json
     )
 
 def format_dimension_name(dimension: str) -> str:
@@ -1,4 +1,7 @@
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from skill_framework import skill, SkillOutput, SkillParameter, SkillInput, SkillVisualization
 from skill_framework.layouts import wire_layout
 
@@ -21,6 +24,11 @@ DEFAULT_LAYOUT = """{
 }
 """
 
+# Saved layouts are sent to this skill repeatedly; keep the most recent ones wired
+LAYOUT_CACHE_SIZE = 32
+_wired_layouts = OrderedDict()
+_wired_layouts_lock = threading.Lock()
+
 @skill(
     name="Viz Renderer",
      llm_name="viz_renderer_always_run",
@@ -45,26 +53,16 @@ def viz_parameter_render(skill_input: SkillInput) -> SkillOutput:
     viz_layout = skill_input.arguments.viz_layout
     viz_ppt_layout = skill_input.arguments.viz_ppt_layout
 
-    # Determine which layouts to use based on what's provided
-    if viz_layout and viz_ppt_layout:
-        # Both provided - each uses its own
-        layout = json.loads(viz_layout)
-        ppt_layout = json.loads(viz_ppt_layout)
-    elif viz_layout:
-        # Only viz provided - use for both
-        layout = json.loads(viz_layout)
-        ppt_layout = layout
-    elif viz_ppt_layout:
-        # Only ppt provided - use for both
-        ppt_layout = json.loads(viz_ppt_layout)
-        layout = ppt_layout
-    else:
-        # Neither provided - use default for both
-        layout = json.loads(DEFAULT_LAYOUT)
-        ppt_layout = layout
+    # Missing layouts fall back to the other one, then to the default
+    layout_source = viz_layout or viz_ppt_layout or DEFAULT_LAYOUT
+    ppt_layout_source = viz_ppt_layout or viz_layout or DEFAULT_LAYOUT
 
-    layout_json_string = wire_layout(layout, input_values={})
-    ppt_layout_json_string = wire_layout(ppt_layout, input_values={})
+    layout_json_string = get_wired_layout(layout_source)
+    if ppt_layout_source is layout_source or ppt_layout_source == layout_source:
+        # Same layout for both outputs - parse and wire it once
+        ppt_layout_json_string = layout_json_string
+    else:
+        ppt_layout_json_string = get_wired_layout(ppt_layout_source)
 
     # Wrap in SkillVisualization
     visualization = SkillVisualization(
@@ -77,3 +75,22 @@ def viz_parameter_render(skill_input: SkillInput) -> SkillOutput:
         visualizations=[visualization],
         ppt_slides=[ppt_layout_json_string]
     )
+
+def get_wired_layout(layout_string: str) -> str:
+    """Parses and wires a layout string, reusing the result for layouts seen recently"""
+    key = hashlib.sha256(layout_string.encode("utf-8")).hexdigest()
+
+    with _wired_layouts_lock:
+        if key in _wired_layouts:
+            _wired_layouts.move_to_end(key)
+            return _wired_layouts[key]
+
+    wired = wire_layout(json.loads(layout_string), input_values={})
+
+    with _wired_layouts_lock:
+        _wired_layouts[key] = wired
+        _wired_layouts.move_to_end(key)
+        while len(_wired_layouts) > LAYOUT_CACHE_SIZE:
+            _wired_layouts.popitem(last=False)
+
+    return wired